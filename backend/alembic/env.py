@@ -52,6 +52,9 @@ from slices.illnesses.domain.models.illness_model import PatientIllness
 # Import dashboard-specific models only
 from slices.dashboard.domain.models.medical_models import DashboardActivityLog
 
+# Import domain event outbox
+from shared.events.outbox import OutboxEvent
+
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
@@ -0,0 +1,93 @@
+"""add patient medical composite indexes
+
+Revision ID: b3f1c2d4e5a6
+Revises:
+Create Date: 2026-10-19 10:00:00.000000
+
+Composite indexes for the patient-scoped medical tables, matching the
+filters and sort orders used by the medical, emergency and dashboard
+repositories. Built CONCURRENTLY so writes are not blocked on large tables.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c2d4e5a6'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns) - must stay in sync with the models' __table_args__
+INDEXES = [
+    (
+        "ix_patient_medications_patient_id_created_at",
+        "patient_medications",
+        ["patient_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    (
+        "ix_patient_medications_patient_id_is_active_created_at",
+        "patient_medications",
+        ["patient_id", "is_active", sa.text("created_at DESC")],
+    ),
+    (
+        "ix_patient_allergies_patient_id_created_at",
+        "patient_allergies",
+        ["patient_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    (
+        "ix_patient_allergies_patient_id_severity_level",
+        "patient_allergies",
+        ["patient_id", "severity_level"],
+    ),
+    (
+        "ix_patient_surgeries_patient_id_created_at",
+        "patient_surgeries",
+        ["patient_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    (
+        "ix_patient_surgeries_patient_id_surgery_date",
+        "patient_surgeries",
+        ["patient_id", sa.text("surgery_date DESC")],
+    ),
+    (
+        "ix_patient_illnesses_patient_id_created_at",
+        "patient_illnesses",
+        ["patient_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    ),
+    (
+        "ix_patient_illnesses_patient_id_is_chronic_diagnosis_date",
+        "patient_illnesses",
+        ["patient_id", "is_chronic", sa.text("diagnosis_date DESC")],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,65 @@
+"""add dashboard activity feed indexes
+
+Revision ID: d6b3e4f5a7c9
+Revises: c4a2d3e6f7b8
+Create Date: 2026-10-19 14:00:00.000000
+
+dashboard_activity_logs becomes the patient activity feed: entries are
+written in batches from domain events and read in keyset pages per user.
+Adds the event_id column (unique, so re-delivered events are skipped) and
+the (user_id, created_at DESC, id DESC) index the feed pages scan. Indexes
+are built CONCURRENTLY so writes are not blocked.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6b3e4f5a7c9'
+down_revision: Union[str, Sequence[str], None] = 'c4a2d3e6f7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('dashboard_activity_logs', sa.Column('event_id', sa.String(length=36), nullable=True))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_dashboard_activity_logs_user_id_created_at',
+            'dashboard_activity_logs',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_dashboard_activity_logs_event_id',
+            'dashboard_activity_logs',
+            ['event_id'],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_dashboard_activity_logs_event_id',
+            table_name='dashboard_activity_logs',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_dashboard_activity_logs_user_id_created_at',
+            table_name='dashboard_activity_logs',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('dashboard_activity_logs', 'event_id')
@@ -0,0 +1,82 @@
+"""add delta sync change tracking
+
+Revision ID: e7c4f5a6b8d1
+Revises: d6b3e4f5a7c9
+Create Date: 2026-10-19 16:00:00.000000
+
+/api/sync returns only what changed since a client's last sync. Adds the
+medical_change_seq sequence and a change_seq column, defaulting to it, on
+patients and the four medical tables; existing rows are numbered once. Deleted
+medical rows are kept as sync_tombstones. The (patient_id, change_seq)
+indexes are built CONCURRENTLY so writes are not blocked.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7c4f5a6b8d1'
+down_revision: Union[str, Sequence[str], None] = 'd6b3e4f5a7c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MEDICAL_TABLES = ['patient_medications', 'patient_allergies', 'patient_surgeries', 'patient_illnesses']
+TRACKED_TABLES = ['patients'] + MEDICAL_TABLES
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE SEQUENCE IF NOT EXISTS medical_change_seq")
+
+    for table in TRACKED_TABLES:
+        # Nullable and without a default first, so adding the column does not rewrite the table
+        op.add_column(table, sa.Column('change_seq', sa.BigInteger(), nullable=True))
+        op.alter_column(table, 'change_seq', server_default=sa.text("nextval('medical_change_seq')"))
+        op.execute(f"UPDATE {table} SET change_seq = nextval('medical_change_seq') WHERE change_seq IS NULL")
+
+    op.create_table(
+        'sync_tombstones',
+        sa.Column('resource_type', sa.String(length=30), nullable=False),
+        sa.Column('resource_id', sa.BigInteger(), nullable=False),
+        sa.Column('patient_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('change_seq', sa.BigInteger(), server_default=sa.text("nextval('medical_change_seq')"), nullable=True),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('resource_type', 'resource_id'),
+    )
+    op.create_index('ix_sync_tombstones_patient_id_change_seq', 'sync_tombstones', ['patient_id', 'change_seq'])
+    op.create_index('ix_sync_tombstones_deleted_at', 'sync_tombstones', ['deleted_at'])
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table in MEDICAL_TABLES:
+            op.create_index(
+                f'ix_{table}_patient_id_change_seq',
+                table,
+                ['patient_id', 'change_seq'],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in MEDICAL_TABLES:
+            op.drop_index(
+                f'ix_{table}_patient_id_change_seq',
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+    op.drop_index('ix_sync_tombstones_deleted_at', table_name='sync_tombstones')
+    op.drop_index('ix_sync_tombstones_patient_id_change_seq', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+
+    for table in TRACKED_TABLES:
+        op.drop_column(table, 'change_seq')
+    op.execute("DROP SEQUENCE IF EXISTS medical_change_seq")
@@ -0,0 +1,36 @@
+"""add patient emergency_version
+
+Revision ID: f8d5a6b7c9e2
+Revises: e7c4f5a6b8d1
+Create Date: 2026-10-19 18:00:00.000000
+
+Per-field-group version for the patient row: emergency_version only moves
+when a column shown on emergency views changes (EMERGENCY_FIELDS), so their
+caches survive edits to the rest of the profile. A constant default makes
+ADD COLUMN a catalog-only change on PostgreSQL 11+, without a table rewrite.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8d5a6b7c9e2'
+down_revision: Union[str, Sequence[str], None] = 'e7c4f5a6b8d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'patients',
+        sa.Column('emergency_version', sa.Integer(), nullable=False, server_default='0')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('patients', 'emergency_version')
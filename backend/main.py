@@ -3,13 +3,18 @@ VitalGo Backend API
 Main FastAPI application entry point
 """
 
+import asyncio
 import os
+import uuid
+from contextlib import asynccontextmanager
+from functools import partial
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 # Import routers
 from slices.signup.infrastructure.api import patient_signup_router, validation_router
-from slices.auth.infrastructure.api import auth_router
+from slices.auth.infrastructure.api import auth_router, jwks_router
 from slices.dashboard.infrastructure.api.dashboard_router import router as dashboard_router
 from slices.medications.infrastructure.api.medications_router import router as medications_router
 from slices.allergies.infrastructure.api.allergies_router import router as allergies_router
@@ -19,12 +24,172 @@ from slices.profile.infrastructure.api.profile_endpoints import router as profil
 from slices.qr.infrastructure.api.qr_simple_router import router as qr_router
 from slices.emergency_access.infrastructure.api.emergency_access_router import router as emergency_access_router
 from slices.countries.infrastructure.api.countries_router import router as countries_router
+from slices.bootstrap.infrastructure.api.bootstrap_router import router as bootstrap_router
+from slices.sync.infrastructure.api.sync_router import router as sync_router
+
+from shared.config.settings import settings
+from shared.database import SessionLocal, critical_engine, engine, get_pool_metrics
+from shared.database.replicas import get_read_your_writes_store
+from shared.events import MedicalRecordChanged, get_event_bus
+from shared.events.jobs import purge_outbox_job, relay_outbox_job
+from shared.middleware import CompressionMiddleware, LoadSheddingMiddleware, get_load_shedding_metrics
+from shared.scheduler import Scheduler, get_scheduler, reset_scheduler
+from shared.utils.json_response import FastJSONResponse
+from shared.warmup import WarmupStep, get_readiness, prime_pool, reset_readiness, run_warmup, warm_imports
+from slices.auth.infrastructure.jobs import cleanup_expired_sessions_job
+from slices.auth.infrastructure.security.jwt_service_singleton import get_jwt_service
+from slices.countries.infrastructure.database.country_repository import CountryRepository
+from slices.dashboard.infrastructure.activity_buffer import record_medical_activity
+from slices.dashboard.infrastructure.jobs import flush_activity_log_job
+from slices.emergency.infrastructure.jobs import flush_qr_access_counts_job
+from slices.signup.infrastructure.persistence import SQLAlchemyDocumentTypeRepository
+from slices.sync.infrastructure.jobs import purge_tombstones_job
+
+
+def register_background_jobs(scheduler: Scheduler) -> None:
+    """Maintenance jobs; singleton jobs run only on the leader worker"""
+    scheduler.add_periodic(
+        "auth.cleanup_expired_sessions",
+        cleanup_expired_sessions_job,
+        interval=settings.SESSION_CLEANUP_INTERVAL_SECONDS,
+        delay=60,
+        jitter=30,
+        singleton=True,
+    )
+    scheduler.add_periodic(
+        "events.relay_outbox",
+        relay_outbox_job,
+        interval=settings.OUTBOX_RELAY_INTERVAL_SECONDS,
+        jitter=5,
+        singleton=True,
+    )
+    # Not a singleton: each worker flushes the scan counts it buffered
+    scheduler.add_periodic(
+        "emergency.flush_qr_access_counts",
+        flush_qr_access_counts_job,
+        interval=settings.QR_ACCESS_FLUSH_INTERVAL_SECONDS,
+        jitter=2,
+    )
+    # Not a singleton either: each worker writes the activity entries it buffered
+    scheduler.add_periodic(
+        "dashboard.flush_activity_log",
+        flush_activity_log_job,
+        interval=settings.ACTIVITY_FLUSH_INTERVAL_SECONDS,
+        jitter=1,
+    )
+    scheduler.add_periodic(
+        "events.purge_outbox",
+        partial(purge_outbox_job, settings.OUTBOX_RETENTION_DAYS),
+        interval=24 * 3600,
+        jitter=600,
+        singleton=True,
+    )
+    scheduler.add_periodic(
+        "sync.purge_tombstones",
+        partial(purge_tombstones_job, settings.SYNC_TOMBSTONE_RETENTION_DAYS),
+        interval=24 * 3600,
+        jitter=600,
+        singleton=True,
+    )
+
+
+def preload_catalogs() -> None:
+    """Load the country and document type catalogs into the cache"""
+    db = SessionLocal()
+    try:
+        CountryRepository(db).get_all_active()
+        SQLAlchemyDocumentTypeRepository(db).get_all_active()
+    finally:
+        db.close()
+
+
+def warm_jwt() -> None:
+    """One sign/verify round trip so key loading and jose internals are initialised"""
+    jwt_service = get_jwt_service()
+    token = jwt_service.create_access_token(str(uuid.uuid4()), "warmup@vitalgo.local")["access_token"]
+    jwt_service.verify_token(token)
+
+
+def warm_qr_logo() -> None:
+    """Decode the QR logo once (qrcode and Pillow are optional dependencies)"""
+    from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
+
+    QRGeneratorService.preload_logo()
+
+
+def build_warmup_steps() -> list:
+    """Steps that must finish before this worker reports ready"""
+    steps = [
+        WarmupStep("db_pool", partial(prime_pool, engine, settings.WARMUP_POOL_CONNECTIONS)),
+        WarmupStep("db_critical_pool", partial(prime_pool, critical_engine, settings.DB_CRITICAL_POOL_SIZE)),
+        WarmupStep("catalogs", preload_catalogs),
+        WarmupStep("jwt", warm_jwt),
+        WarmupStep("imports", partial(warm_imports, ["qrcode", "PIL.Image", "PIL.ImageDraw"]), required=False),
+        WarmupStep("qr_logo", warm_qr_logo, required=False),
+    ]
+
+    # With replicas, read-your-writes needs its Redis before the worker takes traffic
+    read_your_writes_store = get_read_your_writes_store()
+    if read_your_writes_store is not None:
+        steps.append(WarmupStep("read_your_writes_store", read_your_writes_store.ping))
+
+    return steps
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up and start background jobs with the worker; stop them on shutdown"""
+    readiness = get_readiness()
+    warmup_task = None
+    if settings.WARMUP_ENABLED:
+        warmup_task = asyncio.create_task(
+            run_warmup(build_warmup_steps(), readiness, settings.WARMUP_RETRY_SECONDS)
+        )
+    else:
+        readiness.mark_ready()
+
+    scheduler = get_scheduler()
+    if settings.SCHEDULER_ENABLED:
+        register_background_jobs(scheduler)
+        await scheduler.start()
+    app.state.scheduler = scheduler
+
+    yield
+
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await scheduler.stop()
+    reset_scheduler()
+    # Write out scan counts and activity entries buffered since the last periodic flush
+    try:
+        await asyncio.to_thread(flush_qr_access_counts_job)
+    except Exception as e:
+        print(f"⚠️ Could not flush QR access counts on shutdown: {type(e).__name__}")
+    try:
+        await asyncio.to_thread(flush_activity_log_job)
+    except Exception as e:
+        print(f"⚠️ Could not flush activity feed entries on shutdown: {type(e).__name__}")
+    reset_readiness()
+
 
 # Create FastAPI app instance
 app = FastAPI(
     title="VitalGo API",
     description="VitalGo Backend API following Hexagonal Architecture",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
+)
+
+# Shed low-priority requests when this worker is saturated (added before CORS so
+# CORS wraps it and 503 responses still carry CORS headers)
+app.add_middleware(
+    LoadSheddingMiddleware,
+    route_priorities=settings.LOAD_SHED_ROUTE_PRIORITIES,
+    in_flight_limits=settings.LOAD_SHED_IN_FLIGHT_LIMITS,
+    loop_lag_limits_ms=settings.LOAD_SHED_LOOP_LAG_LIMITS_MS,
+    retry_after_seconds=settings.LOAD_SHED_RETRY_AFTER_SECONDS,
+    enabled=settings.LOAD_SHED_ENABLED,
 )
 
 # Configure CORS - SECURITY HARDENED
@@ -32,14 +197,25 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(","),  # Configurable origins
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],  # Specific methods only
-    allow_headers=["Content-Type", "Authorization", "Accept"],  # Specific headers only
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],  # Specific methods only
+    allow_headers=["Content-Type", "Authorization", "Accept", "If-None-Match"],  # Specific headers only
+    expose_headers=["Retry-After"],  # Lets clients honour load-shedding 503s
+)
+
+# Compress responses (outermost, so CORS and load-shedding responses are covered too)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    enabled=settings.COMPRESSION_ENABLED,
 )
 
 # Register routers
 app.include_router(patient_signup_router)
 app.include_router(validation_router)
 app.include_router(auth_router)
+app.include_router(jwks_router)
 app.include_router(dashboard_router)
 app.include_router(medications_router)
 app.include_router(allergies_router)
@@ -49,6 +225,11 @@ app.include_router(profile_router)
 app.include_router(qr_router)
 app.include_router(emergency_access_router)
 app.include_router(countries_router)
+app.include_router(bootstrap_router)
+app.include_router(sync_router)
+
+# Buffer activity feed entries for medical record changes (written by dashboard.flush_activity_log)
+get_event_bus().subscribe(MedicalRecordChanged, record_medical_activity)
 
 
 @app.get("/")
@@ -67,6 +248,33 @@ async def health_check():
     }
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 200 once warm-up has finished on every expected worker, 503 before"""
+    readiness = get_readiness()
+    content = readiness.to_dict()
+    status_code = 200 if content["ready"] else 503
+    return JSONResponse(status_code=status_code, content=content)
+
+
+@app.get("/health/db-pools")
+async def db_pool_health():
+    """Connection pool occupancy and checkout wait metrics per pool class"""
+    return get_pool_metrics()
+
+
+@app.get("/health/load")
+async def load_health():
+    """Admission control state: in-flight requests, event-loop lag, admitted/shed counts per class"""
+    return get_load_shedding_metrics()
+
+
+@app.get("/health/scheduler")
+async def scheduler_health():
+    """Background job status: leader flag plus per-job runs, failures, duration and lag"""
+    return get_scheduler().metrics()
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -0,0 +1,169 @@
+"""
+Query plan audit for the patient-scoped medical repositories
+
+Runs the real repository read methods against a seeded database, captures
+every SQL statement they emit and runs EXPLAIN on each one. Sequential scans
+are reported and make the script exit with status 1.
+
+By default enable_seqscan is turned off for the audit transaction, so on a
+small seed database a sequential scan only shows up when no usable index
+exists. Use --planner-defaults on a production-sized copy to see the plans
+the planner would really choose.
+
+Usage (from backend/):
+    python scripts/audit_query_plans.py [--patient-id UUID] [--planner-defaults]
+"""
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, func, text
+from sqlalchemy.orm import Session
+
+import main  # noqa: F401  registers every model on Base.metadata
+from shared.database.database import SessionLocal, engine
+from shared.utils.pagination import encode_cursor
+from slices.medications.domain.models.medication_model import PatientMedication
+from slices.medications.infrastructure.repositories.medication_repository import MedicationRepository
+from slices.allergies.infrastructure.repositories.allergy_repository import AllergyRepository
+from slices.surgeries.infrastructure.repositories.surgery_repository import SurgeryRepository
+from slices.illnesses.infrastructure.repositories.illness_repository import IllnessRepository
+from slices.emergency_access.infrastructure.repositories.emergency_data_repository import EmergencyDataRepository
+from slices.dashboard.infrastructure.repositories.dashboard_repository import DashboardRepository
+from slices.signup.domain.models.patient_model import Patient
+from slices.sync.infrastructure.repositories.sync_repository import SyncRepository
+
+
+def build_audit_calls(db: Session, patient_id: UUID) -> List[Tuple[str, Callable[[], Any]]]:
+    """Repository read methods to audit, labelled for the report"""
+    medications = MedicationRepository(db)
+    allergies = AllergyRepository(db)
+    surgeries = SurgeryRepository(db)
+    illnesses = IllnessRepository(db)
+    emergency = EmergencyDataRepository(db)
+    dashboard = DashboardRepository(db)
+    sync = SyncRepository(db)
+    user_id = db.query(Patient.user_id).filter(Patient.id == patient_id).scalar()
+
+    # Cursor far in the future so the keyset predicate is part of the plan
+    cursor = encode_cursor(datetime.now(timezone.utc), 2 ** 62)
+    # Sync token position: only rows changed since now
+    since_seq, changed_after = 2 ** 62, datetime.now(timezone.utc)
+
+    return [
+        ("medications.get_medications", lambda: medications.get_medications(patient_id)),
+        ("medications.get_medications_page", lambda: medications.get_medications_page(patient_id, 50, cursor)),
+        ("allergies.get_allergies_by_patient_id", lambda: allergies.get_allergies_by_patient_id(patient_id)),
+        ("allergies.get_allergies_page_by_patient_id", lambda: allergies.get_allergies_page_by_patient_id(patient_id, 50, cursor)),
+        ("surgeries.get_surgeries_by_patient_id", lambda: surgeries.get_surgeries_by_patient_id(patient_id)),
+        ("surgeries.get_surgeries_page_by_patient_id", lambda: surgeries.get_surgeries_page_by_patient_id(patient_id, 50, cursor)),
+        ("illnesses.get_illnesses_by_patient_id", lambda: illnesses.get_illnesses_by_patient_id(patient_id)),
+        ("illnesses.get_illnesses_page_by_patient_id", lambda: illnesses.get_illnesses_page_by_patient_id(patient_id, 50, cursor)),
+        ("emergency.get_patient_medications", lambda: emergency.get_patient_medications(patient_id)),
+        ("emergency.get_patient_allergies", lambda: emergency.get_patient_allergies(patient_id)),
+        ("emergency.get_patient_surgeries", lambda: emergency.get_patient_surgeries(patient_id)),
+        ("emergency.get_patient_illnesses", lambda: emergency.get_patient_illnesses(patient_id)),
+        ("dashboard.get_dashboard_stats", lambda: dashboard.get_dashboard_stats(patient_id)),
+        ("dashboard.get_medical_data_summary", lambda: dashboard.get_medical_data_summary(patient_id)),
+        ("dashboard.get_recent_medications", lambda: dashboard.get_recent_medications(patient_id)),
+        ("dashboard.get_recent_activities", lambda: dashboard.get_recent_activities(user_id)),
+        ("dashboard.get_activity_page", lambda: dashboard.get_activity_page(user_id, 50, cursor)),
+        ("sync.get_changed_records(medications)", lambda: sync.get_changed_records("medications", patient_id, since_seq, changed_after)),
+        ("sync.get_changed_records(allergies)", lambda: sync.get_changed_records("allergies", patient_id, since_seq, changed_after)),
+        ("sync.get_changed_records(surgeries)", lambda: sync.get_changed_records("surgeries", patient_id, since_seq, changed_after)),
+        ("sync.get_changed_records(illnesses)", lambda: sync.get_changed_records("illnesses", patient_id, since_seq, changed_after)),
+        ("sync.get_deleted_records", lambda: sync.get_deleted_records(patient_id, since_seq, changed_after)),
+    ]
+
+
+def find_seq_scans(plan: Dict[str, Any]) -> List[str]:
+    """Collect the relations read by a Seq Scan anywhere in a JSON plan tree"""
+    tables = []
+    if plan.get("Node Type") == "Seq Scan":
+        tables.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", []):
+        tables.extend(find_seq_scans(child))
+    return tables
+
+
+async def capture_statements(db: Session, patient_id: UUID) -> List[Tuple[str, str, Any]]:
+    """Run every audited repository call and record the SQL it executes"""
+    captured: List[Tuple[str, str, Any]] = []
+    current_label = {"value": ""}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((current_label["value"], statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        for label, call in build_audit_calls(db, patient_id):
+            current_label["value"] = label
+            result = call()
+            if asyncio.iscoroutine(result):
+                await result
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return captured
+
+
+def pick_patient_id(db: Session) -> Optional[UUID]:
+    """Use the patient with the most medications so plans see real data"""
+    row = db.query(PatientMedication.patient_id, func.count(PatientMedication.id).label("total")).group_by(
+        PatientMedication.patient_id
+    ).order_by(text("total DESC")).first()
+    return row.patient_id if row else None
+
+
+def main_audit(patient_id: Optional[UUID], planner_defaults: bool) -> int:
+    """Run the audit and print a report, returning the process exit code"""
+    db = SessionLocal()
+    try:
+        patient_id = patient_id or pick_patient_id(db)
+        if patient_id is None:
+            print("No seeded patient medications found, seed the database first")
+            return 2
+
+        if not planner_defaults:
+            db.execute(text("SET LOCAL enable_seqscan = off"))
+
+        statements = asyncio.run(capture_statements(db, patient_id))
+
+        print(f"Auditing {len(statements)} statements for patient {patient_id}")
+        print(f"enable_seqscan: {'default' if planner_defaults else 'off'}\n")
+
+        failures = 0
+        connection = db.connection()
+        for label, statement, parameters in statements:
+            plan = connection.exec_driver_sql(
+                "EXPLAIN (FORMAT JSON) " + statement, parameters
+            ).scalar()[0]["Plan"]
+            seq_scans = find_seq_scans(plan)
+
+            if seq_scans:
+                failures += 1
+                print(f"SEQ SCAN  {label}: {', '.join(sorted(set(seq_scans)))}")
+            else:
+                print(f"ok        {label}")
+
+        print(f"\n{failures} statement(s) with sequential scans")
+        return 1 if failures else 0
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--patient-id", type=UUID, help="Patient to audit (default: most medications)")
+    parser.add_argument("--planner-defaults", action="store_true", help="Keep enable_seqscan on")
+    args = parser.parse_args()
+
+    sys.exit(main_audit(args.patient_id, args.planner_defaults))
@@ -0,0 +1,172 @@
+"""
+Size and latency benchmark for offline emergency QR payloads
+
+For each synthetic patient profile (minimal, typical, heavy, oversized) it
+reports:
+- payload size: raw body, deflated body, signed binary, QR text characters
+- whether lists had to be truncated to fit --max-chars
+- median encode (sign) and decode (verify) time
+- the QR version needed at error correction M, when qrcode is installed
+
+Signs with a throwaway ES256 key unless --keys-dir points at a key
+directory laid out like QR_OFFLINE_KEYS_DIR. Exits 1 if a profile cannot
+fit the limit at all.
+
+Usage (from backend/):
+    python scripts/benchmark_offline_qr.py [--runs 200] [--max-chars 970] [--keys-dir DIR]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from slices.qr.infrastructure.services.offline_payload import (  # noqa: E402
+    DEFAULT_MAX_CHARS,
+    FIELD_SEPARATOR,
+    ITEM_SEPARATOR,
+    OfflineEmergencyPayload,
+    OfflinePayloadSigner,
+    base45_decode,
+    decode_offline_payload,
+    encode_offline_payload,
+)
+
+MEDICATIONS = [
+    "Metformina 850 mg", "Losartán 50 mg", "Atorvastatina 20 mg", "Levotiroxina 100 mcg",
+    "Warfarina 5 mg", "Insulina glargina 20 UI", "Salbutamol inhalador 100 mcg",
+    "Enalapril 10 mg", "Omeprazol 20 mg", "Ácido acetilsalicílico 100 mg",
+    "Carbamazepina 200 mg", "Furosemida 40 mg",
+]
+ALLERGIES = ["Penicilina", "Sulfonamidas", "Látex", "Ibuprofeno", "Mariscos", "Yodo (medio de contraste)"]
+CONDITIONS = [
+    "Diabetes mellitus tipo 2", "Hipertensión arterial", "Hipotiroidismo", "Fibrilación auricular",
+    "Epilepsia", "Asma", "Enfermedad renal crónica estadio 3", "Insuficiencia cardiaca",
+]
+
+
+def build_profiles() -> Dict[str, OfflineEmergencyPayload]:
+    def items(names: List[str], count: int) -> List[str]:
+        # Past the sample list, vary the text so repeats do not compress away
+        return [names[i % len(names)] + (f" ({i // len(names) + 1})" if i >= len(names) else "")
+                for i in range(count)]
+
+    def payload(allergies: int, medications: int, conditions: int) -> OfflineEmergencyPayload:
+        return OfflineEmergencyPayload(
+            qr_code=uuid.uuid4(),
+            issued_at=datetime.now(timezone.utc),
+            full_name="María Fernanda Rodríguez Gómez",
+            blood_type="O+",
+            emergency_contact="Carlos Rodríguez - +57 300 123 4567",
+            critical_allergies=items(ALLERGIES, allergies),
+            current_medications=items(MEDICATIONS, medications),
+            chronic_conditions=items(CONDITIONS, conditions),
+        )
+
+    return {
+        "minimal": payload(0, 0, 0),
+        "typical": payload(2, 3, 2),
+        "heavy": payload(6, 12, 8),
+        "oversized": payload(18, 36, 24),
+    }
+
+
+def load_signer(keys_dir: str) -> OfflinePayloadSigner:
+    if keys_dir:
+        from slices.auth.infrastructure.security.jwt_key_ring import JWTKeyRing
+
+        key_ring = JWTKeyRing("ES256", keys_dir)
+        return OfflinePayloadSigner(key_ring.algorithm, key_ring.signing_key, key_ring.active_kid)
+
+    from ecdsa import NIST256p, SigningKey
+
+    private_pem = SigningKey.generate(curve=NIST256p).to_pem().decode("ascii")
+    return OfflinePayloadSigner("ES256", private_pem, "bench")
+
+
+def median_ms(func: Callable[[], object], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def qr_version(text: str) -> str:
+    try:
+        import qrcode
+    except ImportError:
+        return "n/a"
+
+    qr = qrcode.QRCode(version=None, error_correction=qrcode.constants.ERROR_CORRECT_M)
+    qr.add_data(text)
+    qr.make(fit=True)
+    return str(qr.version)
+
+
+def body_sizes(payload: OfflineEmergencyPayload) -> Tuple[int, int]:
+    body = FIELD_SEPARATOR.join((
+        payload.full_name, payload.blood_type, payload.emergency_contact,
+        ITEM_SEPARATOR.join(payload.critical_allergies),
+        ITEM_SEPARATOR.join(payload.current_medications),
+        ITEM_SEPARATOR.join(payload.chronic_conditions),
+    )).encode("utf-8")
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    return len(body), len(compressor.compress(body) + compressor.flush())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark offline emergency QR payloads")
+    parser.add_argument("--runs", type=int, default=200, help="Timed iterations per profile")
+    parser.add_argument("--max-chars", type=int, default=DEFAULT_MAX_CHARS,
+                        help="QR text budget (default: version 20, error correction M)")
+    parser.add_argument("--keys-dir", default="", help="Sign with the active key from this directory")
+    args = parser.parse_args()
+
+    signer = load_signer(args.keys_dir)
+    verification_keys = {signer.kid: signer.public_jwk()}
+
+    print(f"{'profile':<10} {'items':>5} {'body':>6} {'deflated':>8} {'binary':>6} {'chars':>5} "
+          f"{'trunc':>5} {'encode ms':>9} {'verify ms':>9} {'decode ms':>9} {'QR v(M)':>7}")
+
+    failed: List[str] = []
+    for name, payload in build_profiles().items():
+        items = len(payload.critical_allergies) + len(payload.current_medications) + len(payload.chronic_conditions)
+        try:
+            text, encoded = encode_offline_payload(payload, signer, args.max_chars)
+        except ValueError as e:
+            failed.append(name)
+            print(f"{name:<10} {items:>5}  FAIL: {e}")
+            continue
+
+        decoded = decode_offline_payload(text, verification_keys)
+        assert decoded.blood_type == encoded.blood_type and decoded.current_medications == encoded.current_medications
+
+        raw_body, deflated_body = body_sizes(encoded)
+        binary = len(base45_decode(text[4:]))
+        encode_ms = median_ms(lambda: encode_offline_payload(payload, signer, args.max_chars), args.runs)
+        verify_ms = median_ms(lambda: decode_offline_payload(text, verification_keys), args.runs)
+        decode_ms = median_ms(lambda: decode_offline_payload(text, verify=False), args.runs)
+
+        print(f"{name:<10} {items:>5} {raw_body:>6} {deflated_body:>8} {binary:>6} {len(text):>5} "
+              f"{'yes' if encoded.truncated else 'no':>5} {encode_ms:>9.2f} {verify_ms:>9.2f} {decode_ms:>9.3f} "
+              f"{qr_version(text):>7}")
+
+    if failed:
+        print(f"FAIL: profiles that cannot fit {args.max_chars} characters: {', '.join(failed)}")
+        return 1
+
+    print(f"OK: every profile fits in {args.max_chars} characters")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+ORM entities vs column-projected read models for the emergency view
+
+Seeds one heavy patient and times the emergency load both ways, each request
+on a fresh session as in the API:
+- orm:   the previous queries, full Patient (joinedload document_type) and
+         full medical entities
+- lean:  EmergencyDataRepository, explicit columns into slotted read models
+
+For each path it reports requests/second, rows/second and the peak memory
+allocated during one request (tracemalloc), and checks that both paths see
+the same values.
+
+Defaults to an in-memory SQLite database so it runs anywhere; point
+--database-url at a scratch PostgreSQL database for production numbers (the
+tables are created and dropped there).
+
+Usage (from backend/):
+    python scripts/benchmark_read_models.py [--runs 300] [--rows 50] [--database-url sqlite://]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session, joinedload, sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import main  # noqa: E402,F401  (registers every model on Base)
+from shared.database import Base  # noqa: E402
+from slices.allergies.domain.models.allergy_model import PatientAllergy  # noqa: E402
+from slices.emergency_access.infrastructure.repositories.emergency_data_repository import (  # noqa: E402
+    EmergencyDataRepository,
+)
+from slices.illnesses.domain.models.illness_model import PatientIllness  # noqa: E402
+from slices.medications.domain.models.medication_model import PatientMedication  # noqa: E402
+from slices.signup.domain.models.document_type_model import DocumentType  # noqa: E402
+from slices.signup.domain.models.patient_model import Patient  # noqa: E402
+from slices.signup.domain.models.user_model import User  # noqa: E402
+from slices.surgeries.domain.models.surgery_model import PatientSurgery  # noqa: E402
+
+TABLES = [
+    User.__table__, DocumentType.__table__, Patient.__table__,
+    PatientMedication.__table__, PatientAllergy.__table__,
+    PatientSurgery.__table__, PatientIllness.__table__,
+]
+
+
+def seed(db: Session, rows: int) -> uuid.UUID:
+    """One patient with `rows` entries in each medical table; returns its QR code"""
+    now = datetime.now(timezone.utc)
+    user = User(id=uuid.uuid4(), email="benchmark@example.com", password_hash="x")
+    document_type = DocumentType(id=1, code="CC", name="Cédula de ciudadanía")
+    patient = Patient(
+        id=uuid.uuid4(), user_id=user.id, qr_code=uuid.uuid4(),
+        first_name="María Fernanda", last_name="Rodríguez Gómez",
+        document_type_id=1, document_number="1020304050",
+        phone_international="+57 3001234567", birth_date=date(1958, 3, 14),
+        accept_terms=True, accept_terms_date=now, accept_policy=True, accept_policy_date=now,
+        biological_sex="F", gender="femenino", blood_type="O+", eps="Sura",
+        occupation="Docente", residence_address="Calle 10 # 43-12",
+        residence_country="CO", residence_city="Medellín",
+        emergency_contact_name="Carlos Rodríguez", emergency_contact_relationship="hijo",
+        emergency_contact_phone="+573001234567", is_pregnant=False, pregnancies_count=2,
+    )
+    db.add_all([user, document_type, patient])
+
+    for i in range(rows):
+        # Explicit ids: BIGINT primary keys do not autoincrement on SQLite
+        db.add_all([
+            PatientMedication(
+                id=i + 1, patient_id=patient.id, medication_name=f"Medicamento {i}",
+                dosage="50 mg", frequency="cada 12 horas", start_date=date(2024, 1, 1),
+                is_active=True, notes="Tomar con comida", prescribed_by="Dra. Pérez",
+                created_at=now - timedelta(days=i),
+            ),
+            PatientAllergy(
+                id=i + 1, patient_id=patient.id, allergen=f"Alérgeno {i}",
+                severity_level=("leve", "moderada", "severa", "critica")[i % 4],
+                reaction_description="Urticaria y dificultad respiratoria",
+            ),
+            PatientSurgery(
+                id=i + 1, patient_id=patient.id, procedure_name=f"Cirugía {i}",
+                surgery_date=date(2000, 1, 1) + timedelta(days=30 * i),
+                hospital_name="Hospital Pablo Tobón Uribe", surgeon_name="Dr. Gómez",
+                notes="Sin novedad",
+            ),
+            PatientIllness(
+                id=i + 1, patient_id=patient.id, illness_name=f"Enfermedad {i}",
+                diagnosis_date=date(2010, 1, 1) + timedelta(days=30 * i),
+                status="activa", is_chronic=i % 2 == 0, cie10_code="E11",
+                diagnosed_by="Dra. Pérez", notes="Control anual",
+            ),
+        ])
+    db.commit()
+    return patient.qr_code
+
+
+def orm_load(db: Session, qr_code: uuid.UUID) -> Tuple[Any, ...]:
+    """The emergency load as it was before the read models"""
+    patient = db.query(Patient).filter(
+        Patient.qr_code == qr_code
+    ).options(joinedload(Patient.document_type)).first()
+    medications = db.query(PatientMedication).filter(
+        PatientMedication.patient_id == patient.id,
+        PatientMedication.is_active == True
+    ).order_by(PatientMedication.created_at.desc()).all()
+    allergies = db.query(PatientAllergy).filter(
+        PatientAllergy.patient_id == patient.id
+    ).order_by(PatientAllergy.severity_level.desc()).all()
+    surgeries = db.query(PatientSurgery).filter(
+        PatientSurgery.patient_id == patient.id
+    ).order_by(PatientSurgery.surgery_date.desc()).all()
+    illnesses = db.query(PatientIllness).filter(
+        PatientIllness.patient_id == patient.id
+    ).order_by(PatientIllness.is_chronic.desc(), PatientIllness.diagnosis_date.desc()).all()
+    return patient, medications, allergies, surgeries, illnesses
+
+
+def lean_load(db: Session, qr_code: uuid.UUID) -> Tuple[Any, ...]:
+    """The emergency load through EmergencyDataRepository"""
+    repository = EmergencyDataRepository(db)
+    patient = repository.get_patient_by_qr_code(qr_code)
+    return (
+        patient,
+        repository.get_patient_medications(patient.id),
+        repository.get_patient_allergies(patient.id),
+        repository.get_patient_surgeries(patient.id),
+        repository.get_patient_illnesses(patient.id),
+    )
+
+
+def row_count(result: Tuple[Any, ...]) -> int:
+    return 1 + sum(len(rows) for rows in result[1:])
+
+
+def fingerprint(result: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Values the emergency view reads, comparable across both paths"""
+    patient, medications, allergies, surgeries, illnesses = result
+    return (
+        patient.full_name,
+        [(m.medication_name, m.dosage) for m in medications],
+        [(a.allergen, a.severity_level) for a in allergies],
+        [(s.procedure_name, s.surgery_date) for s in surgeries],
+        [(i.illness_name, i.is_chronic) for i in illnesses],
+    )
+
+
+def measure(sessions: sessionmaker, load: Callable, qr_code: uuid.UUID, runs: int) -> Dict[str, float]:
+    def request() -> Tuple[Any, ...]:
+        with sessions() as db:
+            return load(db, qr_code)
+
+    rows = row_count(request())
+
+    tracemalloc.start()
+    request()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(runs):
+        request()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "rows": rows,
+        "requests_per_s": runs / elapsed,
+        "rows_per_s": rows * runs / elapsed,
+        "peak_kib": peak / 1024,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ORM entities vs projected read models")
+    parser.add_argument("--runs", type=int, default=300, help="Timed requests per path")
+    parser.add_argument("--rows", type=int, default=50, help="Rows per medical table")
+    parser.add_argument("--database-url", default="sqlite://", help="Scratch database (tables are dropped)")
+    args = parser.parse_args()
+
+    if args.database_url.startswith("sqlite"):
+        engine = create_engine(
+            args.database_url, connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+    else:
+        engine = create_engine(args.database_url)
+
+    Base.metadata.create_all(engine, tables=TABLES)
+    sessions = sessionmaker(bind=engine)
+    try:
+        with sessions() as db:
+            qr_code = seed(db, args.rows)
+
+        with sessions() as db:
+            if fingerprint(orm_load(db, qr_code)) != fingerprint(lean_load(db, qr_code)):
+                raise SystemExit("read models and ORM entities returned different data")
+
+        orm = measure(sessions, orm_load, qr_code, args.runs)
+        lean = measure(sessions, lean_load, qr_code, args.runs)
+    finally:
+        Base.metadata.drop_all(engine, tables=TABLES)
+
+    print(f"database: {engine.dialect.name}, {orm['rows']:.0f} rows per request")
+    print(f"{'path':<6} {'req/s':>8} {'rows/s':>10} {'peak KiB/req':>13}")
+    for name, result in (("orm", orm), ("lean", lean)):
+        print(f"{name:<6} {result['requests_per_s']:>8.0f} {result['rows_per_s']:>10.0f} "
+              f"{result['peak_kib']:>13.1f}")
+    print(f"speedup {lean['rows_per_s'] / orm['rows_per_s']:.1f}x, "
+          f"memory {orm['peak_kib'] / lean['peak_kib']:.1f}x less")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
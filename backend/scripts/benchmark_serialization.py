@@ -0,0 +1,221 @@
+"""
+Per-response serialization cost for the largest API payloads
+
+For each payload it times three ways of producing the response body:
+- default:  FastAPI's response_model path (dump, re-validate, encode) + JSONResponse
+- orjson:   the same path rendered by FastJSONResponse (the app default)
+- trusted:  trusted_response(), pydantic-core straight to JSON bytes
+
+Payloads: the emergency view of a heavy patient, the extended profile, the
+dashboard (built from its domain entity, as the router does) and a list of
+200 medications. Each trusted body is checked to decode to the same JSON as
+the default body.
+
+Usage (from backend/):
+    python scripts/benchmark_serialization.py [--runs 2000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timezone
+from typing import Any, Awaitable, Callable, List, Tuple
+from uuid import uuid4
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from shared.utils import json_response  # noqa: E402
+from shared.utils.json_response import FastJSONResponse, trusted_response  # noqa: E402
+from slices.dashboard.application.dto.dashboard_dto import DashboardDataDTO  # noqa: E402
+from slices.dashboard.domain.entities.dashboard_stats import (  # noqa: E402
+    DashboardData,
+    DashboardStats,
+    MedicalDataSummary,
+)
+from slices.emergency_access.application.dto.emergency_data_dto import (  # noqa: E402
+    EmergencyAllergyDTO,
+    EmergencyDataResponseDTO,
+    EmergencyIllnessDTO,
+    EmergencyMedicationDTO,
+    EmergencySurgeryDTO,
+)
+from slices.medications.application.dto.medication_dto import PatientMedicationDTO  # noqa: E402
+from slices.profile.application.dto.profile_completion_dto import ExtendedPatientProfileDTO  # noqa: E402
+
+
+def emergency_payload() -> EmergencyDataResponseDTO:
+    return EmergencyDataResponseDTO(
+        full_name="María Fernanda Rodríguez Gómez",
+        document_type="CC",
+        document_number="1020304050",
+        birth_date=date(1958, 3, 14),
+        biological_sex="F",
+        gender="femenino",
+        blood_type="O+",
+        eps="Sura",
+        occupation="Docente",
+        residence_address="Calle 10 # 43-12",
+        residence_country="CO",
+        residence_city="Medellín",
+        emergency_contact_name="Carlos Rodríguez",
+        emergency_contact_relationship="hijo",
+        emergency_contact_phone="+573001234567",
+        medications=[
+            EmergencyMedicationDTO(medication_name=f"Medicamento {i}", dosage="50 mg", frequency="cada 12 horas",
+                                   is_active=True, notes="Tomar con comida", prescribed_by="Dra. Pérez")
+            for i in range(20)
+        ],
+        allergies=[
+            EmergencyAllergyDTO(allergen=f"Alérgeno {i}", severity_level="severa",
+                                reaction_description="Urticaria y dificultad respiratoria")
+            for i in range(10)
+        ],
+        surgeries=[
+            EmergencySurgeryDTO(procedure_name=f"Cirugía {i}", surgery_date=date(2010 + i, 5, 1),
+                                hospital_name="Hospital Pablo Tobón Uribe")
+            for i in range(5)
+        ],
+        illnesses=[
+            EmergencyIllnessDTO(illness_name=f"Enfermedad {i}", diagnosis_date=date(2015, 1, 1 + i),
+                                status="activa", is_chronic=True, cie10_code="E11")
+            for i in range(8)
+        ],
+        is_pregnant=False,
+        pregnancies_count=2,
+        births_count=2,
+    )
+
+
+def profile_payload() -> ExtendedPatientProfileDTO:
+    return ExtendedPatientProfileDTO(
+        biological_sex="F", gender="femenino",
+        birth_country="CO", birth_department="Antioquia", birth_city="Medellín",
+        residence_address="Calle 10 # 43-12", residence_country="CO",
+        residence_department="Antioquia", residence_city="Medellín",
+        eps="Sura", occupation="Docente", additional_insurance="Póliza de salud",
+        complementary_plan="Plan complementario", blood_type="O+",
+        emergency_contact_name="Carlos Rodríguez", emergency_contact_relationship="hijo",
+        emergency_contact_phone="+573001234567", emergency_contact_country_code="CO",
+        emergency_contact_dial_code="+57", emergency_contact_phone_number="3001234567",
+        emergency_contact_phone_alt="+573107654321", emergency_contact_country_code_alt="CO",
+        emergency_contact_dial_code_alt="+57", emergency_contact_phone_number_alt="3107654321",
+        is_pregnant=False, last_menstruation_date=date(2024, 1, 1), menstrual_status="regular",
+        pregnancies_count=2, births_count=2, cesareans_count=0, abortions_count=0,
+        contraceptive_method="ninguno", organ_donor_preference="si", height=165, weight=62,
+    )
+
+
+def dashboard_payload() -> DashboardData:
+    now = datetime.now(timezone.utc)
+    return DashboardData(
+        user_id=str(uuid4()),
+        patient_id=str(uuid4()),
+        full_name="María Fernanda Rodríguez Gómez",
+        email="maria@example.com",
+        stats=DashboardStats(
+            active_medications=12, active_allergies=6,
+            allergies_by_severity={"leve": 2, "moderada": 2, "severa": 1, "critica": 1},
+            active_surgeries=3, active_illnesses=4, chronic_illnesses=2,
+            profile_completeness=87.5, last_login=now, last_updated=now,
+        ),
+        medical_summary=MedicalDataSummary(
+            medications_count=12, allergies_count=6, surgeries_count=3, illnesses_count=4,
+            has_critical_allergies=True, has_chronic_illnesses=True, recent_activity=now,
+        ),
+    )
+
+
+def medications_payload(count: int = 200) -> List[PatientMedicationDTO]:
+    now = datetime.now(timezone.utc)
+    patient_id = uuid4()
+    return [
+        PatientMedicationDTO(
+            id=i, patient_id=patient_id, medication_name=f"Medicamento {i}", dosage="50 mg",
+            frequency="cada 12 horas", start_date=date(2024, 1, 1), is_active=i % 3 != 0,
+            notes="Tomar con comida", prescribed_by="Dra. Pérez", created_at=now, updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+async def best_us(func: Callable[[], Awaitable[bytes]], runs: int, blocks: int = 5) -> float:
+    """Mean time per call of the fastest block, which filters out scheduler noise"""
+    per_block = max(1, runs // blocks)
+    await func()
+    timings = []
+    for _ in range(blocks):
+        started = time.perf_counter()
+        for _ in range(per_block):
+            await func()
+        timings.append((time.perf_counter() - started) * 1_000_000 / per_block)
+    return min(timings)
+
+
+async def measure(name: str, response_model: Any, content: Any, trusted: Callable[[], Any],
+                  runs: int) -> Tuple[str, int, float, float, float]:
+    field = create_model_field(name=f"Response_{name}", type_=response_model, mode="serialization")
+
+    async def default_path(response_class=JSONResponse) -> bytes:
+        encoded = await serialize_response(field=field, response_content=content)
+        return response_class(encoded).body
+
+    async def orjson_path() -> bytes:
+        return await default_path(FastJSONResponse)
+
+    async def trusted_path() -> bytes:
+        return trusted_response(trusted()).body
+
+    default_body = await default_path()
+    if json.loads(await trusted_path()) != json.loads(default_body):
+        raise SystemExit(f"{name}: trusted body differs from the response_model body")
+
+    return (
+        name,
+        len(default_body),
+        await best_us(default_path, runs),
+        await best_us(orjson_path, runs),
+        await best_us(trusted_path, runs),
+    )
+
+
+async def run(runs: int) -> None:
+    emergency = emergency_payload()
+    profile = profile_payload()
+    dashboard = dashboard_payload()
+    medications = medications_payload()
+
+    results = [
+        await measure("emergency", EmergencyDataResponseDTO, emergency, lambda: emergency, runs),
+        await measure("profile", ExtendedPatientProfileDTO, profile, lambda: profile, runs),
+        await measure(
+            "dashboard", DashboardDataDTO, dashboard,
+            lambda: DashboardDataDTO.model_validate(dashboard, from_attributes=True), runs
+        ),
+        await measure("medications", List[PatientMedicationDTO], medications, lambda: medications, runs),
+    ]
+
+    print(f"orjson: {'installed' if json_response.orjson is not None else 'not installed (stdlib fallback)'}")
+    print(f"{'payload':<12} {'bytes':>7} {'default us':>10} {'orjson us':>10} {'trusted us':>10} {'speedup':>8}")
+    for name, size, default_us, orjson_us, trusted_us in results:
+        print(f"{name:<12} {size:>7} {default_us:>10.1f} {orjson_us:>10.1f} {trusted_us:>10.1f} "
+              f"{default_us / trusted_us:>7.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark response serialization paths")
+    parser.add_argument("--runs", type=int, default=2000, help="Timed iterations per payload and path")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.runs))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Import-time report and boot budget check for the API
+
+Imports main in fresh interpreters with -X importtime and reports:
+- the slowest modules, by cumulative and by self time
+- self time per top-level package
+
+The script exits with status 1 in two cases:
+- the median cumulative time of `import main` exceeds the budget
+- a module that must stay lazy (qrcode, Pillow) was imported at boot
+
+Every uvicorn worker pays this cost, so run the script in CI and before
+adding a dependency to a module that main imports.
+
+Usage (from backend/):
+    python scripts/import_time_report.py [--runs 3] [--top 25] [--budget-ms 5000] [--forbid qrcode,PIL]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Measured under -X importtime, which adds overhead over a plain import. The
+# tree sits around 3.4-4.0 s: roughly 2.2 s is FastAPI, SQLAlchemy, Pydantic
+# and the drivers; about 1 s is slices building DTO schemas and routes at
+# class/decorator time; main's include_router calls rebuild every route
+# (~0.3 s). The budget leaves headroom for machine variance and catches
+# regressions such as an eager heavy import
+DEFAULT_BUDGET_MS = 5000
+# Heavy optional dependencies that must only load on first use
+DEFAULT_FORBIDDEN = "qrcode,PIL"
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def run_import(target: str) -> List[ImportRecord]:
+    """Import target in a fresh interpreter and parse the -X importtime output"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr[-2000:])
+        raise SystemExit(f"import {target} failed with exit code {completed.returncode}")
+
+    records = []
+    for line in completed.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return records
+
+
+def total_ms(records: List[ImportRecord], target: str) -> float:
+    for record in reversed(records):
+        if record.module == target:
+            return record.cumulative_us / 1000
+    return sum(record.self_us for record in records) / 1000
+
+
+def print_report(records: List[ImportRecord], top: int) -> None:
+    print(f"\nTop {top} modules by cumulative time:")
+    for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top]:
+        print(f"  {record.cumulative_us / 1000:9.1f} ms  {record.module}")
+
+    print(f"\nTop {top} modules by self time:")
+    for record in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]:
+        print(f"  {record.self_us / 1000:9.1f} ms  {record.module}")
+
+    by_package: Dict[str, int] = defaultdict(int)
+    for record in records:
+        by_package[record.module.split(".")[0]] += record.self_us
+
+    print(f"\nTop {top} packages by self time:")
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {self_us / 1000:9.1f} ms  {package}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Report import cost of the API entry point")
+    parser.add_argument("--target", default="main", help="Module to import (default: main)")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters to measure")
+    parser.add_argument("--top", type=int, default=25, help="Rows per section")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Fail if the median import time exceeds this; 0 disables")
+    parser.add_argument("--forbid", default=DEFAULT_FORBIDDEN,
+                        help="Comma-separated top-level packages that must not be imported")
+    args = parser.parse_args()
+
+    runs = [run_import(args.target) for _ in range(max(args.runs, 1))]
+    timings = [total_ms(records, args.target) for records in runs]
+    median_ms = statistics.median(timings)
+
+    # Report the run closest to the median
+    representative = min(zip(timings, runs), key=lambda item: abs(item[0] - median_ms))[1]
+    print_report(representative, args.top)
+
+    print(f"\nimport {args.target}: median {median_ms:.1f} ms over {len(timings)} run(s) "
+          f"({', '.join(f'{t:.0f}' for t in timings)} ms)")
+
+    failed = False
+
+    forbidden = {name.strip() for name in args.forbid.split(",") if name.strip()}
+    loaded = sorted({r.module.split(".")[0] for r in representative} & forbidden)
+    if loaded:
+        failed = True
+        print(f"FAIL: modules that must load lazily were imported at boot: {', '.join(loaded)}")
+
+    if args.budget_ms and median_ms > args.budget_ms:
+        failed = True
+        print(f"FAIL: import {args.target} took {median_ms:.1f} ms, budget is {args.budget_ms:.0f} ms")
+
+    if not failed:
+        print("OK: within import budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
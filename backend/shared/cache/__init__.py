@@ -0,0 +1,89 @@
+"""
+Shared caching subsystem
+
+    from shared.cache import cached, invalidates, get_cache
+
+get_cache() returns the process-wide TwoTierCache built from settings:
+an LRU per worker, plus Redis as the shared tier and invalidation bus when
+CACHE_REDIS_ENABLED is set.
+"""
+import logging
+from typing import Optional
+
+from shared.cache.backends import CacheBackend, InMemoryBackend, RedisBackend
+from shared.cache.decorators import cached, invalidates
+from shared.cache.lru import MISSING, LRUCache
+from shared.cache.two_tier import TwoTierCache
+
+logger = logging.getLogger(__name__)
+
+# Global instance storage
+_cache_instance: Optional[TwoTierCache] = None
+
+
+def _build_cache() -> TwoTierCache:
+    from shared.config.settings import settings
+
+    l1 = LRUCache(max_entries=settings.CACHE_L1_MAX_ENTRIES)
+    options = dict(
+        namespace=settings.CACHE_NAMESPACE,
+        l1_ttl_seconds=settings.CACHE_L1_TTL_SECONDS,
+        enabled=settings.CACHE_ENABLED,
+    )
+
+    if settings.CACHE_ENABLED and settings.CACHE_REDIS_ENABLED:
+        try:
+            return TwoTierCache(l1, RedisBackend(settings.REDIS_URL), **options)
+        except Exception as e:
+            # Subscribing connects eagerly; without Redis fall back to L1 only
+            logger.warning("Redis cache tier unavailable, using in-process cache only: %s", e)
+
+    return TwoTierCache(l1, None, **options)
+
+
+def get_cache() -> TwoTierCache:
+    """
+    Get or create the singleton cache instance
+
+    Returns:
+        TwoTierCache: The process-wide cache
+    """
+    global _cache_instance
+
+    if _cache_instance is None:
+        _cache_instance = _build_cache()
+
+    return _cache_instance
+
+
+def set_cache(cache: Optional[TwoTierCache]) -> None:
+    """
+    Replace the singleton (tests install a TwoTierCache over InMemoryBackend)
+    """
+    global _cache_instance
+    _cache_instance = cache
+
+
+def reset_cache() -> None:
+    """
+    Close and drop the singleton instance (useful for testing)
+    """
+    global _cache_instance
+    if _cache_instance is not None:
+        _cache_instance.close()
+    _cache_instance = None
+
+
+__all__ = [
+    "CacheBackend",
+    "InMemoryBackend",
+    "RedisBackend",
+    "LRUCache",
+    "MISSING",
+    "TwoTierCache",
+    "cached",
+    "invalidates",
+    "get_cache",
+    "set_cache",
+    "reset_cache",
+]
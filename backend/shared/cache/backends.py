@@ -0,0 +1,183 @@
+"""
+Shared (L2) cache backends with invalidation broadcast
+
+RedisBackend is used in deployments with several uvicorn workers.
+InMemoryBackend is a process-local stand-in with the same contract, used when
+Redis is disabled and in tests: every cache sharing one instance receives the
+invalidation broadcasts, like workers sharing one Redis.
+"""
+import json
+import logging
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+InvalidationHandler = Callable[[Dict[str, Any]], None]
+
+
+class CacheBackend(ABC):
+    """Port for the shared cache tier and its invalidation channel"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a serialized value, or None on a miss"""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a serialized value for ttl seconds"""
+        pass
+
+    @abstractmethod
+    def delete(self, keys: List[str]) -> None:
+        """Delete keys"""
+        pass
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """Delete every key starting with prefix"""
+        pass
+
+    @abstractmethod
+    def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        """Broadcast an invalidation message to every subscriber"""
+        pass
+
+    @abstractmethod
+    def subscribe(self, channel: str, handler: InvalidationHandler) -> None:
+        """Call handler for every message published on channel"""
+        pass
+
+    def close(self) -> None:
+        """Release connections and listener threads"""
+        pass
+
+
+class InMemoryBackend(CacheBackend):
+    """Process-local backend with the same semantics as RedisBackend"""
+
+    def __init__(self):
+        self._values: Dict[str, Tuple[float, bytes]] = {}
+        self._subscribers: Dict[str, List[InvalidationHandler]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._values[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, keys: List[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._values.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._values if key.startswith(prefix)]:
+                del self._values[key]
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        # Round-trip through JSON so handlers see exactly what Redis would deliver
+        payload = json.loads(json.dumps(message))
+        for handler in list(self._subscribers.get(channel, [])):
+            handler(payload)
+
+    def subscribe(self, channel: str, handler: InvalidationHandler) -> None:
+        self._subscribers.setdefault(channel, []).append(handler)
+
+
+class RedisBackend(CacheBackend):
+    """Redis backend; invalidations travel over Redis pub/sub"""
+
+    def __init__(self, redis_url: str, socket_timeout: float = 0.5):
+        # Imported here so redis stays optional when the L2 tier is disabled
+        import redis
+
+        self._redis = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+        )
+        self._pubsub = None
+        self._listener = None
+        self._handlers: Dict[str, List[InvalidationHandler]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._redis.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._redis.set(key, value, px=max(int(ttl * 1000), 1))
+
+    def delete(self, keys: List[str]) -> None:
+        if keys:
+            self._redis.delete(*keys)
+
+    def delete_prefix(self, prefix: str) -> None:
+        batch = []
+        for key in self._redis.scan_iter(match=f"{prefix}*", count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                self._redis.delete(*batch)
+                batch = []
+        if batch:
+            self._redis.delete(*batch)
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        self._redis.publish(channel, json.dumps(message))
+
+    def subscribe(self, channel: str, handler: InvalidationHandler) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+
+        if self._pubsub is None:
+            self._pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+
+        self._pubsub.subscribe(**{channel: self._dispatch})
+
+        if self._listener is None:
+            # Daemon thread so a blocked listener never holds up worker shutdown
+            self._listener = self._pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        channel = message["channel"]
+        channel = channel.decode("utf-8") if isinstance(channel, bytes) else channel
+        try:
+            payload = json.loads(message["data"])
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed cache invalidation message on %s", channel)
+            return
+
+        for handler in self._handlers.get(channel, []):
+            handler(payload)
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+        self._redis.close()
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a value for the shared tier (Redis is an internal, trusted store)"""
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize a value read from the shared tier"""
+    return pickle.loads(data)
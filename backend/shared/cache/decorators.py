@@ -0,0 +1,119 @@
+"""
+Caching decorators for repository and service methods
+
+Keys are explicit str.format templates over the call arguments:
+
+    @cached("countries:code:{code}", ttl=3600)
+    def get_by_code(self, code: str) -> Optional[Country]: ...
+
+    @invalidates("patients:{patient_id}:allergies")
+    async def create(self, patient_id: UUID, ...): ...
+
+Both work on sync and async callables. Cached values must be picklable when
+the Redis tier is enabled; cache domain objects or DTOs, never ORM instances
+bound to a session.
+"""
+import functools
+import inspect
+from typing import Any, Callable, Dict
+
+from shared.cache.lru import MISSING
+
+
+def _format_keys(templates, signature: inspect.Signature, args, kwargs) -> list:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments: Dict[str, Any] = dict(bound.arguments)
+    return [template.format(**arguments) for template in templates]
+
+
+def cached(key_template: str, ttl: float, cache_none: bool = False) -> Callable:
+    """
+    Cache the return value under a key built from the call arguments
+
+    Args:
+        key_template: str.format template, e.g. "countries:code:{code}"
+        ttl: Seconds the shared tier keeps the value (L1 is capped lower)
+        cache_none: Also cache None results (useful for negative lookups)
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                from shared.cache import get_cache
+
+                cache = get_cache()
+                key = _format_keys([key_template], signature, args, kwargs)[0]
+                value = cache.get(key)
+                if value is not MISSING:
+                    return value
+
+                value = await func(*args, **kwargs)
+                if value is not None or cache_none:
+                    cache.set(key, value, ttl)
+                return value
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            from shared.cache import get_cache
+
+            cache = get_cache()
+            key = _format_keys([key_template], signature, args, kwargs)[0]
+            value = cache.get(key)
+            if value is not MISSING:
+                return value
+
+            value = func(*args, **kwargs)
+            if value is not None or cache_none:
+                cache.set(key, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*key_templates: str, prefix: bool = False) -> Callable:
+    """
+    Invalidate keys after the wrapped call returns successfully
+
+    Args:
+        key_templates: str.format templates over the call arguments
+        prefix: Treat each formatted key as a prefix
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def invalidate(args, kwargs) -> None:
+            from shared.cache import get_cache
+
+            cache = get_cache()
+            keys = _format_keys(key_templates, signature, args, kwargs)
+            if prefix:
+                for key in keys:
+                    cache.invalidate_prefix(key)
+            else:
+                cache.invalidate(*keys)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                invalidate(args, kwargs)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            invalidate(args, kwargs)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,145 @@
+"""
+Two-tier cache: per-process LRU (L1) in front of an optional shared backend (L2)
+
+Every write path invalidates explicitly: the key is dropped from the local L1 and
+from L2, and an invalidation message is broadcast so the other workers drop
+their L1 copy as well. L1 entries never outlive CACHE_L1_TTL_SECONDS, which
+bounds staleness if a broadcast is lost (e.g. while Redis is restarting).
+"""
+import logging
+import uuid
+from typing import Any, Dict, Optional
+
+from shared.cache.backends import CacheBackend, dumps, loads
+from shared.cache.lru import MISSING, LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class TwoTierCache:
+    """Read-through cache with cross-worker invalidation"""
+
+    def __init__(
+        self,
+        l1: LRUCache,
+        backend: Optional[CacheBackend] = None,
+        namespace: str = "vitalgo",
+        l1_ttl_seconds: float = 30,
+        enabled: bool = True
+    ):
+        """
+        Args:
+            l1: Process-local LRU
+            backend: Shared tier; None runs L1 only
+            namespace: Prefix for shared keys and the invalidation channel
+            l1_ttl_seconds: Upper bound for how long L1 keeps any entry
+            enabled: When False every lookup misses and nothing is stored
+        """
+        self.l1 = l1
+        self.backend = backend
+        self.namespace = namespace
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self.enabled = enabled
+        self.instance_id = uuid.uuid4().hex
+        self.channel = f"{namespace}:invalidate"
+
+        if self.backend is not None:
+            self.backend.subscribe(self.channel, self._on_invalidation)
+
+    def get(self, key: str) -> Any:
+        """Get a value from L1, then L2; returns MISSING on a miss"""
+        if not self.enabled:
+            return MISSING
+
+        value = self.l1.get(key)
+        if value is not MISSING:
+            return value
+
+        if self.backend is None:
+            return MISSING
+
+        try:
+            data = self.backend.get(self._shared_key(key))
+        except Exception as e:
+            # The shared tier is an optimisation; an outage degrades to a miss
+            logger.warning("Cache L2 get failed for %s: %s", key, e)
+            return MISSING
+
+        if data is None:
+            return MISSING
+
+        value = loads(data)
+        self.l1.set(key, value, self.l1_ttl_seconds)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value in both tiers; L1 keeps it for at most l1_ttl_seconds"""
+        if not self.enabled:
+            return
+
+        self.l1.set(key, value, min(ttl, self.l1_ttl_seconds))
+
+        if self.backend is None:
+            return
+
+        try:
+            self.backend.set(self._shared_key(key), dumps(value), ttl)
+        except Exception as e:
+            logger.warning("Cache L2 set failed for %s: %s", key, e)
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop keys from every tier and every worker"""
+        if not keys:
+            return
+
+        self.l1.delete(keys)
+        self._invalidate_shared({"keys": list(keys)})
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every key starting with prefix from every tier and every worker"""
+        self.l1.delete_prefix(prefix)
+        self._invalidate_shared({"prefix": prefix})
+
+    def clear_local(self) -> None:
+        """Drop this worker's L1 only"""
+        self.l1.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """L1 counters for this worker"""
+        return {
+            "l1_entries": len(self.l1),
+            "l1_hits": self.l1.hits,
+            "l1_misses": self.l1.misses,
+            "l2_enabled": self.backend is not None,
+        }
+
+    def close(self) -> None:
+        """Stop the invalidation listener and release the backend"""
+        if self.backend is not None:
+            self.backend.close()
+
+    def _invalidate_shared(self, message: Dict[str, Any]) -> None:
+        if self.backend is None:
+            return
+
+        try:
+            if "keys" in message:
+                self.backend.delete([self._shared_key(key) for key in message["keys"]])
+            else:
+                self.backend.delete_prefix(self._shared_key(message["prefix"]))
+            self.backend.publish(self.channel, {**message, "origin": self.instance_id})
+        except Exception as e:
+            logger.warning("Cache invalidation broadcast failed: %s", e)
+
+    def _on_invalidation(self, message: Dict[str, Any]) -> None:
+        """Handle a broadcast from any worker (our own L1 is already clean)"""
+        if message.get("origin") == self.instance_id:
+            return
+
+        if message.get("keys"):
+            self.l1.delete(message["keys"])
+        elif message.get("prefix") is not None:
+            self.l1.delete_prefix(message["prefix"])
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
@@ -1,6 +1,7 @@
 from pydantic import validator
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 import os
 from dotenv import load_dotenv
 
@@ -15,14 +16,103 @@ class Settings(BaseSettings):
     DATABASE_NAME: str
     DATABASE_USER: str
     DATABASE_PASSWORD: str
+    # General pool (all traffic except the critical class)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    # Connections one request may use at once for concurrent independent reads
+    DB_FAN_OUT_MAX_CONCURRENCY: int = 4
+    # Critical pool (emergency access, /api/auth/validate): reserved, fails fast
+    DB_CRITICAL_POOL_SIZE: int = 3
+    DB_CRITICAL_MAX_OVERFLOW: int = 2
+    DB_CRITICAL_POOL_TIMEOUT_SECONDS: float = 2
+    DB_CRITICAL_STATEMENT_TIMEOUT_MS: int = 3000
+    DB_CRITICAL_FAN_OUT_MAX_CONCURRENCY: int = 2
+    # Read replicas (comma-separated URLs; empty = all reads on the primary).
+    # Replica pools reuse the general/critical sizing above
+    DATABASE_REPLICA_URLS: str = ""
+    DB_REPLICA_RETRY_SECONDS: float = 30
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
+    # Redis holding the read-your-writes windows; required with replicas unless the window is 0
+    DB_READ_YOUR_WRITES_REDIS_URL: Optional[str] = None
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Cache (per-worker LRU, optionally backed by Redis with pub/sub invalidation)
+    CACHE_ENABLED: bool = True
+    CACHE_REDIS_ENABLED: bool = False
+    CACHE_NAMESPACE: str = "vitalgo"
+    CACHE_L1_MAX_ENTRIES: int = 1024
+    CACHE_L1_TTL_SECONDS: int = 30
+
+    # Startup warm-up (/ready turns 200 once it has finished)
+    WARMUP_ENABLED: bool = True
+    WARMUP_POOL_CONNECTIONS: int = 5
+    WARMUP_RETRY_SECONDS: int = 5
+    # Container-wide readiness: warm workers drop a marker here and /ready waits for
+    # WARMUP_EXPECTED_WORKERS of them; unset = each worker reports only itself
+    WARMUP_READY_DIR: Optional[str] = None
+    WARMUP_EXPECTED_WORKERS: int = 1
+
+    # Background jobs (one scheduler per worker; singleton jobs run on the advisory-lock leader)
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_LEADER_LOCK_ID: int = 740_310_001
+    SCHEDULER_LEADER_REFRESH_SECONDS: int = 15
+    SESSION_CLEANUP_INTERVAL_SECONDS: int = 3600
+    OUTBOX_RELAY_INTERVAL_SECONDS: int = 30
+    OUTBOX_RETENTION_DAYS: int = 7
+    QR_ACCESS_FLUSH_INTERVAL_SECONDS: int = 15
+    ACTIVITY_FLUSH_INTERVAL_SECONDS: int = 5
+    ACTIVITY_BUFFER_MAX_PENDING: int = 10000
+
+    # Delta sync (/api/sync): rows updated this long before a client's last sync are sent again,
+    # covering writes that committed after it. Clients idle longer than the tombstone
+    # retention get a full snapshot
+    SYNC_COMMIT_GRACE_SECONDS: int = 60
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 90
+
+    # Load shedding (per worker): priority classes are critical, normal and low.
+    # Critical is never shed; the others get 503 + Retry-After past their limits
+    LOAD_SHED_ENABLED: bool = True
+    LOAD_SHED_ROUTE_PRIORITIES: Dict[str, str] = {
+        "/api/emergency": "critical",
+        "/api/auth/refresh": "critical",
+        "/health": "critical",
+        "/ready": "critical",
+        "/api/signup/validate-": "low",
+        "/api/signup/document-types": "low",
+        "/api/countries": "low",
+        "/api/dashboard": "low",
+    }
+    LOAD_SHED_IN_FLIGHT_LIMITS: Dict[str, int] = {"low": 64, "normal": 192}
+    LOAD_SHED_LOOP_LAG_LIMITS_MS: Dict[str, float] = {"low": 100, "normal": 500}
+    LOAD_SHED_RETRY_AFTER_SECONDS: int = 5
+
+    # Response compression (brotli when installed, else gzip); smaller bodies go out as is
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    # Browser cache lifetime for the precompressed country and document type catalogs
+    CATALOG_CACHE_MAX_AGE_SECONDS: int = 3600
+
     # Security
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Asymmetric signing (RS256/ES256): directory of <kid>.pem / <kid>.pub.pem keys
+    JWT_KEYS_DIR: Optional[str] = None
+    JWT_ACTIVE_KID: Optional[str] = None
+    # Opt-in window for HS256 tokens issued before the switch to JWT_KEYS_DIR; set
+    # the cutoff to the switch time plus the longest token lifetime (30 days)
+    JWT_ACCEPT_LEGACY_HS256: bool = False
+    JWT_LEGACY_HS256_UNTIL: Optional[datetime] = None
+    JWKS_CACHE_MAX_AGE_SECONDS: int = 3600
+    # A refresh token replayed this soon after rotation, on the same worker, gets the rotated tokens
+    # again instead of 401 (parallel client retries); 0 disables
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: int = 10
     BCRYPT_ROUNDS: int = 12
 
     # API
@@ -37,6 +127,14 @@ class Settings(BaseSettings):
     # Frontend URL for QR codes
     FRONTEND_URL: str = "http://localhost:3000"
 
+    # Offline emergency QR (signed payload inside the QR). Disabled until a key
+    # directory is set; same <kid>.pem / <kid>.pub.pem layout as JWT_KEYS_DIR
+    QR_OFFLINE_KEYS_DIR: Optional[str] = None
+    QR_OFFLINE_ALGORITHM: str = "ES256"
+    QR_OFFLINE_ACTIVE_KID: Optional[str] = None
+    # QR alphanumeric capacity at version 20, error correction M
+    QR_OFFLINE_MAX_CHARS: int = 970
+
     # Email
     SMTP_HOST: Optional[str] = None
     SMTP_PORT: Optional[int] = None
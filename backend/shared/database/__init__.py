@@ -1,3 +1,33 @@
-from .database import Base, engine, SessionLocal, get_db
+from .database import (
+    Base,
+    engine,
+    critical_engine,
+    SessionLocal,
+    CriticalSessionLocal,
+    AuthSessionLocal,
+    ReadSessionLocal,
+    CriticalReadSessionLocal,
+    get_db,
+    get_auth_db,
+    get_critical_db,
+    get_read_db,
+    get_critical_read_db,
+    get_pool_metrics,
+)
 
-__all__ = ["Base", "engine", "SessionLocal", "get_db"]
\ No newline at end of file
+__all__ = [
+    "Base",
+    "engine",
+    "critical_engine",
+    "SessionLocal",
+    "CriticalSessionLocal",
+    "AuthSessionLocal",
+    "ReadSessionLocal",
+    "CriticalReadSessionLocal",
+    "get_db",
+    "get_auth_db",
+    "get_critical_db",
+    "get_read_db",
+    "get_critical_read_db",
+    "get_pool_metrics",
+]
@@ -0,0 +1,115 @@
+"""
+Batched writes of patient-scoped medical records
+
+Entering records one request at a time costs a round trip and a commit (a
+WAL flush) per record. apply_batch_write() applies a list of creates,
+updates and deletes for one patient in a single transaction:
+
+- creates: one multi-row INSERT ... RETURNING (insertmanyvalues), so ids and
+  server defaults come back without a query per row
+- updates and deletes: one SELECT of the targets, scoped to the patient, then
+  one flush; ids the patient does not own are skipped and reported
+- one commit, then one SELECT refreshing the created and updated rows
+
+Each applied item records the same domain event as the single-record path,
+so cache invalidation, the activity feed and sync tombstones behave the same.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generic, List, Set, Type, TypeVar
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from shared.events import CREATED, DELETED, UPDATED, MedicalRecordChanged, record_event
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchWrite:
+    """Changes to apply: new rows, changed fields per id, ids to delete"""
+    creates: List[Dict[str, Any]] = field(default_factory=list)
+    updates: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    deletes: List[int] = field(default_factory=list)
+
+
+@dataclass
+class BatchWriteResult(Generic[T]):
+    """Created rows in request order, updated rows by id and deleted ids"""
+    created: List[T] = field(default_factory=list)
+    updated: Dict[int, T] = field(default_factory=dict)
+    deleted: Set[int] = field(default_factory=set)
+
+
+def apply_batch_write(
+    db: Session,
+    model: Type[T],
+    patient_id: UUID,
+    batch: BatchWrite,
+    event_class: Type[MedicalRecordChanged],
+    label_attribute: str
+) -> BatchWriteResult[T]:
+    """
+    Apply a batch for one patient in one transaction
+
+    Args:
+        db: Session; committed on success, left for the caller to roll back on error
+        model: Mapped class with id and patient_id columns
+        patient_id: Owner of every row read or written
+        batch: Changes to apply
+        event_class: Domain event recorded per applied item
+        label_attribute: Attribute used as the event label (e.g. medication_name)
+
+    Returns:
+        BatchWriteResult; update and delete ids missing from it were not found
+    """
+    result: BatchWriteResult[T] = BatchWriteResult()
+
+    target_ids = set(batch.updates) | set(batch.deletes)
+    targets = {}
+    if target_ids:
+        targets = {
+            record.id: record
+            for record in db.query(model).filter(model.patient_id == patient_id, model.id.in_(target_ids))
+        }
+
+    if batch.creates:
+        rows = [{**values, "patient_id": patient_id} for values in batch.creates]
+        result.created = list(db.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows))
+
+    for record in result.created:
+        record_event(db, event_class(
+            patient_id=patient_id, record_id=record.id, change=CREATED, label=getattr(record, label_attribute)
+        ))
+
+    for record_id, values in batch.updates.items():
+        record = targets.get(record_id)
+        if record is None:
+            continue
+        for key, value in values.items():
+            if hasattr(record, key):
+                setattr(record, key, value)
+        record_event(db, event_class(
+            patient_id=patient_id, record_id=record_id, change=UPDATED, label=getattr(record, label_attribute)
+        ))
+        result.updated[record_id] = record
+
+    for record_id in batch.deletes:
+        record = targets.get(record_id)
+        if record is None:
+            continue
+        record_event(db, event_class(
+            patient_id=patient_id, record_id=record_id, change=DELETED, label=getattr(record, label_attribute)
+        ))
+        db.delete(record)
+        result.deleted.add(record_id)
+
+    # Read before commit: afterwards every attribute access would reload its row
+    touched_ids = [record.id for record in result.created] + list(result.updated)
+    db.commit()
+
+    # Commit expired the rows and the server set updated_at and change_seq: reload them in one query
+    if touched_ids:
+        db.query(model).filter(model.id.in_(touched_ids)).all()
+    return result
@@ -0,0 +1,105 @@
+"""
+Change tracking for delta sync
+
+Every insert and update of a tracked table takes the next value of one
+database sequence, medical_change_seq, into its change_seq column; every ORM
+delete leaves a row in sync_tombstones with its own sequence value. A client
+that remembers the highest value it has seen asks only for rows above it:
+
+    class PatientMedication(Base):
+        ...
+        change_seq = change_seq_column()
+
+    track_deletes(PatientMedication, "medications")
+
+Sequence values are taken when the statement runs, not at commit, so a slow
+transaction can make a lower value visible after a higher one was read. Sync
+readers cover that with an updated_at grace window (see slices.sync).
+
+Deletes are caught by the mapper, so they must go through the session
+(session.delete); bulk Query.delete() leaves no tombstone. Tombstones older
+than the sync retention are purged, and clients that synced before that get a
+full snapshot instead.
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Sequence, String, event, insert
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from shared.database.database import Base
+
+logger = logging.getLogger(__name__)
+
+# One sequence for every tracked table, so one number orders all of a patient's changes
+CHANGE_SEQUENCE = Sequence("medical_change_seq", metadata=Base.metadata)
+
+
+def change_seq_column() -> Column:
+    """
+    change_seq column for a tracked table
+
+    Takes the next sequence value on INSERT and on every UPDATE, including
+    bulk Query.update(). Dialects without sequences (SQLite) leave it NULL.
+    """
+    return Column(BigInteger, CHANGE_SEQUENCE, onupdate=CHANGE_SEQUENCE.next_value(), nullable=True)
+
+
+class SyncTombstone(Base):
+    """A tracked row that was deleted, kept so sync clients can drop their copy"""
+
+    __tablename__ = "sync_tombstones"
+
+    # Medical ids are BIGSERIAL per table, so (resource_type, resource_id) never repeats
+    resource_type = Column(String(30), primary_key=True)
+    resource_id = Column(BigInteger, primary_key=True)
+    patient_id = Column(UUID(as_uuid=True), nullable=False)
+    change_seq = Column(BigInteger, CHANGE_SEQUENCE, nullable=True)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_sync_tombstones_patient_id_change_seq", patient_id, change_seq),
+        Index("ix_sync_tombstones_deleted_at", deleted_at),
+    )
+
+    def __repr__(self):
+        return f"<SyncTombstone(resource_type='{self.resource_type}', resource_id={self.resource_id})>"
+
+
+def track_deletes(model: Any, resource_type: str) -> None:
+    """
+    Record a tombstone whenever an instance of model is deleted
+
+    The tombstone is inserted on the flush's connection, so it commits or
+    rolls back with the delete.
+    """
+    @event.listens_for(model, "after_delete")
+    def _record_tombstone(mapper, connection, target) -> None:
+        connection.execute(
+            insert(SyncTombstone).values(
+                resource_type=resource_type,
+                resource_id=target.id,
+                patient_id=target.patient_id,
+            )
+        )
+
+
+def purge_tombstones(session: Session, older_than_days: int) -> int:
+    """
+    Delete tombstones past the sync retention window
+
+    Returns:
+        Number of rows deleted
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    deleted = session.query(SyncTombstone).filter(
+        SyncTombstone.deleted_at < cutoff
+    ).delete(synchronize_session=False)
+    session.commit()
+
+    if deleted:
+        logger.info("Purged %d sync tombstones older than %d days", deleted, older_than_days)
+    return deleted
@@ -1,19 +1,106 @@
-from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from shared.config.settings import settings
+from shared.database.pools import CRITICAL_POOL, GENERAL_POOL, create_pool_engine, pool_status
+from shared.database.replicas import (
+    ReadYourWritesStore,
+    RoutingSession,
+    configure_read_your_writes,
+    create_replica_engine,
+    track_writes,
+)
+
+# Create engines: general traffic, plus a reserved pool for emergency access and /api/auth/validate
+engine = create_pool_engine(
+    GENERAL_POOL,
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS,
+    echo=settings.DEBUG
+)
 
-# Create engine
-engine = create_engine(
+critical_engine = create_pool_engine(
+    CRITICAL_POOL,
     settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
+    pool_size=settings.DB_CRITICAL_POOL_SIZE,
+    max_overflow=settings.DB_CRITICAL_MAX_OVERFLOW,
+    pool_timeout=settings.DB_CRITICAL_POOL_TIMEOUT_SECONDS,
+    statement_timeout_ms=settings.DB_CRITICAL_STATEMENT_TIMEOUT_MS,
     echo=settings.DEBUG
 )
 
-# Create sessionmaker
+# Replica engines, one per pool class; None when no replicas are configured
+REPLICA_URLS = [url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()]
+
+replica_engine = None
+critical_replica_engine = None
+if REPLICA_URLS:
+    # Read-your-writes must hold across workers, so it needs Redis regardless of cache settings
+    if settings.DB_READ_YOUR_WRITES_SECONDS > 0:
+        if not settings.DB_READ_YOUR_WRITES_REDIS_URL:
+            raise RuntimeError(
+                "DATABASE_REPLICA_URLS is set but DB_READ_YOUR_WRITES_REDIS_URL is not: "
+                "read-your-writes needs a Redis shared by all workers "
+                "(or set DB_READ_YOUR_WRITES_SECONDS=0 to disable it)"
+            )
+        configure_read_your_writes(
+            ReadYourWritesStore(settings.DB_READ_YOUR_WRITES_REDIS_URL, settings.DB_READ_YOUR_WRITES_SECONDS)
+        )
+
+    replica_engine = create_replica_engine(
+        f"{GENERAL_POOL}_replica",
+        settings.DATABASE_URL,
+        REPLICA_URLS,
+        retry_seconds=settings.DB_REPLICA_RETRY_SECONDS,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        statement_timeout_ms=settings.DB_STATEMENT_TIMEOUT_MS,
+        echo=settings.DEBUG
+    )
+    critical_replica_engine = create_replica_engine(
+        f"{CRITICAL_POOL}_replica",
+        settings.DATABASE_URL,
+        REPLICA_URLS,
+        retry_seconds=settings.DB_REPLICA_RETRY_SECONDS,
+        pool_size=settings.DB_CRITICAL_POOL_SIZE,
+        max_overflow=settings.DB_CRITICAL_MAX_OVERFLOW,
+        pool_timeout=settings.DB_CRITICAL_POOL_TIMEOUT_SECONDS,
+        statement_timeout_ms=settings.DB_CRITICAL_STATEMENT_TIMEOUT_MS,
+        echo=settings.DEBUG
+    )
+
+# Create sessionmakers
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Objects loaded on the critical pool (e.g. the authenticated principal) stay usable
+# after the session commits to hand its connection back early
+CriticalSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=critical_engine
+)
+
+# Token lookups of regular requests (get_current_principal): general pool, but like the
+# critical session it keeps the principal loaded after the early commit that frees the connection
+AuthSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+# Read-only use cases: reads on replicas, writes and read-your-writes on the primary
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False,
+    primary=engine, replica=replica_engine
+)
+
+CriticalReadSessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, expire_on_commit=False,
+    primary=critical_engine, replica=critical_replica_engine
+)
+
+for _session_factory in (SessionLocal, ReadSessionLocal, CriticalReadSessionLocal):
+    track_writes(_session_factory)
+
 # Create base class for models
 Base = declarative_base()
 
@@ -23,4 +110,52 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Dependency to get the session that resolves the authenticated principal (general pool)
+def get_auth_db():
+    db = AuthSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Dependency to get a session on the reserved pool (emergency access, /api/auth/validate)
+def get_critical_db():
+    db = CriticalSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Dependency to get a session for read-only use cases (replica routing)
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Dependency for read-only use cases on the reserved pool (emergency access)
+def get_critical_read_db():
+    db = CriticalReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_pool_metrics():
+    """Occupancy and checkout wait metrics per pool class, plus replica health"""
+    metrics = {
+        GENERAL_POOL: pool_status(engine),
+        CRITICAL_POOL: pool_status(critical_engine),
+    }
+    for name, replica in ((GENERAL_POOL, replica_engine), (CRITICAL_POOL, critical_replica_engine)):
+        if replica is not None:
+            metrics[f"{name}_replica"] = {**pool_status(replica), **replica.replica_set.status()}
+    return metrics
@@ -0,0 +1,105 @@
+"""
+Concurrent fan-out of independent reads within one request
+
+A SQLAlchemy Session is one connection used by one thread at a time, so
+queries on the request's session run strictly one after another and the
+request waits for the sum of their round trips. QueryFanOut runs each query
+in a worker thread on a session of its own, so the wait is about the slowest
+query instead:
+
+    fan_out = QueryFanOut(db, CriticalReadSessionLocal, EmergencyDataRepository,
+                          max_concurrency=settings.DB_CRITICAL_FAN_OUT_MAX_CONCURRENCY)
+    medications, allergies = await fan_out.gather(
+        lambda repo: repo.get_patient_medications(patient_id),
+        lambda repo: repo.get_patient_allergies(patient_id),
+    )
+
+Each query takes its own pooled connection, so max_concurrency caps how many
+one request holds at a time; keep it well below the pool size. Queries must
+be independent reads: they see separately committed data (as statements on one
+READ COMMITTED session already do) and any writes would be lost, since the
+sessions are closed without commit.
+
+In concurrent mode the request's own session is never used, so a request
+holds at most max_concurrency connections. Without a session factory, or with
+max_concurrency 1, the queries run one by one on the request's session, which
+keeps SQLite tests and single connection setups working unchanged.
+"""
+import asyncio
+import inspect
+from typing import Any, Callable, Generic, List, Optional, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+R = TypeVar("R")
+
+Query = Callable[[R], Any]
+
+
+def _complete(result: Any) -> Any:
+    """Finish an `async def` repository method that blocks (runs in a worker thread)"""
+    if inspect.iscoroutine(result):
+        return asyncio.run(result)
+    return result
+
+
+class QueryFanOut(Generic[R]):
+    """Runs independent repository reads concurrently, each on its own session"""
+
+    def __init__(
+        self,
+        db: Session,
+        session_factory: Optional[Callable[[], Session]] = None,
+        repository_factory: Callable[[Session], R] = lambda session: session,
+        max_concurrency: int = 4
+    ):
+        """
+        Args:
+            db: The request's session, used when queries run sequentially
+            session_factory: Makes one session per concurrent query; None runs
+                everything on db
+            repository_factory: Wraps a session in what the queries receive
+                (a repository class, or the session itself by default)
+            max_concurrency: Most queries, and connections, in flight at once
+        """
+        self.db = db
+        self.session_factory = session_factory
+        self.repository_factory = repository_factory
+        self.max_concurrency = max(1, max_concurrency)
+
+    @property
+    def concurrent(self) -> bool:
+        return self.session_factory is not None and self.max_concurrency > 1
+
+    async def gather(self, *queries: Query) -> List[Any]:
+        """
+        Run queries and return their results in the same order
+
+        If any query fails, the others still run to completion (their threads
+        cannot be interrupted) and then the first error is raised.
+        """
+        if not self.concurrent:
+            repository = self.repository_factory(self.db)
+            return [await run_in_threadpool(self._run, query, repository) for query in queries]
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_bounded(query: Query) -> Any:
+            async with semaphore:
+                return await run_in_threadpool(self._run_on_own_session, query)
+
+        results = await asyncio.gather(
+            *(run_bounded(query) for query in queries), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _run(self, query: Query, repository: R) -> Any:
+        return _complete(query(repository))
+
+    def _run_on_own_session(self, query: Query) -> Any:
+        with self.session_factory() as session:
+            return self._run(query, self.repository_factory(session))
@@ -0,0 +1,147 @@
+"""
+Named connection pools with per-class sizing, timeouts and checkout metrics
+
+Two pool classes share the database:
+
+- critical: emergency access (including the paramedic's token lookup) and
+  /api/auth/validate. It is small and reserved, fails fast and has a short
+  statement_timeout, so a paramedic lookup never waits behind dashboard or
+  login traffic.
+- general: everything else.
+
+Each class gets its own Engine, so exhausting one pool cannot delay the other.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+CRITICAL_POOL = "critical"
+GENERAL_POOL = "general"
+
+# Upper bounds (seconds) for the checkout wait histogram
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+class PoolMetrics:
+    """Checkout wait statistics for one pool (thread-safe)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            for index, bound in enumerate(WAIT_BUCKETS):
+                if wait <= bound:
+                    self.buckets[index] += 1
+                    break
+            else:
+                self.buckets[-1] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"le_{bound}" for bound in WAIT_BUCKETS] + ["le_inf"]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else None,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "wait_histogram": dict(zip(labels, self.buckets)),
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited"""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record(time.perf_counter() - started, timed_out=True)
+            raise
+
+        if self.metrics is not None:
+            self.metrics.record(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a recreated pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def statement_timeout_connect_args(database_url: str, statement_timeout_ms: int) -> Dict[str, Any]:
+    """DBAPI connect arguments that set statement_timeout (PostgreSQL only)"""
+    if statement_timeout_ms and make_url(database_url).get_backend_name() == "postgresql":
+        return {"options": f"-c statement_timeout={int(statement_timeout_ms)}"}
+    return {}
+
+
+def create_pool_engine(
+    name: str,
+    database_url: str,
+    pool_size: int,
+    max_overflow: int,
+    pool_timeout: float,
+    statement_timeout_ms: int,
+    echo: bool = False
+) -> Engine:
+    """
+    Create an engine for one pool class
+
+    Args:
+        name: Pool class name, used in metrics
+        pool_timeout: Seconds to wait for a free connection before failing
+        statement_timeout_ms: Server-side limit per statement (PostgreSQL only); 0 disables
+    """
+    connect_args = statement_timeout_connect_args(database_url, statement_timeout_ms)
+
+    engine = create_engine(
+        database_url,
+        poolclass=TimedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        connect_args=connect_args,
+        echo=echo,
+    )
+    engine.pool.metrics = PoolMetrics(name)
+    return engine
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """Current occupancy plus checkout wait metrics for an engine's pool"""
+    pool = engine.pool
+    status: Dict[str, Any] = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "idle": pool.checkedin(),
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.to_dict())
+    return status
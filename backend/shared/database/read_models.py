@@ -0,0 +1,59 @@
+"""
+Column-projected read models
+
+Read-only views (emergency access, QR info, dashboard activity) use a handful
+of fields from wide rows; Patient alone has about 60 columns. Loading ORM
+entities for them pays for every column, an identity-map entry and change
+tracking state per row, all thrown away at the end of the request.
+
+A read model is a slotted dataclass whose field names match the entity
+attributes it reads:
+
+    @dataclass(frozen=True, slots=True)
+    class AllergyRow:
+        allergen: str
+        severity_level: str
+
+    stmt = select(*project(AllergyRow, PatientAllergy)).where(...)
+    allergies = fetch_all(db, AllergyRow, stmt)
+
+Only those columns are selected, and each result row is copied positionally
+into the dataclass, so nothing is registered in the session.
+"""
+from dataclasses import fields
+from typing import Any, List, Optional, Type, TypeVar
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement, Select
+
+T = TypeVar("T")
+
+
+def project(read_model: Type[T], entity: Any, **overrides: ColumnElement) -> List[ColumnElement]:
+    """
+    Columns for read_model's fields, in declaration order
+
+    Args:
+        read_model: Dataclass whose field names are entity attributes
+        entity: Mapped class the columns are taken from
+        overrides: Column expressions for fields that are not entity
+            attributes, e.g. document_type_name=DocumentType.name
+
+    Returns:
+        Column list for select()
+    """
+    return [
+        overrides[field.name] if field.name in overrides else getattr(entity, field.name)
+        for field in fields(read_model)
+    ]
+
+
+def fetch_all(db: Session, read_model: Type[T], stmt: Select) -> List[T]:
+    """Execute a projected select and build one read model per row"""
+    return [read_model(*row) for row in db.execute(stmt)]
+
+
+def fetch_one(db: Session, read_model: Type[T], stmt: Select) -> Optional[T]:
+    """Execute a projected select and build the first row's read model, if any"""
+    row = db.execute(stmt.limit(1)).first()
+    return read_model(*row) if row is not None else None
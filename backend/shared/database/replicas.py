@@ -0,0 +1,291 @@
+"""
+Read-replica routing with failover and read-your-writes
+
+Read-only use cases take a session from get_read_db() / get_critical_read_db().
+These sessions are RoutingSession instances:
+
+- SELECTs go to a replica engine.
+- Flushes, INSERT/UPDATE/DELETE and SELECT ... FOR UPDATE go to the primary.
+- Once a session has written, its later reads stay on the primary.
+- For DB_READ_YOUR_WRITES_SECONDS after a user commits a write, that user's
+  reads also go to the primary. The window is kept in Redis
+  (DB_READ_YOUR_WRITES_REDIS_URL), used directly rather than through the
+  cache, so every worker sees it whatever the cache settings. If Redis
+  cannot be reached, reads go to the primary.
+
+Replica failover happens per connection. The replica engine has a normal
+pool, but each new connection goes to the next healthy replica in
+round-robin order. A replica that fails to connect is skipped for
+DB_REPLICA_RETRY_SECONDS. If none is reachable, the connection goes to the
+primary. pool_pre_ping discards connections to a replica that went away.
+Fallback connections are replaced once a replica is due for a retry.
+"""
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from shared.database.pools import create_pool_engine, statement_timeout_connect_args
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_TARGET = "primary"
+
+_PIN_PRIMARY_KEY = "pin_primary"
+_TARGET_KEY = "replica_target"
+_READ_YOUR_WRITES_CHECKED_KEY = "read_your_writes_checked"
+_PENDING_WRITES_KEY = "has_pending_writes"
+
+# User whose request is being served; set once the principal is resolved
+_request_user_id: ContextVar[Optional[str]] = ContextVar("request_user_id", default=None)
+
+# Installed by shared.database when replicas are configured
+_read_your_writes_store: Optional["ReadYourWritesStore"] = None
+
+
+class Replica:
+    """One replica URL and its health"""
+
+    def __init__(self, url: str):
+        self.url = make_url(url)
+        self.label = self.url.render_as_string(hide_password=True)
+        self.retry_at = 0.0
+        self.connects = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    def is_available(self, now: float) -> bool:
+        return now >= self.retry_at
+
+
+class ReplicaSet:
+    """Replicas chosen round-robin, skipping any that recently failed to connect"""
+
+    def __init__(self, urls: Sequence[str], retry_seconds: float = 30):
+        self.replicas = [Replica(url) for url in urls]
+        self.retry_seconds = retry_seconds
+        self.primary_fallbacks = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def candidates(self) -> List[Replica]:
+        """Available replicas, starting from the next one in rotation"""
+        now = time.monotonic()
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % max(len(self.replicas), 1)
+        rotated = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in rotated if replica.is_available(now)]
+
+    def any_available(self) -> bool:
+        now = time.monotonic()
+        return any(replica.is_available(now) for replica in self.replicas)
+
+    def mark_connected(self, replica: Replica) -> None:
+        with self._lock:
+            replica.connects += 1
+            replica.last_error = None
+
+    def mark_failed(self, replica: Replica, error: Exception) -> None:
+        with self._lock:
+            replica.failures += 1
+            replica.retry_at = time.monotonic() + self.retry_seconds
+            replica.last_error = type(error).__name__
+        logger.warning("Replica %s unavailable, retrying in %ss: %s",
+                       replica.label, self.retry_seconds, type(error).__name__)
+
+    def mark_fallback(self) -> None:
+        with self._lock:
+            self.primary_fallbacks += 1
+
+    def status(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "primary_fallbacks": self.primary_fallbacks,
+            "replicas": [
+                {
+                    "replica": replica.label,
+                    "healthy": replica.is_available(now),
+                    "connects": replica.connects,
+                    "failures": replica.failures,
+                    "retry_in_seconds": round(max(replica.retry_at - now, 0.0), 1),
+                    "last_error": replica.last_error,
+                }
+                for replica in self.replicas
+            ],
+        }
+
+
+def create_replica_engine(
+    name: str,
+    primary_url: str,
+    replica_urls: Sequence[str],
+    retry_seconds: float,
+    statement_timeout_ms: int,
+    **pool_options
+) -> Engine:
+    """
+    Create a pooled engine whose connections go to replicas, with primary fallback
+
+    Takes the same pool options as create_pool_engine(). The engine's
+    ReplicaSet is available as engine.replica_set.
+    """
+    engine = create_pool_engine(
+        name, primary_url, statement_timeout_ms=statement_timeout_ms, **pool_options
+    )
+    replica_set = ReplicaSet(replica_urls, retry_seconds=retry_seconds)
+    engine.replica_set = replica_set
+
+    @event.listens_for(engine, "do_connect")
+    def _connect_to_replica(dialect, connection_record, cargs, cparams):
+        for replica in replica_set.candidates():
+            replica_cargs, replica_cparams = dialect.create_connect_args(replica.url)
+            replica_cparams.update(statement_timeout_connect_args(str(replica.url), statement_timeout_ms))
+            try:
+                connection = dialect.connect(*replica_cargs, **replica_cparams)
+            except dialect.loaded_dbapi.Error as e:
+                replica_set.mark_failed(replica, e)
+                continue
+
+            replica_set.mark_connected(replica)
+            connection_record.info[_TARGET_KEY] = replica.label
+            return connection
+
+        # No replica reachable: let the engine connect to its own URL, the primary
+        replica_set.mark_fallback()
+        connection_record.info[_TARGET_KEY] = PRIMARY_TARGET
+        return None
+
+    @event.listens_for(engine, "checkout")
+    def _replace_fallback_connection(dbapi_connection, connection_record, connection_proxy):
+        # The pool reconnects (through do_connect) when checkout raises DisconnectionError
+        if connection_record.info.get(_TARGET_KEY) == PRIMARY_TARGET and replica_set.any_available():
+            raise DisconnectionError("Replica available again, dropping primary fallback connection")
+
+    return engine
+
+
+class RoutingSession(Session):
+    """Session that reads from the replica engine and writes to the primary"""
+
+    def __init__(self, primary: Engine, replica: Optional[Engine] = None, **options):
+        super().__init__(**options)
+        self.primary = primary
+        self.replica = replica
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self.replica is None or self._uses_primary(clause):
+            return self.primary
+        return self.replica
+
+    def pin_to_primary(self) -> None:
+        """Send every later statement in this session to the primary"""
+        self.info[_PIN_PRIMARY_KEY] = True
+
+    def _uses_primary(self, clause) -> bool:
+        if self._flushing or self.info.get(_PIN_PRIMARY_KEY):
+            return True
+        if isinstance(clause, UpdateBase) or getattr(clause, "_for_update_arg", None) is not None:
+            self.pin_to_primary()
+            return True
+        # Checked once per session, on its first read
+        if _READ_YOUR_WRITES_CHECKED_KEY not in self.info:
+            self.info[_READ_YOUR_WRITES_CHECKED_KEY] = True
+            if user_recently_wrote():
+                self.pin_to_primary()
+                return True
+        return False
+
+
+def track_writes(session_factory) -> None:
+    """Pin sessions that flushed changes and open the read-your-writes window on commit"""
+
+    @event.listens_for(session_factory, "after_flush")
+    def _after_flush(session, flush_context):
+        session.info[_PIN_PRIMARY_KEY] = True
+        session.info[_PENDING_WRITES_KEY] = True
+
+    @event.listens_for(session_factory, "after_commit")
+    def _after_commit(session):
+        if session.info.pop(_PENDING_WRITES_KEY, False):
+            mark_user_write()
+
+    @event.listens_for(session_factory, "after_rollback")
+    def _after_rollback(session):
+        session.info.pop(_PENDING_WRITES_KEY, None)
+
+
+def set_request_user(user_id) -> None:
+    """Record the authenticated user for read-your-writes routing"""
+    _request_user_id.set(str(user_id) if user_id is not None else None)
+
+
+class ReadYourWritesStore:
+    """Per-user read-your-writes windows in Redis, shared by every worker"""
+
+    def __init__(self, redis_url: str, window_seconds: float, socket_timeout: float = 0.5):
+        import redis
+
+        self.window_seconds = window_seconds
+        self._redis = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+        )
+
+    def mark(self, user_id: str) -> None:
+        self._redis.set(self._key(user_id), b"1", px=max(int(self.window_seconds * 1000), 1))
+
+    def recently_wrote(self, user_id: str) -> bool:
+        return bool(self._redis.exists(self._key(user_id)))
+
+    def ping(self) -> None:
+        self._redis.ping()
+
+    @staticmethod
+    def _key(user_id: str) -> str:
+        return f"read_your_writes:{user_id}"
+
+
+def configure_read_your_writes(store: Optional[ReadYourWritesStore]) -> None:
+    """Install the store that mark_user_write() and user_recently_wrote() use"""
+    global _read_your_writes_store
+    _read_your_writes_store = store
+
+
+def get_read_your_writes_store() -> Optional[ReadYourWritesStore]:
+    return _read_your_writes_store
+
+
+def mark_user_write() -> None:
+    """Route the current user's reads to the primary for the read-your-writes window"""
+    user_id = _request_user_id.get()
+    store = _read_your_writes_store
+    if user_id is None or store is None:
+        return
+
+    try:
+        store.mark(user_id)
+    except Exception as e:
+        logger.error("Could not record read-your-writes window for user %s: %s", user_id, e)
+
+
+def user_recently_wrote() -> bool:
+    user_id = _request_user_id.get()
+    store = _read_your_writes_store
+    if user_id is None or store is None:
+        return False
+
+    try:
+        return store.recently_wrote(user_id)
+    except Exception as e:
+        # Without the marker the replica might be stale for this user; the primary is not
+        logger.warning("Read-your-writes store unavailable, reading from the primary: %s", e)
+        return True
@@ -0,0 +1,52 @@
+"""
+Version stamps for conditional GET on patient-scoped reads
+
+A stamp is a tuple of cheap aggregates that changes whenever the data behind
+a response changes:
+
+- row_stamp: updated_at of one row (the patient, the user)
+- column_stamp: any version column of one row (Patient.emergency_version)
+- collection_stamp: count(*) and max(updated_at) of a patient's rows. The
+  count catches deletes, which leave max(updated_at) untouched.
+
+Every updated_at column uses onupdate=func.now(), so ORM writes and bulk
+query.update() calls both move the stamp. Stamps are read in one SELECT of
+scalar subqueries, each an index lookup on patient_id, so answering
+304 Not Modified costs one round trip and no DTO construction.
+"""
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+StampColumns = List[ColumnElement]
+
+
+def row_stamp(model: Any, *criteria: ColumnElement) -> StampColumns:
+    """updated_at of the single row matching criteria (None if missing)"""
+    return column_stamp(model.updated_at, *criteria)
+
+
+def column_stamp(column: ColumnElement, *criteria: ColumnElement) -> StampColumns:
+    """Value of one column of the single row matching criteria (None if missing)"""
+    return [select(column).where(*criteria).limit(1).scalar_subquery()]
+
+
+def collection_stamp(model: Any, *criteria: ColumnElement) -> StampColumns:
+    """Row count and newest updated_at of the rows matching criteria"""
+    return [
+        select(func.count()).select_from(model).where(*criteria).scalar_subquery(),
+        select(func.max(model.updated_at)).where(*criteria).scalar_subquery(),
+    ]
+
+
+def read_version_stamp(db: Session, *stamps: StampColumns) -> Tuple[Optional[Any], ...]:
+    """
+    Evaluate stamps in a single query
+
+    Returns:
+        Flat tuple of the stamp values, in order
+    """
+    columns = [column for stamp in stamps for column in stamp]
+    return tuple(db.execute(select(*columns)).one())
@@ -0,0 +1,47 @@
+"""
+Domain events
+
+Repositories call record_event(session, SomethingChanged(...)) before commit;
+subscribers registered on get_event_bus() run after the commit succeeds.
+"""
+from shared.events.domain_events import (
+    CREATED,
+    DELETED,
+    UPDATED,
+    AllergyChanged,
+    DomainEvent,
+    IllnessChanged,
+    MedicalRecordChanged,
+    MedicationChanged,
+    PatientProfileChanged,
+    SurgeryChanged,
+    event_from_outbox,
+)
+from shared.events.event_bus import EventBus, get_event_bus, reset_event_bus
+from shared.events.outbox import (
+    OutboxEvent,
+    purge_published_events,
+    record_event,
+    relay_pending_events,
+)
+
+__all__ = [
+    "CREATED",
+    "UPDATED",
+    "DELETED",
+    "DomainEvent",
+    "MedicalRecordChanged",
+    "MedicationChanged",
+    "AllergyChanged",
+    "SurgeryChanged",
+    "IllnessChanged",
+    "PatientProfileChanged",
+    "event_from_outbox",
+    "EventBus",
+    "get_event_bus",
+    "reset_event_bus",
+    "OutboxEvent",
+    "record_event",
+    "relay_pending_events",
+    "purge_published_events",
+]
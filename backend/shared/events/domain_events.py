@@ -0,0 +1,100 @@
+"""
+Typed domain events raised by patient data writes
+"""
+import uuid
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Type
+from uuid import UUID
+
+# Change kinds carried by record-level events
+CREATED = "created"
+UPDATED = "updated"
+DELETED = "deleted"
+
+_EVENT_TYPES: Dict[str, Type["DomainEvent"]] = {}
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """Base class for events; subclasses are registered by class name"""
+    patient_id: UUID
+    event_id: UUID = field(default_factory=uuid.uuid4, kw_only=True)
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc), kw_only=True)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _EVENT_TYPES[cls.__name__] = cls
+
+    @property
+    def event_type(self) -> str:
+        return type(self).__name__
+
+    def to_payload(self) -> Dict[str, Any]:
+        """JSON-safe representation stored in the outbox"""
+        payload = asdict(self)
+        for key, value in payload.items():
+            if isinstance(value, UUID):
+                payload[key] = str(value)
+            elif isinstance(value, datetime):
+                payload[key] = value.isoformat()
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "DomainEvent":
+        """Rebuild an event from its outbox payload"""
+        values = dict(payload)
+        for item in fields(cls):
+            value = values.get(item.name)
+            if value is None:
+                continue
+            if item.name in ("patient_id", "event_id"):
+                values[item.name] = UUID(value)
+            elif item.name == "occurred_at":
+                values[item.name] = datetime.fromisoformat(value)
+        return cls(**values)
+
+
+@dataclass(frozen=True)
+class MedicalRecordChanged(DomainEvent):
+    """A patient medical record was created, updated or deleted"""
+    record_id: Optional[int] = None
+    change: str = UPDATED
+    # Display name of the record (medication name, allergen, ...) for the activity feed
+    label: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class MedicationChanged(MedicalRecordChanged):
+    pass
+
+
+@dataclass(frozen=True)
+class AllergyChanged(MedicalRecordChanged):
+    pass
+
+
+@dataclass(frozen=True)
+class SurgeryChanged(MedicalRecordChanged):
+    pass
+
+
+@dataclass(frozen=True)
+class IllnessChanged(MedicalRecordChanged):
+    pass
+
+
+@dataclass(frozen=True)
+class PatientProfileChanged(DomainEvent):
+    """Patient profile fields changed; section is "basic" or "extended" """
+    section: str = "extended"
+
+
+def event_from_outbox(event_type: str, payload: Dict[str, Any]) -> DomainEvent:
+    """
+    Rebuild a typed event from an outbox row
+
+    Raises:
+        KeyError: If the event type is not known to this process
+    """
+    return _EVENT_TYPES[event_type].from_payload(payload)
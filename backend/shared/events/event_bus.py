@@ -0,0 +1,117 @@
+"""
+In-process event bus
+
+Handlers subscribe to an event class and also receive its subclasses, so a
+handler on MedicalRecordChanged sees every medication, allergy, surgery and
+illness change. Handler failures are logged and never reach the request that
+produced the event: the write has already been committed.
+"""
+import asyncio
+import inspect
+import logging
+from typing import Callable, Dict, List, Optional, Set, Type
+
+from shared.events.domain_events import DomainEvent
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[DomainEvent], object]
+
+
+class EventBus:
+    """Synchronous publish/subscribe for domain events"""
+
+    def __init__(self):
+        self._handlers: Dict[Type[DomainEvent], List[EventHandler]] = {}
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        """Register a sync or async handler for event_type and its subclasses"""
+        handlers = self._handlers.setdefault(event_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def unsubscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        """Remove a handler if registered"""
+        handlers = self._handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+    def publish(self, event: DomainEvent) -> bool:
+        """
+        Deliver an event to every matching handler
+
+        Sync handlers run inline. Async handlers are scheduled on the running
+        loop, or run to completion when called outside one.
+
+        Returns:
+            True if every sync handler succeeded and every async handler was
+            scheduled without error
+        """
+        delivered = True
+        for handler in self._handlers_for(type(event)):
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    self._run_async(handler, event)
+                else:
+                    handler(event)
+            except Exception:
+                delivered = False
+                logger.exception("Event handler %r failed for %s", handler, event.event_type)
+        return delivered
+
+    def clear(self) -> None:
+        """Remove every handler"""
+        self._handlers.clear()
+
+    def _handlers_for(self, event_type: Type[DomainEvent]) -> List[EventHandler]:
+        matched: List[EventHandler] = []
+        for cls in event_type.__mro__:
+            for handler in self._handlers.get(cls, []):
+                if handler not in matched:
+                    matched.append(handler)
+        return matched
+
+    def _run_async(self, handler: EventHandler, event: DomainEvent) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(handler(event))
+            return
+
+        task = loop.create_task(handler(event))
+        # Keep a reference until done so the task is not garbage-collected
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+
+    def _on_task_done(self, task: asyncio.Task) -> None:
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Async event handler failed", exc_info=task.exception())
+
+
+# Global instance storage
+_event_bus_instance: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    """
+    Get or create the singleton event bus
+
+    Returns:
+        EventBus: The process-wide event bus
+    """
+    global _event_bus_instance
+
+    if _event_bus_instance is None:
+        _event_bus_instance = EventBus()
+
+    return _event_bus_instance
+
+
+def reset_event_bus() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _event_bus_instance
+    _event_bus_instance = None
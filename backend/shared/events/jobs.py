@@ -0,0 +1,30 @@
+"""
+Outbox maintenance jobs (run by shared.scheduler)
+"""
+import logging
+
+from shared.database import SessionLocal
+from shared.events.outbox import purge_published_events, relay_pending_events
+
+logger = logging.getLogger(__name__)
+
+
+def relay_outbox_job() -> int:
+    """Re-publish outbox events that missed their after-commit dispatch"""
+    db = SessionLocal()
+    try:
+        published = relay_pending_events(db)
+        if published:
+            logger.info("Relayed %d pending domain events", published)
+        return published
+    finally:
+        db.close()
+
+
+def purge_outbox_job(older_than_days: int = 7) -> int:
+    """Delete published outbox rows past the retention window"""
+    db = SessionLocal()
+    try:
+        return purge_published_events(db, older_than_days)
+    finally:
+        db.close()
@@ -0,0 +1,169 @@
+"""
+Transactional outbox for domain events
+
+record_event() writes the event to domain_event_outbox in the caller's
+transaction. After that transaction commits, the event is published on the
+in-process bus and its row is marked as published. Rows left unpublished by a
+crash between commit and dispatch are re-delivered by relay_pending_events(),
+so delivery is at-least-once and handlers must be idempotent.
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, event, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from shared.database.database import Base
+from shared.events.domain_events import DomainEvent, event_from_outbox
+from shared.events.event_bus import EventBus, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pending_domain_events"
+
+
+class OutboxEvent(Base):
+    """Domain event persisted in the same transaction as the change it describes"""
+
+    __tablename__ = "domain_event_outbox"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    event_id = Column(String(36), nullable=False, unique=True)
+    event_type = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        # Relay scan: unpublished rows, oldest first
+        Index(
+            "ix_domain_event_outbox_unpublished",
+            "created_at",
+            postgresql_where=published_at.is_(None),
+        ),
+    )
+
+    def __repr__(self):
+        return f"<OutboxEvent(id={self.id}, event_type='{self.event_type}', published={self.published_at is not None})>"
+
+
+def record_event(session: Session, domain_event: DomainEvent) -> None:
+    """
+    Stage an event in the session's current transaction
+
+    Call before commit. Nothing is published if the transaction rolls back.
+    """
+    row = OutboxEvent(
+        event_id=str(domain_event.event_id),
+        event_type=domain_event.event_type,
+        payload=domain_event.to_payload(),
+    )
+    session.add(row)
+    session.info.setdefault(_PENDING_KEY, []).append((row, domain_event))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    pending: List[Tuple[OutboxEvent, DomainEvent]] = session.info.pop(_PENDING_KEY, [])
+    if not pending:
+        return
+
+    bus = get_event_bus()
+    published_ids = [row.id for row, domain_event in pending if bus.publish(domain_event)]
+
+    if published_ids:
+        _mark_published(session, published_ids)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _mark_published(session: Session, outbox_ids: List[int]) -> None:
+    """Mark rows as published on a separate connection (the session is mid-commit)"""
+    bind = session.get_bind()
+    if not isinstance(bind, Engine):
+        return
+
+    try:
+        with bind.begin() as connection:
+            connection.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(outbox_ids))
+                .values(published_at=func.now())
+            )
+    except Exception as e:
+        # The relay re-delivers these rows later; handlers are idempotent
+        logger.warning("Could not mark outbox events %s as published: %s", outbox_ids, e)
+
+
+def relay_pending_events(
+    session: Session,
+    bus: Optional[EventBus] = None,
+    batch_size: int = 100,
+    min_age_seconds: int = 30,
+    max_attempts: int = 10
+) -> int:
+    """
+    Publish outbox rows that were committed but never dispatched
+
+    Rows younger than min_age_seconds are skipped so the normal after-commit
+    path is not raced. SKIP LOCKED lets several workers relay concurrently.
+
+    Returns:
+        Number of events published
+    """
+    bus = bus or get_event_bus()
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=min_age_seconds)
+
+    rows = (
+        session.query(OutboxEvent)
+        .filter(
+            OutboxEvent.published_at.is_(None),
+            OutboxEvent.created_at < cutoff,
+            OutboxEvent.attempts < max_attempts,
+        )
+        .order_by(OutboxEvent.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+
+    published = 0
+    for row in rows:
+        row.attempts += 1
+        try:
+            domain_event = event_from_outbox(row.event_type, row.payload)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error("Undecodable outbox event %s (%s): %s", row.id, row.event_type, e)
+            continue
+
+        if bus.publish(domain_event):
+            row.published_at = func.now()
+            published += 1
+
+    session.commit()
+    return published
+
+
+def purge_published_events(session: Session, older_than_days: int = 7) -> int:
+    """
+    Delete published rows older than the retention window
+
+    Returns:
+        Number of rows deleted
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+    deleted = (
+        session.query(OutboxEvent)
+        .filter(OutboxEvent.published_at.is_not(None), OutboxEvent.published_at < cutoff)
+        .delete(synchronize_session=False)
+    )
+    session.commit()
+    return deleted
@@ -0,0 +1,7 @@
+"""
+Shared ASGI middleware
+"""
+from shared.middleware.compression import CompressionMiddleware
+from shared.middleware.load_shedding import LoadSheddingMiddleware, get_load_shedding_metrics
+
+__all__ = ["CompressionMiddleware", "LoadSheddingMiddleware", "get_load_shedding_metrics"]
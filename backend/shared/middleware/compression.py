@@ -0,0 +1,249 @@
+"""
+Response compression middleware: brotli (when installed) or gzip
+
+The encoding is negotiated from Accept-Encoding; brotli wins ties because it
+compresses JSON noticeably better at similar CPU cost. Only compressible
+content types are touched, and bodies under the minimum size are sent as they
+are, since the saving would not pay for the CPU or the extra header.
+
+Single-message responses (the usual JSON case) are compressed in one shot
+with an exact Content-Length. Streaming responses are compressed chunk by
+chunk with a sync flush after each chunk, so the client gets data as soon as
+the app produces it. Responses that already carry Content-Encoding, such as
+the precompressed catalogs (shared.utils.precompressed), pass through
+untouched.
+"""
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only without it
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    """Encodings this process can produce, in order of preference"""
+    return (BROTLI, GZIP) if brotli is not None else (GZIP,)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the response encoding for an Accept-Encoding header
+
+    Returns:
+        "br", "gzip" or None (send identity)
+    """
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for encoding in supported_encodings():
+        weight = weights.get(encoding, wildcard)
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class StreamEncoder:
+    """Incremental gzip or brotli encoder"""
+
+    def __init__(self, encoding: str, gzip_level: int = 6, brotli_quality: int = 4):
+        self.encoding = encoding
+        if encoding == BROTLI:
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=31: zlib deflate with a gzip header and trailer
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        """Compress a chunk; flush=True makes everything so far decodable by the client"""
+        if self.encoding == BROTLI:
+            output = self._compressor.process(data)
+            return output + self._compressor.flush() if flush else output
+        output = self._compressor.compress(data)
+        return output + self._compressor.flush(zlib.Z_SYNC_FLUSH) if flush else output
+
+    def finish(self) -> bytes:
+        if self.encoding == BROTLI:
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+def compress_body(body: bytes, encoding: str, gzip_level: int = 6, brotli_quality: int = 4) -> bytes:
+    """One-shot compression of a complete body"""
+    encoder = StreamEncoder(encoding, gzip_level, brotli_quality)
+    return encoder.compress(body) + encoder.finish()
+
+
+def _header(headers: Headers, name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key == name:
+            return value
+    return None
+
+
+def _with_vary(headers: Headers) -> Headers:
+    """Add Accept-Encoding to Vary, keeping values set by other middleware (CORS: Origin)"""
+    vary = _header(headers, b"vary")
+    if vary is None:
+        return headers + [(b"vary", b"Accept-Encoding")]
+    if b"accept-encoding" in vary.lower():
+        return headers
+    return [
+        (key, value + b", Accept-Encoding" if key == b"vary" else value)
+        for key, value in headers
+    ]
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware compressing eligible responses"""
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        enabled: bool = True
+    ):
+        """
+        Args:
+            minimum_size: Smallest body, in bytes, worth compressing
+            gzip_level: zlib level 1-9
+            brotli_quality: brotli quality 0-11 (4-5 suits dynamic responses)
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = None
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+
+        encoding = negotiate_encoding(accept_encoding)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """Per-request send wrapper; decides on the first body message"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Optional[dict] = None
+        self._encoder: Optional[StreamEncoder] = None
+        self._passthrough = False
+
+    async def send(self, message: dict) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            self._passthrough = not self._eligible(message)
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._passthrough:
+            await self._flush_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._encoder is None:
+            headers = [
+                (key, value) for key, value in self._start["headers"] if key != b"content-length"
+            ]
+
+            if not more_body:
+                # Complete body in one message: compress in one shot, or skip if small
+                if len(body) < self.middleware.minimum_size:
+                    self._start["headers"] = _with_vary(list(self._start["headers"]))
+                    await self._flush_start()
+                    await self._send(message)
+                    return
+                compressed = compress_body(
+                    body, self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+                )
+                headers += [
+                    (b"content-encoding", self.encoding.encode("ascii")),
+                    (b"content-length", str(len(compressed)).encode("ascii")),
+                ]
+                self._start["headers"] = _with_vary(headers)
+                await self._flush_start()
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            # Streaming: no Content-Length, compress as chunks arrive
+            self._encoder = StreamEncoder(
+                self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            headers.append((b"content-encoding", self.encoding.encode("ascii")))
+            self._start["headers"] = _with_vary(headers)
+            await self._flush_start()
+
+        chunk = self._encoder.compress(body, flush=more_body)
+        if not more_body:
+            chunk += self._encoder.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _eligible(self, start: dict) -> bool:
+        status = start["status"]
+        if status < 200 or status in (204, 304):
+            return False
+
+        headers = start.get("headers", [])
+        if _header(headers, b"content-encoding") is not None:
+            return False
+
+        content_type = (_header(headers, b"content-type") or b"").decode("latin-1").lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    async def _flush_start(self) -> None:
+        if self._start is not None:
+            await self._send(self._start)
+            self._start = None
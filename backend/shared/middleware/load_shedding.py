@@ -0,0 +1,166 @@
+"""
+Load-shedding (admission control) middleware
+
+Each worker tracks its own in-flight HTTP requests and event-loop lag. When
+either crosses the threshold for a route's priority class, new requests in
+that class get 503 with Retry-After instead of queueing behind work that is
+already late. Critical routes (emergency access, token refresh, probes) are
+always admitted.
+
+Route classes come from LOAD_SHED_ROUTE_PRIORITIES (path prefix -> class,
+longest prefix wins); unlisted paths are "normal".
+"""
+import asyncio
+import json
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+CRITICAL = "critical"
+NORMAL = "normal"
+LOW = "low"
+
+PRIORITY_CLASSES = (CRITICAL, NORMAL, LOW)
+
+
+class LoopLagMonitor:
+    """Measures how late a periodic asyncio.sleep wakes up"""
+
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def ensure_started(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag = max(loop.time() - expected, 0.0)
+            self.max_lag = max(self.max_lag, self.lag)
+
+
+class LoadSheddingMiddleware:
+    """Pure ASGI middleware; rejects low-priority work first when the worker is saturated"""
+
+    def __init__(
+        self,
+        app,
+        route_priorities: Mapping[str, str],
+        in_flight_limits: Mapping[str, int],
+        loop_lag_limits_ms: Mapping[str, float],
+        retry_after_seconds: int = 5,
+        enabled: bool = True
+    ):
+        """
+        Args:
+            route_priorities: Path prefix -> priority class
+            in_flight_limits: Priority class -> in-flight requests at which it is shed
+            loop_lag_limits_ms: Priority class -> event-loop lag at which it is shed
+            retry_after_seconds: Value of the Retry-After header on 503
+        """
+        unknown = set(route_priorities.values()) - set(PRIORITY_CLASSES)
+        if unknown:
+            raise ValueError(f"Unknown load-shedding priority classes: {', '.join(sorted(unknown))}")
+
+        self.app = app
+        self.enabled = enabled
+        self.retry_after_seconds = retry_after_seconds
+        self.in_flight_limits = dict(in_flight_limits)
+        self.loop_lag_limits = {name: limit / 1000 for name, limit in loop_lag_limits_ms.items()}
+        # Longest prefix first so "/api/auth/refresh" beats "/api/auth"
+        self.route_priorities: Tuple[Tuple[str, str], ...] = tuple(
+            sorted(route_priorities.items(), key=lambda item: len(item[0]), reverse=True)
+        )
+
+        self.in_flight = 0
+        self.loop_monitor = LoopLagMonitor()
+        self.admitted: Dict[str, int] = {name: 0 for name in PRIORITY_CLASSES}
+        self.shed: Dict[str, int] = {name: 0 for name in PRIORITY_CLASSES}
+
+        register_load_shedder(self)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        self.loop_monitor.ensure_started()
+        priority = self.classify(scope["path"])
+
+        if scope["method"] != "OPTIONS" and self._should_shed(priority):
+            self.shed[priority] += 1
+            await self._reject(send)
+            return
+
+        self.admitted[priority] += 1
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
+
+    def classify(self, path: str) -> str:
+        """Priority class for a request path"""
+        for prefix, priority in self.route_priorities:
+            if path.startswith(prefix):
+                return priority
+        return NORMAL
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "in_flight": self.in_flight,
+            "loop_lag_ms": round(self.loop_monitor.lag * 1000, 2),
+            "max_loop_lag_ms": round(self.loop_monitor.max_lag * 1000, 2),
+            "admitted": dict(self.admitted),
+            "shed": dict(self.shed),
+        }
+
+    def _should_shed(self, priority: str) -> bool:
+        if priority == CRITICAL:
+            return False
+
+        in_flight_limit = self.in_flight_limits.get(priority)
+        if in_flight_limit is not None and self.in_flight >= in_flight_limit:
+            return True
+
+        lag_limit = self.loop_lag_limits.get(priority)
+        return lag_limit is not None and self.loop_monitor.lag >= lag_limit
+
+    async def _reject(self, send) -> None:
+        body = json.dumps({
+            "error": "Service Unavailable",
+            "message": "Server is busy, please retry shortly",
+            "retry_after": self.retry_after_seconds,
+        }).encode("utf-8")
+
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"retry-after", str(self.retry_after_seconds).encode("ascii")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+# Starlette builds the middleware stack lazily; keep a handle for /health/load
+_load_shedder: Optional[LoadSheddingMiddleware] = None
+
+
+def register_load_shedder(middleware: LoadSheddingMiddleware) -> None:
+    global _load_shedder
+    _load_shedder = middleware
+
+
+def get_load_shedding_metrics() -> Dict[str, Any]:
+    """Admission counters, in-flight requests and loop lag for this worker"""
+    if _load_shedder is None:
+        return {"enabled": False}
+    return _load_shedder.metrics()
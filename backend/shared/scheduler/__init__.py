@@ -0,0 +1,69 @@
+"""
+Background job scheduler
+
+Started and stopped by the FastAPI lifespan in main.py:
+
+    scheduler = get_scheduler()
+    scheduler.add_periodic("sessions.cleanup", cleanup_expired_sessions_job,
+                           interval=3600, jitter=60, singleton=True)
+    await scheduler.start()
+"""
+from typing import Optional
+
+from shared.scheduler.jobs import Job, JobMetrics
+from shared.scheduler.leader import AdvisoryLockLeader, LeaderElector
+from shared.scheduler.scheduler import Scheduler
+
+# Global instance storage
+_scheduler_instance: Optional[Scheduler] = None
+
+
+def _build_scheduler() -> Scheduler:
+    from sqlalchemy import create_engine, make_url
+    from sqlalchemy.pool import NullPool
+
+    from shared.config.settings import settings
+
+    if make_url(settings.DATABASE_URL).get_backend_name() == "postgresql":
+        # Unpooled engine: the leader's long-held connection stays out of the
+        # request pool and its /health/db-pools numbers
+        election_engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+        leader = AdvisoryLockLeader(election_engine, settings.SCHEDULER_LEADER_LOCK_ID)
+    else:
+        leader = LeaderElector()
+
+    return Scheduler(leader, leader_refresh_seconds=settings.SCHEDULER_LEADER_REFRESH_SECONDS)
+
+
+def get_scheduler() -> Scheduler:
+    """
+    Get or create the singleton scheduler
+
+    Returns:
+        Scheduler: The scheduler for this worker process
+    """
+    global _scheduler_instance
+
+    if _scheduler_instance is None:
+        _scheduler_instance = _build_scheduler()
+
+    return _scheduler_instance
+
+
+def reset_scheduler() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _scheduler_instance
+    _scheduler_instance = None
+
+
+__all__ = [
+    "Job",
+    "JobMetrics",
+    "LeaderElector",
+    "AdvisoryLockLeader",
+    "Scheduler",
+    "get_scheduler",
+    "reset_scheduler",
+]
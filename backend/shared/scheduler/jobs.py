@@ -0,0 +1,71 @@
+"""
+Job definitions and per-job metrics
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass
+class JobMetrics:
+    """Counters for one job; durations and lag are in seconds"""
+    runs: int = 0
+    failures: int = 0
+    skipped_overlap: int = 0
+    skipped_not_leader: int = 0
+    last_started_at: Optional[float] = None
+    last_duration: Optional[float] = None
+    max_duration: float = 0.0
+    total_duration: float = 0.0
+    last_lag: Optional[float] = None
+    max_lag: float = 0.0
+    last_error: Optional[str] = None
+
+    def record_run(self, duration: float, error: Optional[BaseException]) -> None:
+        self.runs += 1
+        self.last_duration = duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_duration += duration
+        if error is not None:
+            self.failures += 1
+            self.last_error = f"{type(error).__name__}: {error}"
+
+    def record_lag(self, lag: float) -> None:
+        self.last_lag = lag
+        self.max_lag = max(self.max_lag, lag)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "skipped_overlap": self.skipped_overlap,
+            "skipped_not_leader": self.skipped_not_leader,
+            "last_started_at": self.last_started_at,
+            "last_duration": self.last_duration,
+            "avg_duration": self.total_duration / self.runs if self.runs else None,
+            "max_duration": self.max_duration,
+            "last_lag": self.last_lag,
+            "max_lag": self.max_lag,
+            "last_error": self.last_error,
+        }
+
+
+@dataclass
+class Job:
+    """
+    A scheduled unit of work
+
+    func may be a coroutine function or a plain function; plain functions run
+    in a worker thread so blocking database work never stalls the event loop.
+    """
+    name: str
+    func: Callable[[], Any]
+    interval: Optional[float] = None  # None for one-shot jobs
+    delay: float = 0.0  # First run after this many seconds
+    jitter: float = 0.0  # Random extra delay per run, spreads workers apart
+    max_concurrency: int = 1  # Overlapping runs beyond this are skipped
+    singleton: bool = False  # Only the leader worker runs it
+    metrics: JobMetrics = field(default_factory=JobMetrics)
+
+    @property
+    def is_periodic(self) -> bool:
+        return self.interval is not None
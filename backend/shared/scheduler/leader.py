@@ -0,0 +1,105 @@
+"""
+Leader election across workers with a Postgres session-level advisory lock
+
+The leader keeps one dedicated connection open while it holds the lock. If
+that connection dies, Postgres releases the lock and another worker takes
+over on its next refresh. Other workers connect only for each attempt.
+Give AdvisoryLockLeader an engine with NullPool so these connections never
+come from the request pool.
+"""
+import logging
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElector:
+    """Always-leader elector, used for single-process and non-Postgres setups"""
+
+    def refresh(self) -> bool:
+        """Acquire or confirm leadership; returns the current status"""
+        return True
+
+    @property
+    def is_leader(self) -> bool:
+        return True
+
+    def release(self) -> None:
+        pass
+
+
+class AdvisoryLockLeader(LeaderElector):
+    """Leader election through pg_try_advisory_lock; refresh() blocks, run it off the loop"""
+
+    def __init__(self, engine: Engine, lock_id: int):
+        self.engine = engine
+        self.lock_id = lock_id
+        self._connection: Optional[Connection] = None
+        self._is_leader = False
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    def refresh(self) -> bool:
+        try:
+            if self._is_leader:
+                # Cheap liveness check; a dead connection means the lock is gone
+                self._connection.execute(text("SELECT 1"))
+                return True
+
+            if self._connection is None:
+                self._connection = self.engine.connect()
+
+            acquired = self._connection.execute(
+                text("SELECT pg_try_advisory_lock(:lock_id)"),
+                {"lock_id": self.lock_id}
+            ).scalar()
+            # Session-level lock: end the implicit transaction, keep the connection
+            self._connection.commit()
+
+            if not acquired:
+                # Do not hold a connection while another worker leads
+                self._drop_connection()
+                return False
+
+            logger.info("Scheduler leadership acquired (advisory lock %s)", self.lock_id)
+            self._is_leader = True
+        except Exception as e:
+            if self._is_leader:
+                logger.warning("Scheduler leadership lost: %s", e)
+            else:
+                logger.debug("Scheduler leader election failed: %s", e)
+            self._drop_connection()
+
+        return self._is_leader
+
+    def release(self) -> None:
+        if self._connection is None:
+            return
+
+        try:
+            if self._is_leader:
+                self._connection.execute(
+                    text("SELECT pg_advisory_unlock(:lock_id)"),
+                    {"lock_id": self.lock_id}
+                )
+                self._connection.commit()
+        except Exception as e:
+            logger.warning("Could not release scheduler advisory lock: %s", e)
+        finally:
+            self._drop_connection()
+
+    def _drop_connection(self) -> None:
+        self._is_leader = False
+        if self._connection is not None:
+            try:
+                # invalidate() so a possibly lock-holding connection is never reused from the pool
+                self._connection.invalidate()
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
@@ -0,0 +1,199 @@
+"""
+Asyncio job scheduler run inside each API worker
+
+Every worker runs the scheduler. Jobs marked singleton only execute on the
+worker that currently holds the leader lock; the others skip those ticks.
+Periodic jobs keep a fixed cadence: a slow run does not push back the next
+due time, and a run that would exceed max_concurrency is skipped instead of
+queued.
+"""
+import asyncio
+import inspect
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from shared.scheduler.jobs import Job
+from shared.scheduler.leader import LeaderElector
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler:
+    """Periodic and one-shot jobs on the running event loop"""
+
+    def __init__(self, leader: Optional[LeaderElector] = None, leader_refresh_seconds: float = 15.0):
+        self.leader = leader or LeaderElector()
+        self.leader_refresh_seconds = leader_refresh_seconds
+        self._jobs: Dict[str, Job] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._loops: List[asyncio.Task] = []
+        self._running: Set[asyncio.Task] = set()
+        self._started = False
+
+    @property
+    def jobs(self) -> Dict[str, Job]:
+        return dict(self._jobs)
+
+    def add_periodic(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval: float,
+        delay: Optional[float] = None,
+        jitter: float = 0.0,
+        max_concurrency: int = 1,
+        singleton: bool = False
+    ) -> Job:
+        """
+        Run func every interval seconds
+
+        Args:
+            delay: Seconds before the first run (default: one interval)
+            jitter: Up to this many random extra seconds before each run
+            max_concurrency: Runs allowed to overlap; further ticks are skipped
+            singleton: Only run on the leader worker
+        """
+        job = Job(
+            name=name,
+            func=func,
+            interval=interval,
+            delay=interval if delay is None else delay,
+            jitter=jitter,
+            max_concurrency=max_concurrency,
+            singleton=singleton,
+        )
+        return self._add(job)
+
+    def add_one_shot(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        delay: float = 0.0,
+        jitter: float = 0.0,
+        singleton: bool = False
+    ) -> Job:
+        """Run func once, delay seconds from start (or from now if already started)"""
+        job = Job(name=name, func=func, delay=delay, jitter=jitter, singleton=singleton)
+        return self._add(job)
+
+    async def start(self) -> None:
+        """Start every registered job and the leader refresh loop"""
+        if self._started:
+            return
+        self._started = True
+
+        await asyncio.to_thread(self.leader.refresh)
+        self._loops.append(asyncio.create_task(self._leader_loop(), name="scheduler:leader"))
+
+        for job in self._jobs.values():
+            self._start_job(job)
+
+        logger.info("Scheduler started with %d jobs (leader=%s)", len(self._jobs), self.leader.is_leader)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Stop scheduling, wait up to timeout for running jobs, then release leadership"""
+        if not self._started:
+            return
+        self._started = False
+
+        for task in self._loops:
+            task.cancel()
+        await asyncio.gather(*self._loops, return_exceptions=True)
+        self._loops.clear()
+
+        if self._running:
+            done, pending = await asyncio.wait(set(self._running), timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        await asyncio.to_thread(self.leader.release)
+        logger.info("Scheduler stopped")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-job counters plus leader status"""
+        return {
+            "running": self._started,
+            "is_leader": self.leader.is_leader,
+            "jobs": {
+                name: {
+                    "interval": job.interval,
+                    "singleton": job.singleton,
+                    "in_flight": self._in_flight[name],
+                    **job.metrics.to_dict(),
+                }
+                for name, job in self._jobs.items()
+            },
+        }
+
+    def _add(self, job: Job) -> Job:
+        if job.name in self._jobs:
+            raise ValueError(f"Job already registered: {job.name}")
+
+        self._jobs[job.name] = job
+        self._in_flight[job.name] = 0
+        if self._started:
+            self._start_job(job)
+        return job
+
+    def _start_job(self, job: Job) -> None:
+        self._loops.append(asyncio.create_task(self._job_loop(job), name=f"scheduler:{job.name}"))
+
+    async def _job_loop(self, job: Job) -> None:
+        due = time.monotonic() + job.delay
+
+        while True:
+            target = due + (random.uniform(0, job.jitter) if job.jitter else 0.0)
+            await asyncio.sleep(max(target - time.monotonic(), 0.0))
+            self._dispatch(job, lag=time.monotonic() - target)
+
+            if not job.is_periodic:
+                return
+
+            # Fixed cadence; if we fell more than one interval behind, skip the missed ticks
+            due += job.interval
+            now = time.monotonic()
+            if due < now:
+                due += ((now - due) // job.interval + 1) * job.interval
+
+    def _dispatch(self, job: Job, lag: float) -> None:
+        job.metrics.record_lag(lag)
+
+        if job.singleton and not self.leader.is_leader:
+            job.metrics.skipped_not_leader += 1
+            return
+
+        if self._in_flight[job.name] >= job.max_concurrency:
+            job.metrics.skipped_overlap += 1
+            logger.warning("Skipping %s: %d run(s) still in progress", job.name, self._in_flight[job.name])
+            return
+
+        self._in_flight[job.name] += 1
+        task = asyncio.create_task(self._run(job), name=f"scheduler:{job.name}:run")
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, job: Job) -> None:
+        job.metrics.last_started_at = time.time()
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            if inspect.iscoroutinefunction(job.func):
+                await job.func()
+            else:
+                await asyncio.to_thread(job.func)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+            logger.exception("Scheduled job %s failed", job.name)
+        finally:
+            self._in_flight[job.name] -= 1
+            job.metrics.record_run(time.perf_counter() - started, error)
+
+    async def _leader_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.leader_refresh_seconds)
+            await asyncio.to_thread(self.leader.refresh)
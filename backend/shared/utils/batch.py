@@ -0,0 +1,103 @@
+"""
+Request and response DTOs for batch write endpoints
+
+    POST /api/medications/batch
+    {"create": [{...}, ...], "update": [{"id": 7, "dosage": "50 mg"}], "delete": [9]}
+
+The whole body is validated before anything is written (422 with the
+failing item's index in loc otherwise). Valid batches are applied in one
+transaction by shared.database.batch_writes.apply_batch_write, and every
+item gets its own result: 201 created, 200 updated, 204 deleted or 404 when
+an update or delete targets a record the patient does not have.
+"""
+from collections import Counter
+from typing import Generic, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, Field, model_validator
+
+from shared.database.batch_writes import BatchWrite, BatchWriteResult
+
+# Most items (creates + updates + deletes) one batch may carry
+MAX_BATCH_ITEMS = 100
+
+C = TypeVar("C", bound=BaseModel)
+U = TypeVar("U", bound=BaseModel)
+T = TypeVar("T", bound=BaseModel)
+
+
+class BatchRequestDTO(BaseModel, Generic[C, U]):
+    """Creates, updates (each with its record id) and ids to delete"""
+    create: List[C] = Field(default_factory=list)
+    update: List[U] = Field(default_factory=list)
+    delete: List[int] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def check_items(self):
+        total = len(self.create) + len(self.update) + len(self.delete)
+        if total == 0:
+            raise ValueError("Batch is empty")
+        if total > MAX_BATCH_ITEMS:
+            raise ValueError(f"Batch has {total} items, the maximum is {MAX_BATCH_ITEMS}")
+
+        counts = Counter([item.id for item in self.update] + self.delete)
+        repeated = sorted(record_id for record_id, count in counts.items() if count > 1)
+        if repeated:
+            raise ValueError(f"Records appear more than once: {', '.join(map(str, repeated))}")
+        return self
+
+    def to_batch_write(self) -> BatchWrite:
+        """Plain values for the repository; updates carry only the fields sent"""
+        return BatchWrite(
+            creates=[item.model_dump() for item in self.create],
+            updates={item.id: item.model_dump(exclude_unset=True, exclude={"id"}) for item in self.update},
+            deletes=list(self.delete),
+        )
+
+
+class BatchItemResultDTO(BaseModel, Generic[T]):
+    """Outcome of one item; index is its position in the request list"""
+    index: int
+    status: int
+    id: Optional[int] = None
+    item: Optional[T] = None
+    error: Optional[str] = None
+
+
+class BatchResultDTO(BaseModel, Generic[T]):
+    """Per-item outcomes, in the order of the request lists"""
+    created: List[BatchItemResultDTO[T]] = []
+    updated: List[BatchItemResultDTO[T]] = []
+    deleted: List[BatchItemResultDTO[T]] = []
+
+
+def build_batch_result(
+    request: BatchRequestDTO,
+    result: BatchWriteResult,
+    dto_class: Type[T]
+) -> BatchResultDTO[T]:
+    """Map a BatchWriteResult back onto the request's items"""
+    created = [
+        BatchItemResultDTO[dto_class](
+            index=index, status=201, id=record.id, item=dto_class.model_validate(record, from_attributes=True)
+        )
+        for index, record in enumerate(result.created)
+    ]
+
+    updated = []
+    for index, item in enumerate(request.update):
+        record = result.updated.get(item.id)
+        if record is None:
+            updated.append(BatchItemResultDTO[dto_class](index=index, status=404, id=item.id, error="Not found"))
+        else:
+            updated.append(BatchItemResultDTO[dto_class](
+                index=index, status=200, id=item.id, item=dto_class.model_validate(record, from_attributes=True)
+            ))
+
+    deleted = [
+        BatchItemResultDTO[dto_class](index=index, status=204, id=record_id)
+        if record_id in result.deleted
+        else BatchItemResultDTO[dto_class](index=index, status=404, id=record_id, error="Not found")
+        for index, record_id in enumerate(request.delete)
+    ]
+
+    return BatchResultDTO[dto_class](created=created, updated=updated, deleted=deleted)
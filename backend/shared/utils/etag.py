@@ -0,0 +1,91 @@
+"""
+ETag helpers for conditional requests
+
+ETags are weak (W/"...") because they are computed from the JSON
+representation of a read model or from version stamps, not from the exact
+response bytes.
+
+Patient-scoped GET endpoints derive the ETag from version stamps
+(shared.database.version_stamps) and call not_modified() before building any
+DTO:
+
+    etag = version_etag("medications", patient.id, request.url.query, *stamp)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+"""
+import hashlib
+import json
+from typing import Any, Optional, Set
+
+from fastapi import Request, Response
+
+# Clients may store patient data but must revalidate it on every use
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def compute_etag(data: Any) -> str:
+    """
+    Compute a weak ETag for JSON-compatible data
+
+    Args:
+        data: JSON-compatible value (run it through jsonable_encoder first)
+
+    Returns:
+        Weak ETag string, e.g. W/"3f2a9c0d1b7e4a65"
+    """
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return 'W/"' + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16] + '"'
+
+
+def parse_if_none_match(header: Optional[str]) -> Set[str]:
+    """
+    Parse an If-None-Match header into a set of ETags
+
+    Strong and weak forms of the same tag are both returned, since
+    If-None-Match uses weak comparison.
+    """
+    if not header:
+        return set()
+
+    etags = set()
+    for raw in header.split(","):
+        tag = raw.strip()
+        if not tag:
+            continue
+        opaque = tag[2:] if tag.startswith("W/") else tag
+        etags.add(opaque)
+        etags.add("W/" + opaque)
+    return etags
+
+
+def version_etag(*parts: Any) -> str:
+    """
+    Compute a weak ETag from version stamp parts
+
+    Args:
+        parts: Resource name, scope (patient id, query string) and stamp values
+
+    Returns:
+        Weak ETag string
+    """
+    canonical = "|".join("" if part is None else str(part) for part in parts)
+    return 'W/"' + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16] + '"'
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Answer a conditional GET
+
+    Sets ETag and Cache-Control on the response the endpoint will return.
+
+    Returns:
+        A 304 response if If-None-Match already holds etag, otherwise None
+    """
+    headers = {"ETag": etag, "Cache-Control": PRIVATE_REVALIDATE}
+    response.headers.update(headers)
+
+    header = request.headers.get("if-none-match")
+    if header and (header.strip() == "*" or etag in parse_if_none_match(header)):
+        return Response(status_code=304, headers=headers)
+    return None
@@ -0,0 +1,85 @@
+"""
+Fast JSON responses
+
+FastJSONResponse is the app-wide default response class. It renders with
+orjson (a main dependency in pyproject.toml) and falls back to the standard
+library with Starlette's settings if it is missing, e.g. in a bare dev
+environment, so the output is valid JSON either way.
+
+trusted_response() is the fast path for endpoints whose use case already
+returns the validated response DTO. For a route with response_model, FastAPI
+dumps the returned model to a dict, validates that dict against the
+response_model again, and then encodes it. Here pydantic-core serializes the
+model straight to JSON bytes, once. Keep response_model on the route: it still
+documents the schema in OpenAPI.
+
+    @router.get("/extended", response_model=ExtendedPatientProfileDTO)
+    async def get_extended_profile(...):
+        return trusted_response(use_case.get_extended_profile(user_id), response)
+"""
+import json
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # Declared dependency; stdlib json keeps bare environments working
+    orjson = None
+
+# Headers that belong to the body, not to the endpoint's sub-response
+_BODY_HEADERS = {b"content-length", b"content-type"}
+
+
+def dumps(content: Any) -> bytes:
+    """Encode JSON-compatible content to bytes"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def trusted_response(
+    model: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200
+) -> Response:
+    """
+    Serialize an already-validated DTO (or list of DTOs) without re-validation
+
+    Only use it when the value is an instance of the route's response_model:
+    no field filtering happens here.
+
+    Args:
+        model: Pydantic model, or list of models, to send as is
+        response: The endpoint's injected Response, whose headers (ETag,
+            Cache-Control, cookies) are carried over
+        status_code: HTTP status code
+
+    Returns:
+        Response with the JSON body
+    """
+    if not isinstance(model, (BaseModel, list)):
+        raise TypeError(f"trusted_response expects a Pydantic model, got {type(model).__name__}")
+
+    result = Response(
+        content=to_json(model, by_alias=True),
+        status_code=status_code,
+        media_type="application/json"
+    )
+    if response is not None:
+        result.raw_headers.extend(
+            (key, value) for key, value in response.raw_headers if key not in _BODY_HEADERS
+        )
+    return result
@@ -0,0 +1,122 @@
+"""
+Keyset (cursor) pagination helpers for patient-scoped list endpoints
+
+Pages are ordered by (created_at DESC, id DESC) and the cursor encodes the
+last row's (created_at, id), so every page is a bounded index range scan
+no matter how deep the client paginates.
+"""
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query
+
+from shared.exceptions.application_exceptions import ValidationException
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Fields always selected in sparse mode because the cursor is built from them
+CURSOR_FIELDS = ("id", "created_at")
+
+
+@dataclass
+class KeysetPage:
+    """One page of rows plus the cursor for the next page"""
+    items: List[Any]
+    next_cursor: Optional[str] = None
+
+
+class CursorPageDTO(BaseModel):
+    """Paginated list response"""
+    items: List[Any]
+    next_cursor: Optional[str] = None
+    limit: int
+
+
+def encode_cursor(created_at: datetime, record_id: int) -> str:
+    """Encode the position of a row as an opaque cursor"""
+    raw = f"{created_at.isoformat()}|{record_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode an opaque cursor
+
+    Raises:
+        ValidationException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = base64.urlsafe_b64decode(padded).decode("utf-8").rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValidationException(f"Invalid cursor: {cursor}") from e
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated sparse field selection
+
+    Returns:
+        Ordered list of fields including the cursor fields, or None for all fields
+
+    Raises:
+        ValidationException: If an unknown field is requested
+    """
+    if not fields:
+        return None
+
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = sorted(set(requested) - set(allowed))
+    if unknown:
+        raise ValidationException(f"Unknown fields: {', '.join(unknown)}")
+
+    selected = list(CURSOR_FIELDS)
+    selected.extend(field for field in requested if field not in selected)
+    return selected
+
+
+def paginate_keyset(
+    query: Query,
+    model: Any,
+    limit: int,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> KeysetPage:
+    """
+    Apply keyset pagination on (created_at, id) to a filtered query
+
+    Args:
+        query: Query already filtered by patient, without ORDER BY
+        model: SQLAlchemy model with created_at and id columns
+        limit: Page size
+        cursor: Cursor returned by the previous page
+        fields: Column names to select instead of full entities
+
+    Returns:
+        KeysetPage with ORM entities, or plain dicts when fields are given
+    """
+    if fields:
+        query = query.with_entities(*[getattr(model, field) for field in fields])
+
+    if cursor:
+        created_at, record_id = decode_cursor(cursor)
+        query = query.filter(tuple_(model.created_at, model.id) < (created_at, record_id))
+
+    # Fetch one extra row to know whether another page exists
+    rows = query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    if fields:
+        rows = [dict(row._mapping) for row in rows]
+
+    return KeysetPage(items=rows, next_cursor=next_cursor)
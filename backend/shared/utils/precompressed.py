@@ -0,0 +1,120 @@
+"""
+Precompressed in-memory responses for static catalogs
+
+Catalogs such as countries and document types are identical for every
+caller and change only when the data does. Their JSON body is compressed once
+per encoding, at the highest level since it is a one-off cost, and the
+variants are kept per worker. Later requests pick a variant by
+Accept-Encoding and get Content-Encoding set, which makes CompressionMiddleware
+pass them through, so a hot catalog is never compressed twice.
+
+Entries are keyed by name and rebuilt only when the body bytes change, so
+they follow the catalog's own cache (shared.cache) without a separate
+invalidation path.
+"""
+import hashlib
+import threading
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+from shared.middleware.compression import compress_body, negotiate_encoding, supported_encodings
+from shared.utils.etag import parse_if_none_match
+
+# One-off cost per catalog change, so use the best ratio
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+class PrecompressedBody:
+    """A JSON body with its ETag and compressed variants"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = 'W/"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        self.variants: Dict[str, bytes] = {
+            encoding: compress_body(body, encoding, GZIP_LEVEL, BROTLI_QUALITY)
+            for encoding in supported_encodings()
+        }
+
+
+class PrecompressedStore:
+    """Per-worker store of precompressed bodies by catalog name"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, PrecompressedBody] = {}
+        self.builds = 0
+
+    def get(self, key: str, body: bytes) -> PrecompressedBody:
+        """Entry for key, rebuilt only if body differs from the stored one"""
+        entry = self._entries.get(key)
+        if entry is not None and entry.body == body:
+            return entry
+
+        entry = PrecompressedBody(body)
+        with self._lock:
+            self._entries[key] = entry
+            self.builds += 1
+        return entry
+
+    def stats(self) -> Dict[str, int]:
+        return {"entries": len(self._entries), "builds": self.builds}
+
+
+# Global instance storage
+_precompressed_store_instance: Optional[PrecompressedStore] = None
+
+
+def get_precompressed_store() -> PrecompressedStore:
+    """
+    Get or create the singleton precompressed response store
+
+    Returns:
+        PrecompressedStore: The process-wide store
+    """
+    global _precompressed_store_instance
+
+    if _precompressed_store_instance is None:
+        _precompressed_store_instance = PrecompressedStore()
+    return _precompressed_store_instance
+
+
+def reset_precompressed_store() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _precompressed_store_instance
+    _precompressed_store_instance = None
+
+
+def precompressed_json_response(
+    request: Request,
+    key: str,
+    body: bytes,
+    cache_control: str
+) -> Response:
+    """
+    Serve a catalog body from its precompressed variants
+
+    Args:
+        request: Incoming request (Accept-Encoding, If-None-Match)
+        key: Catalog name, e.g. "countries:active"
+        body: Current JSON body
+        cache_control: Cache-Control header value
+
+    Returns:
+        200 with the best encoding for the client, or 304 if its ETag matches
+    """
+    entry = get_precompressed_store().get(key, body)
+    headers = {"ETag": entry.etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+
+    if entry.etag in parse_if_none_match(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoding is None:
+        return Response(content=entry.body, headers=headers, media_type="application/json")
+
+    headers["Content-Encoding"] = encoding
+    return Response(content=entry.variants[encoding], headers=headers, media_type="application/json")
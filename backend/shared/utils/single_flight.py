@@ -0,0 +1,68 @@
+"""
+Single-flight coalescing for concurrent identical work
+
+    flight = SingleFlight("emergency_data")
+    result = await flight.do(qr_code, lambda: run_in_threadpool(load, qr_code))
+
+While a call for a key is in flight, later calls with the same key await it
+and get its result, or its exception, instead of starting their own. The
+work runs as its own task, so a caller that disconnects does not cancel it
+for the others. Coalescing is per worker process.
+
+The work must yield to the event loop (e.g. blocking queries moved to a
+thread), otherwise no duplicate can arrive while it runs.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Per-key coalescing of concurrent async calls"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.executions = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run func for key, or join the run already in flight for it
+
+        Args:
+            key: Identifies identical work (QR code, token digest, ...)
+            func: Starts the work; only called when nothing is in flight for key
+
+        Returns:
+            The shared result; exceptions are re-raised to every caller
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        # Cancelling one caller must not cancel the shared work
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight(),
+        }
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every caller went away
+        if not task.cancelled():
+            task.exception()
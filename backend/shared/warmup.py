@@ -0,0 +1,253 @@
+"""
+Startup warm-up and readiness
+
+The lifespan starts run_warmup() in the background right after the worker
+boots. /health (liveness) answers immediately. /ready returns 503 until every
+required step has succeeded, so traffic only reaches warm workers. Failed
+required steps are retried (the database may still be starting). Optional
+steps that fail, or whose libraries are not installed, are recorded and do
+not block readiness.
+
+Readiness is per worker, but a container health check reaches whichever
+worker accepts the connection. With WARMUP_READY_DIR set, each warm worker
+writes a marker file named after its pid there, and /ready also waits until
+WARMUP_EXPECTED_WORKERS live workers have done so.
+"""
+import asyncio
+import importlib
+import inspect
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupStep:
+    """One warm-up action; plain functions run in a worker thread"""
+    name: str
+    func: Callable[[], Any]
+    required: bool = True
+    timeout: float = 15.0
+
+
+@dataclass
+class StepResult:
+    ok: bool
+    duration: float
+    attempts: int
+    error: Optional[str] = None
+    skipped: bool = False
+
+
+@dataclass
+class ReadinessState:
+    """Warm-up progress for this worker"""
+    ready: bool = False
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    results: Dict[str, StepResult] = field(default_factory=dict)
+    # Directory shared by the container's workers; None = per-worker readiness only
+    marker_dir: Optional[str] = None
+    expected_workers: int = 1
+
+    def mark_ready(self) -> None:
+        """Mark this worker ready and publish its marker to the other workers"""
+        self.ready = True
+        if self.marker_dir:
+            try:
+                os.makedirs(self.marker_dir, exist_ok=True)
+                with open(self._marker_path(), "w") as marker:
+                    marker.write(str(self.completed_at or time.time()))
+            except OSError as e:
+                logger.error("Could not write readiness marker in %s: %s", self.marker_dir, e)
+
+    def clear_marker(self) -> None:
+        if self.marker_dir:
+            try:
+                os.remove(self._marker_path())
+            except OSError:
+                pass
+
+    def ready_workers(self) -> int:
+        """Live workers in this container that have finished warm-up"""
+        if not self.marker_dir:
+            return 1 if self.ready else 0
+        try:
+            names = os.listdir(self.marker_dir)
+        except OSError:
+            return 0
+        return sum(1 for name in names if name.isdigit() and _pid_alive(int(name)))
+
+    def container_ready(self) -> bool:
+        return self.ready and self.ready_workers() >= self.expected_workers
+
+    def _marker_path(self) -> str:
+        return os.path.join(self.marker_dir, str(os.getpid()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ready": self.container_ready(),
+            "worker_ready": self.ready,
+            "workers_ready": self.ready_workers(),
+            "workers_expected": self.expected_workers,
+            "warmup_seconds": (
+                round(self.completed_at - self.started_at, 3)
+                if self.started_at and self.completed_at else None
+            ),
+            "steps": {
+                name: {
+                    "ok": result.ok,
+                    "skipped": result.skipped,
+                    "duration_ms": round(result.duration * 1000, 1),
+                    "attempts": result.attempts,
+                    "error": result.error,
+                }
+                for name, result in self.results.items()
+            },
+        }
+
+
+async def run_warmup(
+    steps: Iterable[WarmupStep],
+    state: ReadinessState,
+    retry_seconds: float = 5.0
+) -> None:
+    """
+    Run warm-up steps in order and mark the worker ready
+
+    Optional steps run once. Required steps are retried every retry_seconds
+    until they all succeed.
+    """
+    steps = list(steps)
+    state.started_at = time.time()
+    pending: List[WarmupStep] = steps
+
+    while True:
+        for step in pending:
+            state.results[step.name] = await _run_step(step, state.results.get(step.name))
+
+        pending = [step for step in steps if step.required and not state.results[step.name].ok]
+        if not pending:
+            break
+
+        logger.warning(
+            "Warm-up incomplete (%s), retrying in %ss",
+            ", ".join(step.name for step in pending), retry_seconds
+        )
+        await asyncio.sleep(retry_seconds)
+
+    state.completed_at = time.time()
+    state.mark_ready()
+    logger.info("Warm-up finished in %.2fs", state.completed_at - state.started_at)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process exists, so markers left by a crashed worker are ignored"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+async def _run_step(step: WarmupStep, previous: Optional[StepResult]) -> StepResult:
+    attempts = (previous.attempts if previous else 0) + 1
+    started = time.perf_counter()
+    try:
+        if inspect.iscoroutinefunction(step.func):
+            await asyncio.wait_for(step.func(), step.timeout)
+        else:
+            await asyncio.wait_for(asyncio.to_thread(step.func), step.timeout)
+        return StepResult(ok=True, duration=time.perf_counter() - started, attempts=attempts)
+    except ImportError as e:
+        # Optional dependency not installed in this image; nothing to warm
+        return StepResult(
+            ok=not step.required,
+            skipped=True,
+            duration=time.perf_counter() - started,
+            attempts=attempts,
+            error=str(e),
+        )
+    except Exception as e:
+        logger.warning("Warm-up step %s failed: %s", step.name, e)
+        return StepResult(
+            ok=False,
+            duration=time.perf_counter() - started,
+            attempts=attempts,
+            # /ready is public: report the exception type only, details are in the log
+            error=type(e).__name__,
+        )
+
+
+def prime_pool(engine: Engine, connections: int) -> None:
+    """Open `connections` pool connections at once so they are all established and pinged"""
+    opened = []
+    try:
+        for _ in range(connections):
+            connection = engine.connect()
+            opened.append(connection)
+            connection.execute(text("SELECT 1"))
+    finally:
+        for connection in opened:
+            connection.close()
+
+
+def warm_imports(modules: Iterable[str]) -> None:
+    """
+    Import modules that are otherwise loaded lazily on first use
+
+    Raises:
+        ImportError: If any module is missing (the step is then reported as skipped)
+    """
+    missing = []
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            missing.append(module)
+
+    if missing:
+        raise ImportError(f"Not installed: {', '.join(missing)}")
+
+
+# Global instance storage
+_readiness_state: Optional[ReadinessState] = None
+
+
+def get_readiness() -> ReadinessState:
+    """
+    Get or create this worker's readiness state
+
+    Returns:
+        ReadinessState: Warm-up progress shared by the lifespan and /ready
+    """
+    global _readiness_state
+
+    if _readiness_state is None:
+        from shared.config.settings import settings
+
+        _readiness_state = ReadinessState(
+            marker_dir=settings.WARMUP_READY_DIR,
+            expected_workers=settings.WARMUP_EXPECTED_WORKERS,
+        )
+
+    return _readiness_state
+
+
+def reset_readiness() -> None:
+    """
+    Drop this worker's marker and reset the singleton instance (shutdown, tests)
+    """
+    global _readiness_state
+    if _readiness_state is not None:
+        _readiness_state.clear_marker()
+    _readiness_state = None
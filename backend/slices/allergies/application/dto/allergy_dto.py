@@ -5,6 +5,8 @@ from datetime import datetime, date
 from typing import Optional
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
+from shared.utils.batch import BatchRequestDTO
+
 
 class CreateAllergyDTO(BaseModel):
     """DTO for creating a new allergy"""
@@ -24,6 +26,15 @@ class UpdateAllergyDTO(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes")
 
 
+class AllergyBatchUpdateDTO(UpdateAllergyDTO):
+    """Update item of an allergy batch: the record id plus the fields to change"""
+    id: int
+
+
+class AllergyBatchDTO(BatchRequestDTO[CreateAllergyDTO, AllergyBatchUpdateDTO]):
+    """DTO for creating, updating and deleting allergies in one request"""
+
+
 class PatientAllergyDTO(BaseModel):
     """DTO for allergy response with UUID string serialization"""
     id: int
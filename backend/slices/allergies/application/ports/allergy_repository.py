@@ -2,10 +2,12 @@
 Allergy repository port interface
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from slices.allergies.domain.models.allergy_model import PatientAllergy
+from shared.database.batch_writes import BatchWrite, BatchWriteResult
+from shared.utils.pagination import KeysetPage
 
 
 class AllergyRepositoryPort(ABC):
@@ -16,6 +18,22 @@ class AllergyRepositoryPort(ABC):
         """Get all allergies for a specific patient"""
         pass
 
+    @abstractmethod
+    async def get_allergies_page_by_patient_id(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> KeysetPage:
+        """Get one keyset page of allergies for a specific patient"""
+        pass
+
+    @abstractmethod
+    async def get_version_stamp(self, patient_id: UUID) -> Tuple:
+        """Version stamp of a patient's allergies: changes on every create, update or delete"""
+        pass
+
     @abstractmethod
     async def get_allergy_by_id(self, allergy_id: int, patient_id: UUID) -> Optional[PatientAllergy]:
         """Get a specific allergy by ID with patient ownership verification"""
@@ -34,4 +52,9 @@ class AllergyRepositoryPort(ABC):
     @abstractmethod
     async def delete_allergy(self, allergy_id: int, patient_id: UUID) -> bool:
         """Delete an allergy record with patient ownership verification"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def apply_batch(self, patient_id: UUID, batch: BatchWrite) -> BatchWriteResult[PatientAllergy]:
+        """Apply creates, updates and deletes of a patient's allergies in one transaction"""
+        pass
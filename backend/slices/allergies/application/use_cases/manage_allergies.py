@@ -1,7 +1,7 @@
 """
 Use cases for managing patient allergies
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from slices.allergies.application.ports.allergy_repository import AllergyRepositoryPort
@@ -9,8 +9,11 @@ from slices.allergies.domain.models.allergy_model import PatientAllergy
 from slices.allergies.application.dto.allergy_dto import (
     PatientAllergyDTO,
     CreateAllergyDTO,
-    UpdateAllergyDTO
+    UpdateAllergyDTO,
+    AllergyBatchDTO
 )
+from shared.utils.batch import BatchResultDTO, build_batch_result
+from shared.utils.pagination import CursorPageDTO, parse_fields
 
 
 class ManageAllergiesUseCase:
@@ -24,6 +27,27 @@ class ManageAllergiesUseCase:
         allergies = await self.allergy_repository.get_allergies_by_patient_id(patient_id)
         return [PatientAllergyDTO.model_validate(allergy, from_attributes=True) for allergy in allergies]
 
+    async def get_patient_allergies_page(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> CursorPageDTO:
+        """Get one page of allergies for a patient, optionally limited to the requested fields"""
+        selected_fields = parse_fields(fields, PatientAllergyDTO.model_fields)
+        page = await self.allergy_repository.get_allergies_page_by_patient_id(
+            patient_id, limit, cursor, selected_fields
+        )
+        items = page.items if selected_fields else [
+            PatientAllergyDTO.model_validate(allergy, from_attributes=True) for allergy in page.items
+        ]
+        return CursorPageDTO(items=items, next_cursor=page.next_cursor, limit=limit)
+
+    async def get_allergies_version(self, patient_id: UUID) -> Tuple:
+        """Version stamp of a patient's allergies, for conditional GET"""
+        return await self.allergy_repository.get_version_stamp(patient_id)
+
     async def get_allergy_by_id(self, allergy_id: int, patient_id: UUID) -> Optional[PatientAllergyDTO]:
         """Get a specific allergy by ID"""
         allergy = await self.allergy_repository.get_allergy_by_id(allergy_id, patient_id)
@@ -50,4 +74,9 @@ class ManageAllergiesUseCase:
 
     async def delete_allergy(self, allergy_id: int, patient_id: UUID) -> bool:
         """Delete an allergy record"""
-        return await self.allergy_repository.delete_allergy(allergy_id, patient_id)
\ No newline at end of file
+        return await self.allergy_repository.delete_allergy(allergy_id, patient_id)
+
+    async def apply_allergy_batch(self, batch_data: AllergyBatchDTO, patient_id: UUID) -> BatchResultDTO[PatientAllergyDTO]:
+        """Create, update and delete allergies in one transaction, with a result per item"""
+        result = await self.allergy_repository.apply_batch(patient_id, batch_data.to_batch_write())
+        return build_batch_result(batch_data, result, PatientAllergyDTO)
@@ -2,10 +2,11 @@
 Patient Allergy domain model
 """
 from datetime import datetime, date
-from sqlalchemy import Column, String, Text, Date, DateTime, BigInteger, ForeignKey, func
+from sqlalchemy import Column, String, Text, Date, DateTime, BigInteger, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
+from shared.database.change_tracking import change_seq_column, track_deletes
 from shared.database.database import Base
 
 
@@ -23,9 +24,21 @@ class PatientAllergy(Base):
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    change_seq = change_seq_column()
+
+    # Composite indexes matching the patient-scoped access paths
+    __table_args__ = (
+        Index("ix_patient_allergies_patient_id_created_at", patient_id, created_at.desc(), id.desc()),
+        Index("ix_patient_allergies_patient_id_severity_level", patient_id, severity_level),
+        # Delta sync: a patient's rows changed after a given sequence value
+        Index("ix_patient_allergies_patient_id_change_seq", patient_id, change_seq),
+    )
 
     # Relationship
     patient = relationship("Patient", backref="allergies")
 
     def __repr__(self):
-        return f"<PatientAllergy(id={self.id}, allergen='{self.allergen}', severity='{self.severity_level}')>"
\ No newline at end of file
+        return f"<PatientAllergy(id={self.id}, allergen='{self.allergen}', severity='{self.severity_level}')>"
+
+
+track_deletes(PatientAllergy, "allergies")
@@ -1,21 +1,25 @@
 """
 Allergies API endpoints with authentication
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Query
 from sqlalchemy.orm import Session
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
-from slices.signup.domain.models.user_model import User
-from slices.signup.domain.models.patient_model import Patient
+from shared.exceptions.application_exceptions import ValidationException
+from shared.utils.etag import not_modified, version_etag
+from shared.utils.batch import BatchResultDTO
+from shared.utils.pagination import CursorPageDTO, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from slices.auth.infrastructure.api.auth_endpoints import get_current_patient
+from slices.auth.application.use_cases import AuthenticatedPrincipal
 
 from slices.allergies.application.use_cases.manage_allergies import ManageAllergiesUseCase
 from slices.allergies.infrastructure.repositories.allergy_repository import AllergyRepository
 from slices.allergies.application.dto.allergy_dto import (
     PatientAllergyDTO,
     CreateAllergyDTO,
-    UpdateAllergyDTO
+    UpdateAllergyDTO,
+    AllergyBatchDTO
 )
 
 router = APIRouter(prefix="/api/allergies", tags=["Allergies"])
@@ -27,49 +31,54 @@ def get_allergy_use_case(db: Session = Depends(get_db)) -> ManageAllergiesUseCas
     return ManageAllergiesUseCase(allergy_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
-    if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient record not found"
-        )
-    return patient
-
-
-@router.get("/", response_model=List[PatientAllergyDTO])
+@router.get("/", response_model=Union[List[PatientAllergyDTO], CursorPageDTO])
 async def get_allergies(
-    current_user: User = Depends(get_current_user),
-    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size, enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, enables cursor pagination"),
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case)
 ):
-    """Get all allergies for authenticated patient"""
-    if current_user.user_type != "patient":
+    """
+    Get allergies for authenticated patient
+
+    Without limit, cursor or fields the full list is returned as before.
+    Otherwise a cursor page is returned with next_cursor for the following page.
+    Answers 304 Not Modified when If-None-Match matches the current ETag.
+    """
+    patient = principal.patient
+
+    # Checked before any DTO is built; the query string selects the representation
+    stamp = await allergy_use_case.get_allergies_version(patient.id)
+    etag = version_etag("allergies", patient.id, request.url.query, *stamp)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    if limit is None and cursor is None and fields is None:
+        return await allergy_use_case.get_patient_allergies(patient.id)
+
+    try:
+        return await allergy_use_case.get_patient_allergies_page(
+            patient.id, limit or DEFAULT_PAGE_SIZE, cursor, fields
+        )
+    except ValidationException as e:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access allergy data"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
 
-    patient = await get_patient_from_user(current_user, db)
-    return await allergy_use_case.get_patient_allergies(patient.id)
-
 
 @router.get("/{allergy_id}", response_model=PatientAllergyDTO)
 async def get_allergy(
     allergy_id: int,
-    current_user: User = Depends(get_current_user),
-    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case)
 ):
     """Get a specific allergy by ID"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access allergy data"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     allergy = await allergy_use_case.get_allergy_by_id(allergy_id, patient.id)
 
     if not allergy:
@@ -84,37 +93,39 @@ async def get_allergy(
 @router.post("/", response_model=PatientAllergyDTO, status_code=status.HTTP_201_CREATED)
 async def create_allergy(
     allergy_data: CreateAllergyDTO,
-    current_user: User = Depends(get_current_user),
-    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case)
 ):
     """Create a new allergy record"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can create allergy records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     return await allergy_use_case.create_allergy(allergy_data, patient.id)
 
 
+@router.post("/batch", response_model=BatchResultDTO[PatientAllergyDTO])
+async def apply_allergy_batch(
+    batch_data: AllergyBatchDTO,
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case)
+):
+    """
+    Create, update and delete allergies in one request and one transaction
+
+    Returns a result per item. Updates and deletes of ids the patient does
+    not have get a 404 item; the rest of the batch is still applied.
+    """
+    patient = principal.patient
+    return await allergy_use_case.apply_allergy_batch(batch_data, patient.id)
+
+
 @router.put("/{allergy_id}", response_model=PatientAllergyDTO)
 async def update_allergy(
     allergy_id: int,
     allergy_data: UpdateAllergyDTO,
-    current_user: User = Depends(get_current_user),
-    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case)
 ):
     """Update an existing allergy record"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can update allergy records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     updated_allergy = await allergy_use_case.update_allergy(allergy_id, allergy_data, patient.id)
 
     if not updated_allergy:
@@ -129,18 +140,11 @@ async def update_allergy(
 @router.delete("/{allergy_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_allergy(
     allergy_id: int,
-    current_user: User = Depends(get_current_user),
-    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    allergy_use_case: ManageAllergiesUseCase = Depends(get_allergy_use_case)
 ):
     """Delete an allergy record"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can delete allergy records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     success = await allergy_use_case.delete_allergy(allergy_id, patient.id)
 
     if not success:
@@ -1,7 +1,7 @@
 """
 SQLAlchemy implementation of allergy repository
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc
@@ -9,6 +9,10 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from slices.allergies.application.ports.allergy_repository import AllergyRepositoryPort
 from slices.allergies.domain.models.allergy_model import PatientAllergy
+from shared.events import CREATED, DELETED, UPDATED, AllergyChanged, record_event
+from shared.database.batch_writes import BatchWrite, BatchWriteResult, apply_batch_write
+from shared.database.version_stamps import collection_stamp, read_version_stamp
+from shared.utils.pagination import KeysetPage, paginate_keyset
 
 
 class AllergyRepository(AllergyRepositoryPort):
@@ -26,6 +30,31 @@ class AllergyRepository(AllergyRepositoryPort):
         except SQLAlchemyError as e:
             raise Exception(f"Database error getting allergies: {str(e)}")
 
+    async def get_allergies_page_by_patient_id(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> KeysetPage:
+        """Get one keyset page of allergies for a specific patient"""
+        try:
+            query = self.db.query(PatientAllergy).filter(
+                PatientAllergy.patient_id == patient_id
+            )
+            return paginate_keyset(query, PatientAllergy, limit, cursor, fields)
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting allergies: {str(e)}")
+
+    async def get_version_stamp(self, patient_id: UUID) -> Tuple:
+        """Count and newest updated_at of a patient's allergies"""
+        try:
+            return read_version_stamp(
+                self.db, collection_stamp(PatientAllergy, PatientAllergy.patient_id == patient_id)
+            )
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting allergies version: {str(e)}")
+
     async def get_allergy_by_id(self, allergy_id: int, patient_id: UUID) -> Optional[PatientAllergy]:
         """Get a specific allergy by ID with patient ownership verification"""
         try:
@@ -42,6 +71,10 @@ class AllergyRepository(AllergyRepositoryPort):
         """Create a new allergy record"""
         try:
             self.db.add(allergy)
+            self.db.flush()
+            record_event(self.db, AllergyChanged(
+                patient_id=allergy.patient_id, record_id=allergy.id, change=CREATED, label=allergy.allergen
+            ))
             self.db.commit()
             self.db.refresh(allergy)
             return allergy
@@ -66,6 +99,9 @@ class AllergyRepository(AllergyRepositoryPort):
                 if hasattr(allergy, key):
                     setattr(allergy, key, value)
 
+            record_event(self.db, AllergyChanged(
+                patient_id=allergy.patient_id, record_id=allergy.id, change=UPDATED, label=allergy.allergen
+            ))
             self.db.commit()
             self.db.refresh(allergy)
             return allergy
@@ -86,9 +122,20 @@ class AllergyRepository(AllergyRepositoryPort):
             if not allergy:
                 return False
 
+            record_event(self.db, AllergyChanged(
+                patient_id=allergy.patient_id, record_id=allergy.id, change=DELETED, label=allergy.allergen
+            ))
             self.db.delete(allergy)
             self.db.commit()
             return True
         except SQLAlchemyError as e:
             self.db.rollback()
-            raise Exception(f"Database error deleting allergy: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Database error deleting allergy: {str(e)}")
+
+    async def apply_batch(self, patient_id: UUID, batch: BatchWrite) -> BatchWriteResult[PatientAllergy]:
+        """Apply creates, updates and deletes of a patient's allergies in one transaction"""
+        try:
+            return apply_batch_write(self.db, PatientAllergy, patient_id, batch, AllergyChanged, "allergen")
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error applying allergy batch: {str(e)}")
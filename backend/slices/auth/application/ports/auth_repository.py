@@ -27,6 +27,11 @@ class AuthRepository(ABC):
         """Get user with patient data by email for authentication with profile data"""
         pass
 
+    @abstractmethod
+    async def get_user_with_patient_by_id(self, user_id: UUID) -> Optional[Tuple[User, Optional[Patient]]]:
+        """Get user and, if any, their patient record in a single query for token validation"""
+        pass
+
     @abstractmethod
     async def update_last_login(self, user_id: UUID) -> None:
         """Update user's last login timestamp"""
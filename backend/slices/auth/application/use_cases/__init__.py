@@ -2,13 +2,14 @@
 Authentication application use cases
 """
 from .authenticate_user import AuthenticateUserUseCase
-from .validate_token import ValidateTokenUseCase
+from .validate_token import ValidateTokenUseCase, AuthenticatedPrincipal
 from .logout_user import LogoutUserUseCase
 from .refresh_token import RefreshTokenUseCase
 
 __all__ = [
     "AuthenticateUserUseCase",
     "ValidateTokenUseCase",
+    "AuthenticatedPrincipal",
     "LogoutUserUseCase",
     "RefreshTokenUseCase"
 ]
\ No newline at end of file
@@ -1,13 +1,30 @@
 """
 Refresh Token Use Case
 """
+import asyncio
+import hashlib
 from typing import Dict, Any
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
+from shared.cache import MISSING, LRUCache
+from shared.utils.single_flight import SingleFlight
 from slices.auth.application.dto import LoginResponseDto, UserResponseDto
 from slices.auth.application.ports import AuthRepository, UserSessionRepository
 from slices.auth.infrastructure.security.jwt_service import JWTService
 
+# Clients that retry a refresh in parallel share one token rotation
+_refresh_flight = SingleFlight("refresh_token")
+
+# Rotated results for the reuse grace window. They hold live access and refresh
+# tokens, so they stay in this process and never go to the shared cache tier
+_rotated_results = LRUCache(max_entries=1024)
+
+
+def refresh_token_digest(refresh_token: str) -> str:
+    """Key for a refresh token that does not keep the token itself"""
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
 
 class RefreshTokenUseCase:
     """Use case for JWT token refresh"""
@@ -16,11 +33,52 @@ class RefreshTokenUseCase:
         self,
         auth_repository: AuthRepository,
         user_session_repository: UserSessionRepository,
-        jwt_service: JWTService
+        jwt_service: JWTService,
+        reuse_grace_seconds: int = 0
     ):
+        """
+        Args:
+            reuse_grace_seconds: How long execute_once() keeps answering the old
+                refresh token with the tokens it was rotated to; 0 disables
+        """
         self.auth_repository = auth_repository
         self.user_session_repository = user_session_repository
         self.jwt_service = jwt_service
+        self.reuse_grace_seconds = reuse_grace_seconds
+
+    async def execute_once(self, refresh_token: str) -> Dict[str, Any]:
+        """
+        execute(), coalesced across duplicate refreshes of the same token
+
+        Concurrent calls in this worker share one rotation. Within the reuse
+        grace window a repeated call that reaches the same worker gets the
+        already rotated tokens instead of a "revoked" error. The result is
+        kept in this worker's memory only, so a repeat on another worker
+        still gets 401.
+        """
+        digest = refresh_token_digest(refresh_token)
+
+        rotated = _rotated_results.get(self._rotated_key(digest))
+        if rotated is not MISSING:
+            return rotated
+
+        return await _refresh_flight.do(
+            digest, lambda: run_in_threadpool(self._rotate, refresh_token, digest)
+        )
+
+    def _rotate(self, refresh_token: str, digest: str) -> Dict[str, Any]:
+        """Run execute() in a worker thread and remember its result for the grace window"""
+        # Repository methods are async but run blocking queries, so drive
+        # them on this worker thread's own loop instead of the server loop
+        result = asyncio.run(self.execute(refresh_token))
+
+        if self.reuse_grace_seconds > 0:
+            _rotated_results.set(self._rotated_key(digest), result, ttl=self.reuse_grace_seconds)
+        return result
+
+    @staticmethod
+    def _rotated_key(digest: str) -> str:
+        return f"auth:refresh_rotated:{digest}"
 
     async def execute(self, refresh_token: str) -> Dict[str, Any]:
         """
@@ -1,11 +1,39 @@
 """
 Validate Token Use Case
 """
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from fastapi import HTTPException, status
 
 from slices.auth.application.ports import AuthRepository, UserSessionRepository
 from slices.auth.infrastructure.security.jwt_service import JWTService
+from slices.signup.domain.models.user_model import User
+from slices.signup.domain.models.patient_model import Patient
+
+
+@dataclass
+class AuthenticatedPrincipal:
+    """Authenticated user with their patient record, resolved once per request"""
+    user: User
+    patient: Optional[Patient]
+    session_id: Any
+
+    def to_user_info(self) -> Dict[str, Any]:
+        """Build the user information payload returned by /me and /validate"""
+        patient = self.patient
+
+        # Patient record exists => profile is completed
+        return {
+            "user_id": str(self.user.id),
+            "email": self.user.email,
+            "user_type": self.user.user_type,
+            "first_name": patient.first_name if patient else None,
+            "last_name": patient.last_name if patient else None,
+            "is_verified": self.user.is_verified,
+            "profile_completed": patient is not None,
+            "mandatory_fields_completed": bool(patient and patient.first_name and patient.last_name),
+            "session_id": self.session_id
+        }
 
 
 class ValidateTokenUseCase:
@@ -31,6 +59,27 @@ class ValidateTokenUseCase:
         Returns:
             Dictionary with user information if valid
 
+        Raises:
+            HTTPException: If token is invalid or expired
+        """
+        principal = await self.authenticate(token)
+
+        # Step 6: Return user information
+        print(f"🔍 VALIDATE TOKEN DEBUG - Step 6: Returning user information...")
+        user_info = principal.to_user_info()
+        print(f"   ✅ Validation successful, returning user info: {user_info}")
+        return user_info
+
+    async def authenticate(self, token: str) -> AuthenticatedPrincipal:
+        """
+        Validate JWT token and resolve the user and patient behind it
+
+        Args:
+            token: JWT access token to validate
+
+        Returns:
+            AuthenticatedPrincipal with the user and their patient record (if any)
+
         Raises:
             HTTPException: If token is invalid or expired
         """
@@ -93,9 +142,10 @@ class ValidateTokenUseCase:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Step 4: Get user from database
+        # Step 4: Get user and patient from database in one query
         print(f"🔍 VALIDATE TOKEN DEBUG - Step 4: Getting user from database...")
-        user = await self.auth_repository.get_user_by_id(user_id)
+        result = await self.auth_repository.get_user_with_patient_by_id(user_id)
+        user, patient = result if result else (None, None)
         print(f"   User found: {'Yes' if user else 'No'}")
         if user:
             print(f"   User ID: {user.id}")
@@ -125,43 +175,4 @@ class ValidateTokenUseCase:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        # Step 6: Return user information
-        print(f"🔍 VALIDATE TOKEN DEBUG - Step 6: Returning user information...")
-        print(f"   User attributes: {[attr for attr in dir(user) if not attr.startswith('_')]}")
-
-        # Get patient/profile data if available
-        first_name = None
-        last_name = None
-        profile_completed = False
-        mandatory_fields_completed = False
-
-        # Try to get patient record for additional fields
-        try:
-            from slices.signup.domain.models.patient_model import Patient
-            from sqlalchemy.orm import Session
-
-            # Get database session from auth_repository
-            db_session = self.auth_repository.db_session if hasattr(self.auth_repository, 'db_session') else None
-            if db_session:
-                patient = db_session.query(Patient).filter(Patient.user_id == user.id).first()
-                if patient:
-                    first_name = patient.first_name
-                    last_name = patient.last_name
-                    profile_completed = True  # If patient record exists, profile is completed
-                    mandatory_fields_completed = bool(patient.first_name and patient.last_name)
-        except Exception as e:
-            print(f"   ⚠️ Could not get patient data: {e}")
-
-        user_info = {
-            "user_id": str(user.id),
-            "email": user.email,
-            "user_type": user.user_type,
-            "first_name": first_name,
-            "last_name": last_name,
-            "is_verified": user.is_verified,
-            "profile_completed": profile_completed,
-            "mandatory_fields_completed": mandatory_fields_completed,
-            "session_id": session_id
-        }
-        print(f"   ✅ Validation successful, returning user info: {user_info}")
-        return user_info
\ No newline at end of file
+        return AuthenticatedPrincipal(user=user, patient=patient, session_id=session_id)
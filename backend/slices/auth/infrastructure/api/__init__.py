@@ -2,5 +2,6 @@
 Authentication API infrastructure
 """
 from .auth_endpoints import router as auth_router
+from .jwks_endpoints import router as jwks_router
 
-__all__ = ["auth_router"]
\ No newline at end of file
+__all__ = ["auth_router", "jwks_router"]
\ No newline at end of file
@@ -6,11 +6,14 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Union
 
-from shared.database import get_db
+from shared.database import get_db, get_auth_db, get_critical_db
+from shared.config.settings import settings
+from shared.database.replicas import set_request_user
 from slices.auth.application.dto import LoginRequestDto, LoginResponseDto, LoginErrorResponseDto
 from slices.auth.application.use_cases import (
     AuthenticateUserUseCase,
     ValidateTokenUseCase,
+    AuthenticatedPrincipal,
     LogoutUserUseCase,
     RefreshTokenUseCase
 )
@@ -44,8 +47,17 @@ def get_auth_use_case(db: Session = Depends(get_db)) -> AuthenticateUserUseCase:
     )
 
 
-def get_validate_token_use_case(db: Session = Depends(get_db)) -> ValidateTokenUseCase:
-    """Dependency injection for ValidateTokenUseCase"""
+def get_validate_token_use_case(db: Session = Depends(get_auth_db)) -> ValidateTokenUseCase:
+    """Dependency injection for ValidateTokenUseCase (general pool)"""
+    return _build_validate_token_use_case(db)
+
+
+def get_critical_validate_token_use_case(db: Session = Depends(get_critical_db)) -> ValidateTokenUseCase:
+    """Dependency injection for ValidateTokenUseCase on the reserved critical pool"""
+    return _build_validate_token_use_case(db)
+
+
+def _build_validate_token_use_case(db: Session) -> ValidateTokenUseCase:
     auth_repository = SQLAlchemyAuthRepository(db)
     user_session_repository = SQLAlchemyUserSessionRepository(db)
     jwt_service = get_jwt_service()
@@ -77,7 +89,8 @@ def get_refresh_token_use_case(db: Session = Depends(get_db)) -> RefreshTokenUse
     return RefreshTokenUseCase(
         auth_repository=auth_repository,
         user_session_repository=user_session_repository,
-        jwt_service=jwt_service
+        jwt_service=jwt_service,
+        reuse_grace_seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS
     )
 
 
@@ -192,7 +205,8 @@ async def refresh_token(
                 detail="Refresh token is required"
             )
 
-        result = await use_case.execute(refresh_token)
+        # Duplicate refreshes of the same token share one rotation
+        result = await use_case.execute_once(refresh_token)
         return result["data"]
 
     except HTTPException:
@@ -234,7 +248,7 @@ async def get_current_user_info(
 @router.post("/validate")
 async def validate_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    use_case: ValidateTokenUseCase = Depends(get_validate_token_use_case)
+    use_case: ValidateTokenUseCase = Depends(get_critical_validate_token_use_case)
 ) -> Dict[str, Any]:
     """
     Validate JWT token (for internal use by frontend)
@@ -254,64 +268,94 @@ async def validate_token(
         return {"valid": False}
 
 
-# Dependency function for authentication
-async def get_current_user(
+# Dependency functions for authentication
+async def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> 'User':
+    db: Session = Depends(get_auth_db)
+) -> AuthenticatedPrincipal:
     """
-    Dependency to get current authenticated user from JWT token
-    Returns User object for use in protected endpoints
+    Dependency to resolve the authenticated user and patient from the JWT token
+    FastAPI caches it per request, so get_current_user and get_current_patient share one lookup
+    Runs on the general pool and releases its connection as soon as the lookup is done
+    """
+    return await _resolve_principal(credentials, db)
+
+
+async def get_critical_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_critical_db)
+) -> AuthenticatedPrincipal:
     """
+    Same lookup as get_current_principal on the reserved critical pool
+    Only for emergency routes, so patient traffic cannot exhaust the pool they depend on
+    """
+    return await _resolve_principal(credentials, db)
+
+
+async def _resolve_principal(credentials: HTTPAuthorizationCredentials, db: Session) -> AuthenticatedPrincipal:
+    """Validate the token and load the principal, then end the transaction to free the connection"""
     try:
-        print(f"🔍 GET_CURRENT_USER DEBUG - Starting authentication:")
+        print(f"🔍 GET_CURRENT_PRINCIPAL DEBUG - Starting authentication:")
         token = credentials.credentials
         print(f"   Token length: {len(token)}")
-        print(f"   Token preview: {token[:50]}...")
 
         # Create use case with proper dependency injection
-        auth_repository = SQLAlchemyAuthRepository(db)
-        user_session_repository = SQLAlchemyUserSessionRepository(db)
-        jwt_service = get_jwt_service()
-
         use_case = ValidateTokenUseCase(
-            auth_repository=auth_repository,
-            user_session_repository=user_session_repository,
-            jwt_service=jwt_service
+            auth_repository=SQLAlchemyAuthRepository(db),
+            user_session_repository=SQLAlchemyUserSessionRepository(db),
+            jwt_service=get_jwt_service()
         )
 
-        print(f"🔍 GET_CURRENT_USER DEBUG - About to execute ValidateTokenUseCase...")
-        user_data = await use_case.execute(token)
-        print(f"🔍 GET_CURRENT_USER DEBUG - ValidateTokenUseCase completed successfully")
-        print(f"   User data: {user_data}")
-
-        # Import here to avoid circular imports
-        from slices.signup.domain.models.user_model import User
-
-        # Get the actual User object from the database using the validated user_id
-        user_id = user_data["user_id"]
-        print(f"🔍 GET_CURRENT_USER DEBUG - Getting user by ID: {user_id}")
-        user = await auth_repository.get_user_by_id(user_id)
-
-        if not user:
-            print(f"🔍 GET_CURRENT_USER DEBUG - ❌ User not found in database")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found"
-            )
-
-        print(f"🔍 GET_CURRENT_USER DEBUG - ✅ Authentication successful for user: {user.email}")
-        return user
+        principal = await use_case.authenticate(token)
+        # End the transaction so the connection is not held for the rest of the request;
+        # the session does not expire objects on commit, so the principal stays loaded
+        db.commit()
+        # Lets replica routing send this user's reads to the primary right after their writes
+        set_request_user(principal.user.id)
+        print(f"🔍 GET_CURRENT_PRINCIPAL DEBUG - ✅ Authentication successful for user: {principal.user.email}")
+        return principal
 
     except HTTPException as e:
-        print(f"🔍 GET_CURRENT_USER DEBUG - ❌ HTTPException: {e.detail}")
+        print(f"🔍 GET_CURRENT_PRINCIPAL DEBUG - ❌ HTTPException: {e.detail}")
         raise
 
     except Exception as e:
-        print(f"🔍 GET_CURRENT_USER DEBUG - ❌ Unexpected exception: {type(e).__name__}: {str(e)}")
+        print(f"🔍 GET_CURRENT_PRINCIPAL DEBUG - ❌ Unexpected exception: {type(e).__name__}: {str(e)}")
         import traceback
-        print(f"🔍 GET_CURRENT_USER DEBUG - ❌ Traceback: {traceback.format_exc()}")
+        print(f"🔍 GET_CURRENT_PRINCIPAL DEBUG - ❌ Traceback: {traceback.format_exc()}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
-        )
\ No newline at end of file
+        )
+
+
+async def get_current_user(
+    principal: AuthenticatedPrincipal = Depends(get_current_principal)
+) -> 'User':
+    """
+    Dependency to get current authenticated user from JWT token
+    Returns User object for use in protected endpoints
+    """
+    return principal.user
+
+
+async def get_current_patient(
+    principal: AuthenticatedPrincipal = Depends(get_current_principal)
+) -> AuthenticatedPrincipal:
+    """
+    Dependency for patient-only endpoints
+    Returns the principal with both user and patient loaded by the token lookup
+    """
+    if principal.user.user_type != "patient":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only patients can access this resource"
+        )
+
+    if principal.patient is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Patient record not found"
+        )
+
+    return principal
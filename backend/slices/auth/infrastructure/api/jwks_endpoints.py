@@ -0,0 +1,30 @@
+"""
+JSON Web Key Set endpoint for stateless token verification
+"""
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse
+
+from shared.config.settings import settings
+from slices.auth.infrastructure.security.jwt_service_singleton import get_jwt_service
+
+router = APIRouter(tags=["Authentication"])
+
+
+@router.get("/.well-known/jwks.json")
+async def get_jwks(request: Request) -> Response:
+    """
+    Publish the public keys that sign access and refresh tokens
+
+    Lets the frontend middleware and other services verify tokens locally
+    (signature, exp, kid) instead of calling /api/auth/validate.
+    Returns an empty key set while tokens are signed with HS256.
+    """
+    jwks, etag = get_jwt_service().get_jwks()
+    headers = {"Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE_SECONDS}"}
+
+    if etag:
+        headers["ETag"] = etag
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=304, headers=headers)
+
+    return JSONResponse(content=jwks, headers=headers)
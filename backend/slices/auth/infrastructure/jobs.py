@@ -0,0 +1,23 @@
+"""
+Authentication background jobs (run by shared.scheduler)
+"""
+import asyncio
+import logging
+
+from shared.database import SessionLocal
+from slices.auth.infrastructure.persistence import SQLAlchemyUserSessionRepository
+
+logger = logging.getLogger(__name__)
+
+
+def cleanup_expired_sessions_job() -> int:
+    """Delete expired user sessions; runs in a scheduler worker thread"""
+    db = SessionLocal()
+    try:
+        repository = SQLAlchemyUserSessionRepository(db)
+        removed = asyncio.run(repository.cleanup_expired_sessions())
+        if removed:
+            logger.info("Removed %d expired user sessions", removed)
+        return removed
+    finally:
+        db.close()
@@ -25,7 +25,8 @@ class SQLAlchemyAuthRepository(AuthRepository):
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """Get user by ID for token validation"""
-        return self.db_session.query(User).filter(User.id == user_id).first()
+        # Session.get hits the identity map when the user was already loaded in this request
+        return self.db_session.get(User, UUID(str(user_id)))
 
     async def get_user_with_patient_by_email(self, email: str) -> Optional[Tuple[User, Patient]]:
         """Get user with patient data by email for authentication with profile data"""
@@ -40,6 +41,19 @@ class SQLAlchemyAuthRepository(AuthRepository):
             return (user, patient)
         return None
 
+    async def get_user_with_patient_by_id(self, user_id: UUID) -> Optional[Tuple[User, Optional[Patient]]]:
+        """Get user and, if any, their patient record in a single query for token validation"""
+        result = self.db_session.query(User, Patient).outerjoin(
+            Patient, User.id == Patient.user_id
+        ).filter(
+            User.id == UUID(str(user_id))
+        ).first()
+
+        if result:
+            user, patient = result
+            return (user, patient)
+        return None
+
     async def update_last_login(self, user_id: UUID) -> None:
         """Update user's last login timestamp"""
         user = await self.get_user_by_id(user_id)
@@ -129,14 +129,10 @@ class SQLAlchemyUserSessionRepository(UserSessionRepository):
         """Remove expired sessions and return count of removed sessions"""
         now = datetime.utcnow()
 
-        expired_sessions = self.db_session.query(UserSession).filter(
+        # Single DELETE; this runs as a periodic sweep over the whole table
+        count = self.db_session.query(UserSession).filter(
             UserSession.expires_at <= now
-        ).all()
-
-        count = len(expired_sessions)
-
-        for session in expired_sessions:
-            self.db_session.delete(session)
+        ).delete(synchronize_session=False)
 
         self.db_session.commit()
         return count
@@ -0,0 +1,93 @@
+"""
+JWT Key Ring for asymmetric token signing and key rotation
+
+Keys are read from a directory of PEM files:
+- <kid>.pem      private key, can sign and verify
+- <kid>.pub.pem  public key only, kept to verify tokens signed by a retired key
+
+The active key signs new tokens and its kid goes into the JWT header.
+Every key is published in the JWKS document so other services can verify
+tokens locally.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, Any, Optional
+
+from jose import jwk
+
+# Signing algorithms supported by the python-jose backends we ship with
+ASYMMETRIC_ALGORITHMS = {"RS256", "RS384", "RS512", "ES256", "ES384", "ES512"}
+
+PRIVATE_KEY_SUFFIX = ".pem"
+PUBLIC_KEY_SUFFIX = ".pub.pem"
+
+
+def is_asymmetric_algorithm(algorithm: str) -> bool:
+    """Check if the JWT algorithm signs with a private/public key pair"""
+    return algorithm in ASYMMETRIC_ALGORITHMS
+
+
+class JWTKeyRing:
+    """Signing key plus every verification key published in the JWKS"""
+
+    def __init__(self, algorithm: str, keys_dir: str, active_kid: Optional[str] = None):
+        if not is_asymmetric_algorithm(algorithm):
+            raise ValueError(f"Unsupported asymmetric JWT algorithm: {algorithm}")
+
+        self.algorithm = algorithm
+        self._signing_keys: Dict[str, str] = {}
+        self._verification_keys: Dict[str, Dict[str, Any]] = {}
+
+        self._load_keys(keys_dir)
+
+        # Default to the newest private key when kids are date-based (e.g. "2025-10")
+        self.active_kid = active_kid or (max(self._signing_keys) if self._signing_keys else None)
+        if self.active_kid not in self._signing_keys:
+            raise ValueError(f"No private key found for active kid '{self.active_kid}' in {keys_dir}")
+
+        # JWKS never changes while the process runs, so build it once
+        self.jwks = {
+            "keys": [
+                {**public_jwk, "kid": kid, "use": "sig"}
+                for kid, public_jwk in sorted(self._verification_keys.items())
+            ]
+        }
+        self.jwks_etag = '"' + hashlib.sha256(
+            json.dumps(self.jwks, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:32] + '"'
+
+    @property
+    def signing_key(self) -> str:
+        """PEM private key used to sign new tokens"""
+        return self._signing_keys[self.active_kid]
+
+    def get_verification_key(self, kid: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get the public JWK for a token's kid header"""
+        if kid is None:
+            return None
+        return self._verification_keys.get(kid)
+
+    def _load_keys(self, keys_dir: str) -> None:
+        """Load every PEM key in the directory"""
+        if not os.path.isdir(keys_dir):
+            raise ValueError(f"JWT keys directory not found: {keys_dir}")
+
+        for filename in sorted(os.listdir(keys_dir)):
+            path = os.path.join(keys_dir, filename)
+
+            if filename.endswith(PUBLIC_KEY_SUFFIX):
+                kid = filename[:-len(PUBLIC_KEY_SUFFIX)]
+                with open(path, "r") as key_file:
+                    public_key = jwk.construct(key_file.read(), self.algorithm)
+                self._verification_keys.setdefault(kid, public_key.to_dict())
+
+            elif filename.endswith(PRIVATE_KEY_SUFFIX):
+                kid = filename[:-len(PRIVATE_KEY_SUFFIX)]
+                with open(path, "r") as key_file:
+                    private_pem = key_file.read()
+                self._signing_keys[kid] = private_pem
+                # A private key always wins over a stale .pub.pem with the same kid
+                self._verification_keys[kid] = jwk.construct(
+                    private_pem, self.algorithm
+                ).public_key().to_dict()
@@ -2,13 +2,14 @@
 JWT Token Service for authentication and session management
 """
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Union
 import uuid
 
 from jose import JWTError, jwt
 from fastapi import HTTPException, status
 
 from shared.config.settings import settings
+from .jwt_key_ring import JWTKeyRing, is_asymmetric_algorithm
 
 
 class JWTService:
@@ -19,6 +20,20 @@ class JWTService:
         self.algorithm = settings.JWT_ALGORITHM
         self.access_token_expire_minutes = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
 
+        # Asymmetric signing (RS*/ES*) uses a key ring with kid-based rotation
+        self.key_ring: Optional[JWTKeyRing] = None
+        if is_asymmetric_algorithm(self.algorithm):
+            if not settings.JWT_KEYS_DIR:
+                raise ValueError(f"JWT_KEYS_DIR is required for {self.algorithm} signing")
+            self.key_ring = JWTKeyRing(self.algorithm, settings.JWT_KEYS_DIR, settings.JWT_ACTIVE_KID)
+
+        # HS256 tokens issued before the switch are only accepted when opted in,
+        # and never after the cutoff
+        self.accept_legacy_hs256 = settings.JWT_ACCEPT_LEGACY_HS256
+        self.legacy_hs256_until = settings.JWT_LEGACY_HS256_UNTIL
+        if self.legacy_hs256_until is not None and self.legacy_hs256_until.tzinfo is None:
+            self.legacy_hs256_until = self.legacy_hs256_until.replace(tzinfo=timezone.utc)
+
     def create_access_token(
         self,
         user_id: str,
@@ -78,7 +93,7 @@ class JWTService:
             to_encode.update(additional_claims)
 
         # Create JWT token
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        encoded_jwt = self._encode(to_encode)
 
         # JWT TOKEN DEBUG: Verify created token
         try:
@@ -131,7 +146,7 @@ class JWTService:
             "type": "refresh"
         }
 
-        encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        encoded_jwt = self._encode(to_encode)
 
         return {
             "refresh_token": encoded_jwt,
@@ -152,27 +167,7 @@ class JWTService:
             HTTPException: If token is invalid or expired
         """
         try:
-            # JWT audience validation bypass - handles tokens with audience claims
-            # that need validation disabled for compatibility
-            try:
-                payload = jwt.decode(
-                    token,
-                    self.secret_key,
-                    algorithms=[self.algorithm]
-                    # Note: audience parameter removed to prevent validation issues
-                )
-            except JWTError as e:
-                if "Invalid audience" in str(e):
-                    # Fallback: disable audience verification for compatibility
-                    payload = jwt.decode(
-                        token,
-                        self.secret_key,
-                        algorithms=[self.algorithm],
-                        options={"verify_aud": False}
-                    )
-                else:
-                    # Re-raise other JWT errors
-                    raise
+            payload = self._decode(token)
 
             # Verify required claims
             user_id = payload.get("sub")
@@ -206,26 +201,7 @@ class JWTService:
             HTTPException: If token is invalid or expired
         """
         try:
-            # JWT audience validation bypass for refresh tokens
-            try:
-                payload = jwt.decode(
-                    refresh_token,
-                    self.secret_key,
-                    algorithms=[self.algorithm]
-                    # Note: audience parameter removed for compatibility
-                )
-            except JWTError as e:
-                if "Invalid audience" in str(e):
-                    # Fallback: disable audience verification
-                    payload = jwt.decode(
-                        refresh_token,
-                        self.secret_key,
-                        algorithms=[self.algorithm],
-                        options={"verify_aud": False}
-                    )
-                else:
-                    # Re-raise other JWT errors
-                    raise
+            payload = self._decode(refresh_token)
 
             # Verify it's a refresh token
             if payload.get("type") != "refresh":
@@ -244,6 +220,71 @@ class JWTService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+    def get_jwks(self) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Get the public JSON Web Key Set and its ETag
+
+        Returns:
+            Tuple of JWKS document and ETag (empty set and None for HS256)
+        """
+        if self.key_ring is None:
+            return {"keys": []}, None
+
+        return self.key_ring.jwks, self.key_ring.jwks_etag
+
+    def _encode(self, claims: Dict[str, Any]) -> str:
+        """Sign claims with the active key (kid header) or the shared secret"""
+        if self.key_ring is not None:
+            return jwt.encode(
+                claims,
+                self.key_ring.signing_key,
+                algorithm=self.algorithm,
+                headers={"kid": self.key_ring.active_kid}
+            )
+
+        return jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+    def _get_verification_key(self, token: str) -> Tuple[Union[str, Dict[str, Any]], List[str]]:
+        """Pick the key and allowed algorithms for a token based on its header"""
+        if self.key_ring is None:
+            return self.secret_key, [self.algorithm]
+
+        header = jwt.get_unverified_header(token)
+
+        if header.get("alg") == "HS256" and self._legacy_hs256_allowed():
+            return self.secret_key, ["HS256"]
+
+        key = self.key_ring.get_verification_key(header.get("kid"))
+        if key is None:
+            raise JWTError("Unknown signing key")
+
+        return key, [self.algorithm]
+
+    def _legacy_hs256_allowed(self) -> bool:
+        """Whether HS256 tokens from before the asymmetric switch are still accepted"""
+        if not self.accept_legacy_hs256:
+            return False
+        if self.legacy_hs256_until is None:
+            return True
+        return datetime.now(timezone.utc) < self.legacy_hs256_until
+
+    def _decode(self, token: str) -> Dict[str, Any]:
+        """
+        Decode token with the right key
+
+        JWT audience validation bypass - tokens carry different audiences
+        (frontend vs refresh), so audience verification is disabled on mismatch
+        for compatibility.
+        """
+        key, algorithms = self._get_verification_key(token)
+
+        try:
+            return jwt.decode(token, key, algorithms=algorithms)
+        except JWTError as e:
+            if "Invalid audience" in str(e):
+                return jwt.decode(token, key, algorithms=algorithms, options={"verify_aud": False})
+            raise
+
     def extract_token_from_header(self, authorization: str) -> str:
         """
         Extract token from Authorization header
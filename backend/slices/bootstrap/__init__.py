@@ -0,0 +1,4 @@
+"""
+Bootstrap Slice
+Composes the read models the frontend loads after login into a single call
+"""
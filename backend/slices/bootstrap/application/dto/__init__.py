@@ -0,0 +1,9 @@
+"""
+DTOs for bootstrap
+"""
+from .bootstrap_dto import BootstrapSectionDTO, BootstrapResponseDTO
+
+__all__ = [
+    "BootstrapSectionDTO",
+    "BootstrapResponseDTO",
+]
@@ -0,0 +1,17 @@
+"""
+Bootstrap DTOs for API responses
+"""
+from typing import Any, Dict, Optional
+from pydantic import BaseModel
+
+
+class BootstrapSectionDTO(BaseModel):
+    """One section of the bootstrap payload"""
+    etag: str
+    not_modified: bool = False
+    data: Optional[Any] = None
+
+
+class BootstrapResponseDTO(BaseModel):
+    """Composed bootstrap payload keyed by section name"""
+    sections: Dict[str, BootstrapSectionDTO]
@@ -0,0 +1,3 @@
+"""
+Use cases for bootstrap application layer
+"""
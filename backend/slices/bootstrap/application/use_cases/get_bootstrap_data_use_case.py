@@ -0,0 +1,161 @@
+"""
+Get bootstrap data use case
+Builds session, profile, language, dashboard and QR read models concurrently
+for one authenticated principal
+
+Database-backed sections (profile, dashboard) take their ETag from version
+stamps, checked before the section is built, so a section the client already
+holds costs one stamp query. Sections built from the loaded principal hash
+their JSON.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session
+
+from shared.exceptions.application_exceptions import AuthorizationException, ValidationException
+from shared.utils.etag import compute_etag, version_etag
+from slices.auth.application.use_cases import AuthenticatedPrincipal
+from slices.bootstrap.application.dto.bootstrap_dto import BootstrapResponseDTO, BootstrapSectionDTO
+from slices.dashboard.application.dto.dashboard_dto import DashboardDataDTO
+from slices.dashboard.application.use_cases import GetDashboardDataUseCase
+from slices.dashboard.infrastructure.repositories.dashboard_repository import DashboardRepository
+from slices.profile.application.use_cases.complete_profile_use_case import CompleteProfileUseCase
+from slices.qr.application.dto.qr_response_dto import QRResponseDTO
+
+# Sections in response order; patient-only sections need a patient record
+BOOTSTRAP_SECTIONS = ("session", "language", "profile", "dashboard", "qr")
+PATIENT_SECTIONS = {"profile", "dashboard", "qr"}
+
+# (etag, JSON-ready data); data is None when the client already holds etag
+Section = Tuple[str, Optional[Any]]
+
+
+def _content_section(data: Any) -> Section:
+    """ETag from the JSON itself, for sections built from the in-memory principal"""
+    encoded = jsonable_encoder(data)
+    return compute_etag(encoded), encoded
+
+
+class GetBootstrapDataUseCase:
+    """Use case for composing the post-login bootstrap payload"""
+
+    def __init__(self, session_factory: Callable[[], Session], frontend_url: str):
+        """
+        Args:
+            session_factory: Creates a database session per DB-bound section so
+                sections can run in parallel worker threads
+            frontend_url: Base URL used to build the QR link
+        """
+        self.session_factory = session_factory
+        self.frontend_url = frontend_url
+
+    def resolve_sections(self, principal: AuthenticatedPrincipal, sections: Optional[str]) -> List[str]:
+        """
+        Resolve the ?sections= parameter into an ordered list of section names
+
+        Raises:
+            ValidationException: If an unknown section is requested
+            AuthorizationException: If a non-patient requests a patient-only section
+        """
+        is_patient = principal.user.user_type == "patient" and principal.patient is not None
+
+        if not sections:
+            return [name for name in BOOTSTRAP_SECTIONS if is_patient or name not in PATIENT_SECTIONS]
+
+        requested = {name.strip() for name in sections.split(",") if name.strip()}
+        unknown = sorted(requested - set(BOOTSTRAP_SECTIONS))
+        if unknown:
+            raise ValidationException(f"Unknown sections: {', '.join(unknown)}")
+
+        if not is_patient and requested & PATIENT_SECTIONS:
+            raise AuthorizationException("Only patients can access profile, dashboard and QR sections")
+
+        return [name for name in BOOTSTRAP_SECTIONS if name in requested]
+
+    async def execute(
+        self,
+        principal: AuthenticatedPrincipal,
+        sections: Iterable[str],
+        known_etags: Set[str]
+    ) -> BootstrapResponseDTO:
+        """
+        Build the requested sections concurrently
+
+        Args:
+            principal: Authenticated user and patient
+            sections: Section names from resolve_sections
+            known_etags: ETags the client already holds (If-None-Match);
+                matching sections are returned without data
+
+        Returns:
+            BootstrapResponseDTO with one entry per section
+        """
+        builders: Dict[str, Callable[[AuthenticatedPrincipal, Set[str]], Awaitable[Section]]] = {
+            "session": self._build_session,
+            "language": self._build_language,
+            "profile": self._build_profile,
+            "dashboard": self._build_dashboard,
+            "qr": self._build_qr,
+        }
+        sections = list(sections)
+
+        results = await asyncio.gather(*(builders[name](principal, known_etags) for name in sections))
+
+        composed = {}
+        for name, (etag, data) in zip(sections, results):
+            if etag in known_etags:
+                composed[name] = BootstrapSectionDTO(etag=etag, not_modified=True)
+            else:
+                composed[name] = BootstrapSectionDTO(etag=etag, data=data)
+
+        return BootstrapResponseDTO(sections=composed)
+
+    async def _build_session(self, principal: AuthenticatedPrincipal, known_etags: Set[str]) -> Section:
+        """Same payload as /api/auth/me, built from the already loaded principal"""
+        return _content_section(principal.to_user_info())
+
+    async def _build_language(self, principal: AuthenticatedPrincipal, known_etags: Set[str]) -> Section:
+        """Same payload as GET /api/profile/language"""
+        return _content_section({"preferred_language": principal.user.preferred_language})
+
+    async def _build_qr(self, principal: AuthenticatedPrincipal, known_etags: Set[str]) -> Section:
+        """Same payload as GET /api/qr/"""
+        return _content_section(QRResponseDTO.from_patient(principal.patient, self.frontend_url))
+
+    async def _build_profile(self, principal: AuthenticatedPrincipal, known_etags: Set[str]) -> Section:
+        """Same payload as GET /api/profile/completeness"""
+        def load_profile(db: Session) -> Section:
+            use_case = CompleteProfileUseCase(db)
+            stamp = use_case.get_extended_profile_version(principal.user.id)
+            etag = version_etag("profile.completeness", principal.user.id, *stamp)
+            if etag in known_etags:
+                return etag, None
+            return etag, jsonable_encoder(use_case.get_profile_completeness(principal.user.id))
+
+        return await run_in_threadpool(self._run_with_session, load_profile)
+
+    async def _build_dashboard(self, principal: AuthenticatedPrincipal, known_etags: Set[str]) -> Section:
+        """Same payload and ETag as GET /api/dashboard/"""
+        async def load_dashboard(db: Session) -> Section:
+            use_case = GetDashboardDataUseCase(DashboardRepository(db))
+            stamp = await use_case.get_version(principal.user, principal.patient)
+            etag = version_etag("dashboard", principal.patient.id, *stamp)
+            if etag in known_etags:
+                return etag, None
+            dashboard_data = await use_case.execute(principal.user, principal.patient)
+            return etag, jsonable_encoder(DashboardDataDTO.model_validate(dashboard_data, from_attributes=True))
+
+        # Repository methods are async but run blocking queries, so drive
+        # them on this worker thread's own loop instead of the server loop
+        return await run_in_threadpool(self._run_with_session, lambda db: asyncio.run(load_dashboard(db)))
+
+    def _run_with_session(self, work: Callable[[Session], Any]) -> Any:
+        """Run blocking work with a dedicated session (sessions are not thread-safe)"""
+        db = self.session_factory()
+        try:
+            return work(db)
+        finally:
+            db.close()
@@ -0,0 +1,3 @@
+"""
+API routes for bootstrap infrastructure layer
+"""
@@ -0,0 +1,56 @@
+"""
+Bootstrap API Router
+Returns session, language, profile completeness, dashboard and QR data in one call
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+
+from shared.config.settings import settings
+from shared.database import SessionLocal
+from shared.exceptions.application_exceptions import AuthorizationException, ValidationException
+from shared.utils.etag import parse_if_none_match
+from slices.auth.infrastructure.api.auth_endpoints import get_current_principal
+from slices.auth.application.use_cases import AuthenticatedPrincipal
+from slices.bootstrap.application.dto.bootstrap_dto import BootstrapResponseDTO
+from slices.bootstrap.application.use_cases.get_bootstrap_data_use_case import GetBootstrapDataUseCase
+
+router = APIRouter(prefix="/api/bootstrap", tags=["Bootstrap"])
+
+
+def get_bootstrap_use_case() -> GetBootstrapDataUseCase:
+    """Dependency to get bootstrap use case"""
+    return GetBootstrapDataUseCase(SessionLocal, settings.FRONTEND_URL)
+
+
+@router.get("/", response_model=BootstrapResponseDTO)
+async def get_bootstrap_data(
+    request: Request,
+    sections: Optional[str] = Query(
+        None,
+        description="Comma-separated sections: session, language, profile, dashboard, qr (default: all allowed)"
+    ),
+    principal: AuthenticatedPrincipal = Depends(get_current_principal),
+    bootstrap_use_case: GetBootstrapDataUseCase = Depends(get_bootstrap_use_case)
+):
+    """
+    Get the post-login bootstrap payload for the authenticated user
+
+    Each section carries its own ETag. Sections whose ETag is listed in
+    If-None-Match come back with not_modified=true and no data.
+    Non-patient users only get the session and language sections.
+    """
+    try:
+        section_names = bootstrap_use_case.resolve_sections(principal, sections)
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except AuthorizationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+
+    known_etags = parse_if_none_match(request.headers.get("if-none-match"))
+    return await bootstrap_use_case.execute(principal, section_names, known_etags)
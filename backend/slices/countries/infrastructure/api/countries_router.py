@@ -1,10 +1,12 @@
 """Countries API router."""
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from shared.database import get_db
+from shared.config.settings import settings
+from shared.database import get_read_db
+from shared.utils.precompressed import precompressed_json_response
 from slices.countries.infrastructure.database.country_repository import CountryRepository
 from slices.countries.application.country_service import CountryService
 
@@ -26,8 +28,11 @@ class CountryResponse(BaseModel):
         from_attributes = True
 
 
+_country_list = TypeAdapter(List[CountryResponse])
+
+
 @router.get("", response_model=List[CountryResponse])
-async def get_countries(db: Session = Depends(get_db)):
+async def get_countries(request: Request, db: Session = Depends(get_read_db)):
     """
     Get all active countries.
 
@@ -37,18 +42,26 @@ async def get_countries(db: Session = Depends(get_db)):
     - Then by geographic proximity
 
     This endpoint is public and doesn't require authentication.
+    The body is served from precompressed in-memory copies.
     """
     try:
         repository = CountryRepository(db)
         service = CountryService(repository)
         countries = service.get_all_countries()
-        return countries
+        body = _country_list.dump_json(_country_list.validate_python(countries))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching countries: {str(e)}")
 
+    return precompressed_json_response(
+        request,
+        "countries:active",
+        body,
+        f"public, max-age={settings.CATALOG_CACHE_MAX_AGE_SECONDS}"
+    )
+
 
 @router.get("/{code}", response_model=CountryResponse)
-async def get_country_by_code(code: str, db: Session = Depends(get_db)):
+async def get_country_by_code(code: str, db: Session = Depends(get_read_db)):
     """
     Get a specific country by its ISO 3166-1 alpha-2 code.
 
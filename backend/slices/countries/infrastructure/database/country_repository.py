@@ -2,6 +2,7 @@
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import asc
+from shared.cache import cached
 from slices.countries.domain.country import Country
 from slices.countries.infrastructure.database.country_model import CountryModel
 
@@ -9,9 +10,13 @@ from slices.countries.infrastructure.database.country_model import CountryModel
 class CountryRepository:
     """Repository for country data access."""
 
+    # Seeded catalog with no write path in the API; only a reseed changes it
+    CACHE_TTL_SECONDS = 3600
+
     def __init__(self, db: Session):
         self.db = db
 
+    @cached("countries:active", ttl=CACHE_TTL_SECONDS)
     def get_all_active(self) -> List[Country]:
         """Get all active countries ordered by ID (Colombia first)."""
         country_models = (
@@ -23,6 +28,7 @@ class CountryRepository:
 
         return [self._model_to_domain(model) for model in country_models]
 
+    @cached("countries:code:{code}", ttl=CACHE_TTL_SECONDS)
     def get_by_code(self, code: str) -> Optional[Country]:
         """Get country by ISO code."""
         country_model = (
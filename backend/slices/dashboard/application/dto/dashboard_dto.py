@@ -43,11 +43,21 @@ class ActivityDTO(BaseModel):
     type: str  # 'medication' | 'allergy' | 'surgery' | 'illness'
     description: str
     date: datetime
+    id: Optional[int] = None
+    action: Optional[str] = None  # 'created' | 'updated' | 'deleted'
+    resource_id: Optional[int] = None
 
     class Config:
         from_attributes = True
 
 
+class ActivityPageDTO(BaseModel):
+    """One page of the activity feed"""
+    items: List[ActivityDTO]
+    next_cursor: Optional[str] = None
+    limit: int
+
+
 class DashboardDataDTO(BaseModel):
     """Pydantic model for complete dashboard data"""
     user_id: str
@@ -4,9 +4,16 @@ Only dashboard summary/statistics operations
 Medical CRUD operations belong in their respective dedicated slices
 """
 from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from slices.dashboard.domain.entities.dashboard_stats import DashboardStats, MedicalDataSummary
+from shared.utils.pagination import KeysetPage
+from slices.dashboard.domain.entities.dashboard_stats import (
+    Activity,
+    ActivityEntry,
+    DashboardStats,
+    MedicalDataSummary,
+)
 
 
 class DashboardRepositoryPort(ABC):
@@ -20,4 +27,29 @@ class DashboardRepositoryPort(ABC):
     @abstractmethod
     async def get_medical_data_summary(self, patient_id: UUID) -> MedicalDataSummary:
         """Get summary of all medical data for a patient"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_version_stamp(self, user_id: UUID, patient_id: UUID) -> Tuple:
+        """Version stamp of everything the dashboard shows: changes on any write to it"""
+        pass
+
+    @abstractmethod
+    async def get_recent_medications(self, patient_id: UUID, limit: int = 5) -> List:
+        """Most recently added medications"""
+        pass
+
+    @abstractmethod
+    async def get_recent_activities(self, user_id: UUID, limit: int = 5) -> List[Activity]:
+        """Newest activity feed entries"""
+        pass
+
+    @abstractmethod
+    async def get_activity_page(self, user_id: UUID, limit: int, cursor: Optional[str] = None) -> KeysetPage:
+        """Keyset page of the activity feed, newest first; items are Activity entities"""
+        pass
+
+    @abstractmethod
+    def add_activity_entries(self, entries: List[ActivityEntry]) -> int:
+        """Write buffered activity entries, skipping event ids already stored"""
+        pass
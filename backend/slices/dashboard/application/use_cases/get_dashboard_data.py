@@ -1,17 +1,36 @@
 """
 Get dashboard data use case - ONLY summary/statistics operations
 """
+from typing import Optional, Tuple
+
+from shared.database.fan_out import QueryFanOut
+from shared.utils.pagination import KeysetPage
 from slices.dashboard.application.ports.dashboard_repository import DashboardRepositoryPort
 from slices.dashboard.domain.entities.dashboard_stats import DashboardData
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.patient_model import Patient
 
+# Entries shown in the dashboard's recent medications and recent activity lists
+RECENT_ITEMS_LIMIT = 5
+
 
 class GetDashboardDataUseCase:
     """Use case for retrieving complete dashboard data for a patient"""
 
-    def __init__(self, dashboard_repository: DashboardRepositoryPort):
+    def __init__(
+        self,
+        dashboard_repository: DashboardRepositoryPort,
+        fan_out: Optional[QueryFanOut[DashboardRepositoryPort]] = None
+    ):
         self.dashboard_repository = dashboard_repository
+        # Without a fan-out, the queries run one by one on the repository's session
+        self.fan_out = fan_out or QueryFanOut(
+            None, repository_factory=lambda db: self.dashboard_repository
+        )
+
+    async def get_version(self, user: User, patient: Patient) -> Tuple:
+        """Version stamp of the dashboard data, for conditional GET"""
+        return await self.dashboard_repository.get_version_stamp(user.id, patient.id)
 
     async def execute(self, user: User, patient: Patient) -> DashboardData:
         """
@@ -24,17 +43,14 @@ class GetDashboardDataUseCase:
         Returns:
             DashboardData: Complete dashboard data including stats and medical summary
         """
-        # Get dashboard statistics
-        stats = await self.dashboard_repository.get_dashboard_stats(patient.id)
-
-        # Get medical data summary
-        medical_summary = await self.dashboard_repository.get_medical_data_summary(patient.id)
-
-        # Get recent medications (returns empty list for now to avoid conversion issues)
-        recent_medications = []
-
-        # Get recent activities (returns empty list for now to avoid conversion issues)
-        recent_activities = []
+        # Statistics, summary and the two recent lists are independent: run them concurrently.
+        # Recent activity is one bounded read of the activity feed index.
+        stats, medical_summary, recent_medications, recent_activities = await self.fan_out.gather(
+            lambda repository: repository.get_dashboard_stats(patient.id),
+            lambda repository: repository.get_medical_data_summary(patient.id),
+            lambda repository: repository.get_recent_medications(patient.id, RECENT_ITEMS_LIMIT),
+            lambda repository: repository.get_recent_activities(user.id, RECENT_ITEMS_LIMIT),
+        )
 
         # Check if this is first visit (no previous activity)
         is_first_visit = stats.last_login is None
@@ -52,4 +68,13 @@ class GetDashboardDataUseCase:
             is_first_visit=is_first_visit
         )
 
-        return dashboard_data
\ No newline at end of file
+        return dashboard_data
+
+    async def get_activity_feed(self, user: User, limit: int, cursor: Optional[str] = None) -> KeysetPage:
+        """
+        Page of the user's activity feed, newest first
+
+        Raises:
+            ValidationException: If the cursor is malformed
+        """
+        return await self.dashboard_repository.get_activity_page(user.id, limit, cursor)
@@ -4,6 +4,7 @@ Dashboard statistics domain entities
 from dataclasses import dataclass, field
 from typing import Dict, Optional, List
 from datetime import datetime
+from uuid import UUID
 
 
 @dataclass
@@ -38,6 +39,44 @@ class Activity:
     type: str  # 'medication' | 'allergy' | 'surgery' | 'illness'
     description: str
     date: datetime
+    id: Optional[int] = None
+    action: Optional[str] = None  # 'created' | 'updated' | 'deleted'
+    resource_id: Optional[int] = None
+
+
+@dataclass
+class ActivityEntry:
+    """Activity log entry waiting to be written, built from a medical record change"""
+    event_id: UUID
+    patient_id: UUID
+    action: str
+    resource_type: str
+    resource_id: Optional[int]
+    label: Optional[str]
+    occurred_at: datetime
+
+
+# Feed wording per (resource_type, action)
+_ACTIVITY_DESCRIPTIONS = {
+    ("medication", "created"): "Medicamento añadido",
+    ("medication", "updated"): "Medicamento actualizado",
+    ("medication", "deleted"): "Medicamento eliminado",
+    ("allergy", "created"): "Alergia registrada",
+    ("allergy", "updated"): "Alergia actualizada",
+    ("allergy", "deleted"): "Alergia eliminada",
+    ("surgery", "created"): "Cirugía registrada",
+    ("surgery", "updated"): "Cirugía actualizada",
+    ("surgery", "deleted"): "Cirugía eliminada",
+    ("illness", "created"): "Enfermedad registrada",
+    ("illness", "updated"): "Enfermedad actualizada",
+    ("illness", "deleted"): "Enfermedad eliminada",
+}
+
+
+def describe_activity(resource_type: str, action: str, label: Optional[str]) -> str:
+    """Feed line for an activity, e.g. "Medicamento añadido: Losartán" """
+    description = _ACTIVITY_DESCRIPTIONS.get((resource_type, action), f"{resource_type} {action}")
+    return f"{description}: {label}" if label else description
 
 
 @dataclass
@@ -3,7 +3,7 @@ Dashboard domain models - ONLY dashboard-specific models
 Medical entity models (medications, allergies, surgeries, illnesses)
 are now in their respective dedicated slices following DEV_CONTEXT.md
 """
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, BigInteger
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, BigInteger, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -24,6 +24,14 @@ class DashboardActivityLog(Base):
     details = Column(Text, nullable=True)  # JSON-like string for additional data
     ip_address = Column(String(45), nullable=True)  # Support IPv6
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Domain event that produced the entry; makes re-delivered events idempotent
+    event_id = Column(String(36), nullable=True)
+
+    __table_args__ = (
+        # Activity feed: keyset pages per user, newest first
+        Index("ix_dashboard_activity_logs_user_id_created_at", user_id, created_at.desc(), id.desc()),
+        Index("ix_dashboard_activity_logs_event_id", event_id, unique=True),
+    )
 
     # Relationship
     user = relationship("User", backref="dashboard_activities")
@@ -0,0 +1,168 @@
+"""
+Write-behind buffer for the patient activity feed
+
+Medical record changes reach the event bus after their transaction commits.
+record_medical_activity() turns each one into a pending dashboard activity
+entry in memory, and a periodic job per worker writes the pending entries in
+one multi-row INSERT, so no request path writes the feed.
+
+Entries are keyed by event id: an event re-delivered by the outbox relay
+collapses with its buffered copy, and the INSERT skips event ids already
+stored. A flush that fails puts its entries back for the next attempt. Past
+max_pending the oldest entries are dropped instead of growing without bound
+while the database is unreachable. Entries recorded since the last flush are
+lost if the worker crashes; a normal shutdown flushes them.
+"""
+import logging
+import threading
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from shared.config.settings import settings
+from shared.events import (
+    AllergyChanged,
+    DomainEvent,
+    IllnessChanged,
+    MedicalRecordChanged,
+    MedicationChanged,
+    SurgeryChanged,
+)
+from slices.dashboard.application.ports.dashboard_repository import DashboardRepositoryPort
+from slices.dashboard.domain.entities.dashboard_stats import ActivityEntry
+
+logger = logging.getLogger(__name__)
+
+# Feed resource type per event class
+RESOURCE_TYPES = {
+    MedicationChanged: "medication",
+    AllergyChanged: "allergy",
+    SurgeryChanged: "surgery",
+    IllnessChanged: "illness",
+}
+
+
+class ActivityBuffer:
+    """Thread-safe buffer of activity entries waiting to be written"""
+
+    def __init__(self, max_pending: int = 10000):
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: Dict[UUID, ActivityEntry] = {}
+        self.recorded = 0
+        self.flushed = 0
+        self.dropped = 0
+
+    def record(self, domain_event: MedicalRecordChanged) -> bool:
+        """
+        Buffer the activity entry for a record change
+
+        Returns:
+            False if the event has no feed entry (bulk changes without a
+            record id, or record types the feed does not show)
+        """
+        resource_type = RESOURCE_TYPES.get(type(domain_event))
+        if resource_type is None or domain_event.record_id is None:
+            return False
+
+        entry = ActivityEntry(
+            event_id=domain_event.event_id,
+            patient_id=domain_event.patient_id,
+            action=domain_event.change,
+            resource_type=resource_type,
+            resource_id=domain_event.record_id,
+            label=domain_event.label,
+            occurred_at=domain_event.occurred_at,
+        )
+        with self._lock:
+            self._pending[entry.event_id] = entry
+            self.recorded += 1
+            self._trim()
+        return True
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, repository: DashboardRepositoryPort) -> int:
+        """
+        Write buffered entries through the repository
+
+        Returns:
+            Number of entries inserted
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        entries = sorted(pending.values(), key=lambda entry: entry.occurred_at)
+        try:
+            inserted = repository.add_activity_entries(entries)
+        except Exception:
+            self._restore(entries)
+            raise
+
+        with self._lock:
+            self.flushed += len(entries)
+        return inserted
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "recorded": self.recorded,
+                "flushed": self.flushed,
+                "dropped": self.dropped,
+            }
+
+    def _restore(self, entries: List[ActivityEntry]) -> None:
+        """Put the entries of a failed flush back; newer copies win"""
+        with self._lock:
+            restored = {entry.event_id: entry for entry in entries}
+            restored.update(self._pending)
+            self._pending = restored
+            self._trim()
+
+    def _trim(self) -> None:
+        """Drop the oldest entries past max_pending (lock held)"""
+        overflow = len(self._pending) - self.max_pending
+        if overflow <= 0:
+            return
+        oldest = sorted(self._pending.values(), key=lambda entry: entry.occurred_at)[:overflow]
+        for entry in oldest:
+            del self._pending[entry.event_id]
+        self.dropped += overflow
+        logger.warning("Activity buffer full: dropped %d entries", overflow)
+
+
+# Global instance storage
+_activity_buffer_instance: Optional[ActivityBuffer] = None
+
+
+def get_activity_buffer() -> ActivityBuffer:
+    """
+    Get or create the singleton activity buffer for this worker
+
+    Returns:
+        ActivityBuffer: The process-wide buffer
+    """
+    global _activity_buffer_instance
+
+    if _activity_buffer_instance is None:
+        _activity_buffer_instance = ActivityBuffer(settings.ACTIVITY_BUFFER_MAX_PENDING)
+    return _activity_buffer_instance
+
+
+def reset_activity_buffer() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _activity_buffer_instance
+    _activity_buffer_instance = None
+
+
+def record_medical_activity(domain_event: DomainEvent) -> None:
+    """Event handler: buffer a feed entry for medical record changes"""
+    if isinstance(domain_event, MedicalRecordChanged):
+        get_activity_buffer().record(domain_event)
@@ -3,67 +3,87 @@ Dashboard API endpoints with authentication
 """
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, status, Request, Response
 from sqlalchemy.orm import Session
 
-from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
-from slices.signup.domain.models.user_model import User
-from slices.signup.domain.models.patient_model import Patient
+from shared.config.settings import settings
+from shared.database.database import ReadSessionLocal, get_read_db
+from shared.database.fan_out import QueryFanOut
+from shared.exceptions.application_exceptions import ValidationException
+from shared.utils.etag import not_modified, version_etag
+from shared.utils.json_response import trusted_response
+from shared.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from slices.auth.infrastructure.api.auth_endpoints import get_current_patient
+from slices.auth.application.use_cases import AuthenticatedPrincipal
 
 from slices.dashboard.application.use_cases import GetDashboardDataUseCase
 from slices.dashboard.infrastructure.repositories.dashboard_repository import DashboardRepository
-from slices.dashboard.application.dto.dashboard_dto import DashboardDataDTO
+from slices.dashboard.application.dto.dashboard_dto import ActivityDTO, ActivityPageDTO, DashboardDataDTO
 
 router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 
 
-def get_dashboard_use_case(db: Session = Depends(get_db)) -> GetDashboardDataUseCase:
-    """Dependency to get dashboard use case"""
+def get_dashboard_use_case(db: Session = Depends(get_read_db)) -> GetDashboardDataUseCase:
+    """Dependency to get dashboard use case (read-only: served from a replica when configured)"""
     dashboard_repository = DashboardRepository(db)
-    return GetDashboardDataUseCase(dashboard_repository)
-
-
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
-    if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient record not found"
-        )
-    return patient
+    fan_out = QueryFanOut(
+        db,
+        ReadSessionLocal,
+        DashboardRepository,
+        max_concurrency=settings.DB_FAN_OUT_MAX_CONCURRENCY
+    )
+    return GetDashboardDataUseCase(dashboard_repository, fan_out)
 
 
 @router.get("/", response_model=DashboardDataDTO)
 async def get_dashboard_data(
-    current_user: User = Depends(get_current_user),
-    dashboard_use_case: GetDashboardDataUseCase = Depends(get_dashboard_use_case),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    dashboard_use_case: GetDashboardDataUseCase = Depends(get_dashboard_use_case)
 ):
     """
     Get complete dashboard data for authenticated patient
+
+    Answers 304 Not Modified when If-None-Match matches the current ETag.
     """
-    # Ensure user is a patient
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access dashboard data"
-        )
+    patient = principal.patient
 
-    # Get patient record
-    patient = await get_patient_from_user(current_user, db)
+    stamp = await dashboard_use_case.get_version(principal.user, patient)
+    cached = not_modified(request, response, version_etag("dashboard", patient.id, *stamp))
+    if cached:
+        return cached
 
     # Get dashboard data
-    dashboard_data = await dashboard_use_case.execute(current_user, patient)
-
-    return dashboard_data
-
-
-
-
+    dashboard_data = await dashboard_use_case.execute(principal.user, patient)
 
+    # Validate once here instead of dump + re-validate in FastAPI
+    return trusted_response(DashboardDataDTO.model_validate(dashboard_data, from_attributes=True), response)
 
 
+@router.get("/activity", response_model=ActivityPageDTO)
+async def get_activity_feed(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    dashboard_use_case: GetDashboardDataUseCase = Depends(get_dashboard_use_case)
+):
+    """
+    Get the authenticated patient's activity feed, newest first
 
+    Medical record changes appear a few seconds after they are made, once the
+    worker that handled them writes its buffered entries.
+    """
+    try:
+        page = await dashboard_use_case.get_activity_feed(principal.user, limit, cursor)
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
+    return ActivityPageDTO(
+        items=[ActivityDTO.model_validate(activity, from_attributes=True) for activity in page.items],
+        next_cursor=page.next_cursor,
+        limit=limit
+    )
@@ -0,0 +1,25 @@
+"""
+Dashboard background jobs (run by shared.scheduler)
+"""
+import logging
+
+from shared.database import SessionLocal
+from slices.dashboard.infrastructure.activity_buffer import get_activity_buffer
+from slices.dashboard.infrastructure.repositories.dashboard_repository import DashboardRepository
+
+logger = logging.getLogger(__name__)
+
+
+def flush_activity_log_job() -> int:
+    """Write this worker's buffered activity feed entries with multi-row INSERTs"""
+    buffer = get_activity_buffer()
+    if not buffer.pending():
+        return 0
+
+    db = SessionLocal()
+    try:
+        inserted = buffer.flush(DashboardRepository(db))
+        logger.debug("Flushed %d activity feed entries", inserted)
+        return inserted
+    finally:
+        db.close()
@@ -1,13 +1,17 @@
 """
 Dashboard repository implementation using SQLAlchemy
 """
+import json
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc
+from sqlalchemy import and_, func, desc, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 
+from shared.database.version_stamps import collection_stamp, read_version_stamp, row_stamp
+from shared.utils.pagination import KeysetPage, paginate_keyset
 from slices.dashboard.application.ports.dashboard_repository import DashboardRepositoryPort
 # Import medical models from dedicated slices for dashboard queries
 from slices.medications.domain.models.medication_model import PatientMedication
@@ -17,10 +21,22 @@ from slices.illnesses.domain.models.illness_model import PatientIllness
 
 # Import dashboard-specific models only
 from slices.dashboard.domain.models.medical_models import DashboardActivityLog
-from slices.dashboard.domain.entities.dashboard_stats import DashboardStats, MedicalDataSummary
+from slices.dashboard.domain.entities.dashboard_stats import (
+    Activity,
+    ActivityEntry,
+    DashboardStats,
+    MedicalDataSummary,
+    describe_activity,
+)
 from slices.signup.domain.models.patient_model import Patient
 from slices.signup.domain.models.user_model import User
 
+# Columns read for feed items (id and created_at also build the cursor)
+ACTIVITY_FIELDS = ["id", "created_at", "action", "resource_type", "resource_id", "details"]
+
+# Rows per INSERT statement when writing buffered entries
+ACTIVITY_INSERT_BATCH_SIZE = 1000
+
 
 class DashboardRepository(DashboardRepositoryPort):
     """SQLAlchemy implementation of dashboard repository"""
@@ -109,6 +125,24 @@ class DashboardRepository(DashboardRepositoryPort):
         except SQLAlchemyError as e:
             raise Exception(f"Database error getting dashboard stats: {str(e)}")
 
+    async def get_version_stamp(self, user_id: UUID, patient_id: UUID) -> Tuple:
+        """Patient and user rows plus every medical collection, in one query"""
+        try:
+            return read_version_stamp(
+                self.db,
+                row_stamp(Patient, Patient.id == patient_id),
+                row_stamp(User, User.id == user_id),
+                collection_stamp(PatientMedication, PatientMedication.patient_id == patient_id),
+                collection_stamp(PatientAllergy, PatientAllergy.patient_id == patient_id),
+                collection_stamp(PatientSurgery, PatientSurgery.patient_id == patient_id),
+                collection_stamp(PatientIllness, PatientIllness.patient_id == patient_id),
+                # Feed entries are written after the change, by the activity flush job
+                [select(func.max(DashboardActivityLog.created_at))
+                 .where(DashboardActivityLog.user_id == user_id).scalar_subquery()],
+            )
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting dashboard version: {str(e)}")
+
     async def get_medical_data_summary(self, patient_id: UUID) -> MedicalDataSummary:
         """Get summary of all medical data for a patient"""
         try:
@@ -196,53 +230,75 @@ class DashboardRepository(DashboardRepositoryPort):
         except SQLAlchemyError as e:
             raise Exception(f"Database error getting recent medications: {str(e)}")
 
-    async def get_recent_activities(self, patient_id: UUID, limit: int = 5) -> List[Dict]:
-        """Get recent activities for dashboard display"""
-        try:
-            activities = []
-
-            # Get recent medication activities
-            recent_medications = self.db.query(PatientMedication).filter(
-                PatientMedication.patient_id == patient_id
-            ).order_by(desc(PatientMedication.created_at)).limit(2).all()
+    async def get_recent_activities(self, user_id: UUID, limit: int = 5) -> List[Activity]:
+        """Get recent activities for dashboard display: the first page of the activity feed"""
+        page = await self.get_activity_page(user_id, limit)
+        return page.items
 
-            for med in recent_medications:
-                activities.append({
-                    'type': 'medication',
-                    'description': f'Medicamento añadido: {med.medication_name}',
-                    'date': med.created_at
-                })
-
-            # Get recent allergy activities
-            recent_allergies = self.db.query(PatientAllergy).filter(
-                PatientAllergy.patient_id == patient_id
-            ).order_by(desc(PatientAllergy.created_at)).limit(2).all()
-
-            for allergy in recent_allergies:
-                activities.append({
-                    'type': 'allergy',
-                    'description': f'Alergia registrada: {allergy.allergen}',
-                    'date': allergy.created_at
-                })
-
-            # Get recent surgery activities
-            recent_surgeries = self.db.query(PatientSurgery).filter(
-                PatientSurgery.patient_id == patient_id
-            ).order_by(desc(PatientSurgery.created_at)).limit(1).all()
+    async def get_activity_page(self, user_id: UUID, limit: int, cursor: Optional[str] = None) -> KeysetPage:
+        """Page of a user's activity feed, newest first (one range scan of the feed index)"""
+        try:
+            query = self.db.query(DashboardActivityLog).filter(DashboardActivityLog.user_id == user_id)
+            page = paginate_keyset(query, DashboardActivityLog, limit, cursor, ACTIVITY_FIELDS)
+            page.items = [self._to_activity(row) for row in page.items]
+            return page
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting activity feed: {str(e)}")
 
-            for surgery in recent_surgeries:
-                activities.append({
-                    'type': 'surgery',
-                    'description': f'Cirugía registrada: {surgery.procedure_name}',
-                    'date': surgery.created_at
-                })
+    def add_activity_entries(self, entries: List[ActivityEntry]) -> int:
+        """
+        Write buffered activity entries with multi-row INSERTs
 
-            # Sort all activities by date and limit
-            activities.sort(key=lambda x: x['date'], reverse=True)
-            return activities[:limit]
+        Patients are resolved to their users in one query; entries of patients
+        deleted since are skipped, and event ids already stored are ignored.
+        """
+        if not entries:
+            return 0
 
+        try:
+            patient_ids = {entry.patient_id for entry in entries}
+            user_ids = dict(self.db.execute(
+                select(Patient.id, Patient.user_id).where(Patient.id.in_(patient_ids))
+            ).all())
+
+            rows = [
+                {
+                    "user_id": user_ids[entry.patient_id],
+                    "action": entry.action,
+                    "resource_type": entry.resource_type,
+                    "resource_id": entry.resource_id,
+                    "details": json.dumps({"label": entry.label}, ensure_ascii=False),
+                    "event_id": str(entry.event_id),
+                    # When the change happened, not when the buffer flushed
+                    "created_at": entry.occurred_at,
+                }
+                for entry in entries
+                if entry.patient_id in user_ids
+            ]
+
+            inserted = 0
+            for start in range(0, len(rows), ACTIVITY_INSERT_BATCH_SIZE):
+                statement = pg_insert(DashboardActivityLog).values(
+                    rows[start:start + ACTIVITY_INSERT_BATCH_SIZE]
+                ).on_conflict_do_nothing(index_elements=["event_id"])
+                inserted += self.db.execute(statement).rowcount
+            self.db.commit()
+            return inserted
         except SQLAlchemyError as e:
-            raise Exception(f"Database error getting recent activities: {str(e)}")
+            self.db.rollback()
+            raise Exception(f"Database error adding activity entries: {str(e)}")
+
+    @staticmethod
+    def _to_activity(row: Dict) -> Activity:
+        details = json.loads(row["details"]) if row["details"] else {}
+        return Activity(
+            type=row["resource_type"],
+            description=describe_activity(row["resource_type"], row["action"], details.get("label")),
+            date=row["created_at"],
+            id=row["id"],
+            action=row["action"],
+            resource_id=row["resource_id"],
+        )
 
     # Private helper methods
     def _calculate_profile_completeness(self, patient: Optional[Patient]) -> float:
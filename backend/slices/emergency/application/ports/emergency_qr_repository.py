@@ -3,7 +3,8 @@ Emergency QR Repository Port
 Defines the interface for emergency QR code persistence operations
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Optional, List, Tuple
 from uuid import UUID
 
 from slices.emergency.domain.models.emergency_qr_model import EmergencyQR
@@ -50,4 +51,9 @@ class EmergencyQRRepositoryPort(ABC):
     @abstractmethod
     def get_with_patient_data(self, qr_uuid: UUID) -> Optional[EmergencyQR]:
         """Get emergency QR with full patient data loaded"""
+        pass
+
+    @abstractmethod
+    def add_access_counts(self, counts: Dict[UUID, Tuple[int, datetime]]) -> int:
+        """Add buffered scan counts and last access times (QR id -> (count, last access))"""
         pass
\ No newline at end of file
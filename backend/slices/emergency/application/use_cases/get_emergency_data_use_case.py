@@ -6,11 +6,13 @@ from typing import Optional
 from uuid import UUID
 from datetime import datetime
 
+from shared.database.fan_out import QueryFanOut
 from slices.emergency.application.ports.emergency_qr_repository import EmergencyQRRepositoryPort
 from slices.emergency.application.dto.emergency_data_dto import (
     EmergencyDataDto, EmergencyContactDto, MedicationDto, AllergyDto,
     DiseaseDto, SurgeryDto, GynecologicalHistoryDto
 )
+from slices.emergency.infrastructure.persistence.qr_access_counter import QRAccessCounter, get_qr_access_counter
 from slices.signup.infrastructure.persistence.patient_repository import PatientRepository
 from sqlalchemy.orm import Session
 
@@ -22,13 +24,18 @@ class GetEmergencyDataUseCase:
         self,
         emergency_qr_repository: EmergencyQRRepositoryPort,
         patient_repository: PatientRepository,
-        db: Session
+        db: Session,
+        access_counter: Optional[QRAccessCounter] = None,
+        fan_out: Optional[QueryFanOut[Session]] = None
     ):
         self.emergency_qr_repository = emergency_qr_repository
         self.patient_repository = patient_repository
         self.db = db
+        self.access_counter = access_counter or get_qr_access_counter()
+        # Without a fan-out, the history queries run one by one on db
+        self.fan_out = fan_out or QueryFanOut(db)
 
-    def execute(self, qr_uuid: UUID, requesting_user_id: UUID) -> EmergencyDataDto:
+    async def execute(self, qr_uuid: UUID, requesting_user_id: UUID) -> EmergencyDataDto:
         """
         Get complete emergency medical data by QR code
 
@@ -56,9 +63,8 @@ class GetEmergencyDataUseCase:
         if patient.user_id != requesting_user_id:
             raise ValueError("Access denied: QR code belongs to different user")
 
-        # Record access
-        emergency_qr.record_access()
-        self.emergency_qr_repository.update(emergency_qr)
+        # Record access (buffered; flushed to emergency_qrs in batches by a background job)
+        self.access_counter.record(emergency_qr.id)
 
         # Build emergency contact DTO
         emergency_contact = EmergencyContactDto(
@@ -68,12 +74,14 @@ class GetEmergencyDataUseCase:
             phone_alt=patient.emergency_contact_phone_alt
         )
 
-        # Get medical history data
-        medications = self._get_patient_medications(patient.id)
-        allergies = self._get_patient_allergies(patient.id)
-        diseases = self._get_patient_diseases(patient.id)
-        surgeries = self._get_patient_surgeries(patient.id)
-        gynecological = self._get_patient_gynecological_history(patient.id)
+        # Get medical history data: independent reads, run concurrently
+        medications, allergies, diseases, surgeries, gynecological = await self.fan_out.gather(
+            lambda db: self._get_patient_medications(db, patient.id),
+            lambda db: self._get_patient_allergies(db, patient.id),
+            lambda db: self._get_patient_diseases(db, patient.id),
+            lambda db: self._get_patient_surgeries(db, patient.id),
+            lambda db: self._get_patient_gynecological_history(db, patient.id),
+        )
 
         # Calculate age
         today = datetime.now().date()
@@ -120,11 +128,11 @@ class GetEmergencyDataUseCase:
             last_updated=patient.updated_at
         )
 
-    def _get_patient_medications(self, patient_id: UUID) -> list[MedicationDto]:
+    def _get_patient_medications(self, db: Session, patient_id: UUID) -> list[MedicationDto]:
         """Get patient's current medications"""
         from slices.profile.domain.models.medication_model import Medication
 
-        medications = self.db.query(Medication).filter(
+        medications = db.query(Medication).filter(
             Medication.patient_id == patient_id
         ).all()
 
@@ -140,11 +148,11 @@ class GetEmergencyDataUseCase:
             for med in medications
         ]
 
-    def _get_patient_allergies(self, patient_id: UUID) -> list[AllergyDto]:
+    def _get_patient_allergies(self, db: Session, patient_id: UUID) -> list[AllergyDto]:
         """Get patient's allergies"""
         from slices.profile.domain.models.allergy_model import Allergy
 
-        allergies = self.db.query(Allergy).filter(
+        allergies = db.query(Allergy).filter(
             Allergy.patient_id == patient_id
         ).all()
 
@@ -160,11 +168,11 @@ class GetEmergencyDataUseCase:
             for allergy in allergies
         ]
 
-    def _get_patient_diseases(self, patient_id: UUID) -> list[DiseaseDto]:
+    def _get_patient_diseases(self, db: Session, patient_id: UUID) -> list[DiseaseDto]:
         """Get patient's diseases/conditions"""
         from slices.profile.domain.models.disease_model import Disease
 
-        diseases = self.db.query(Disease).filter(
+        diseases = db.query(Disease).filter(
             Disease.patient_id == patient_id
         ).all()
 
@@ -179,11 +187,11 @@ class GetEmergencyDataUseCase:
             for disease in diseases
         ]
 
-    def _get_patient_surgeries(self, patient_id: UUID) -> list[SurgeryDto]:
+    def _get_patient_surgeries(self, db: Session, patient_id: UUID) -> list[SurgeryDto]:
         """Get patient's surgery history"""
         from slices.profile.domain.models.surgery_model import Surgery
 
-        surgeries = self.db.query(Surgery).filter(
+        surgeries = db.query(Surgery).filter(
             Surgery.patient_id == patient_id
         ).all()
 
@@ -199,11 +207,11 @@ class GetEmergencyDataUseCase:
             for surgery in surgeries
         ]
 
-    def _get_patient_gynecological_history(self, patient_id: UUID) -> Optional[GynecologicalHistoryDto]:
+    def _get_patient_gynecological_history(self, db: Session, patient_id: UUID) -> Optional[GynecologicalHistoryDto]:
         """Get patient's gynecological history if applicable"""
         from slices.profile.domain.models.gynecological_model import GynecologicalHistory
 
-        gyn_history = self.db.query(GynecologicalHistory).filter(
+        gyn_history = db.query(GynecologicalHistory).filter(
             GynecologicalHistory.patient_id == patient_id
         ).first()
 
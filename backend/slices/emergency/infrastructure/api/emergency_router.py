@@ -7,7 +7,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from shared.database import get_db
+from shared.config.settings import settings
+from shared.database import SessionLocal, get_db
+from shared.database.fan_out import QueryFanOut
 from slices.auth.infrastructure.api.auth_endpoints import get_current_user
 from slices.emergency.infrastructure.persistence.emergency_qr_repository import EmergencyQRRepository
 from slices.emergency.application.use_cases.generate_qr_use_case import GenerateQRUseCase
@@ -114,10 +116,13 @@ async def get_emergency_data(
         # Initialize repositories and use case
         emergency_qr_repository = EmergencyQRRepository(db)
         patient_repository = PatientRepository(db)
-        use_case = GetEmergencyDataUseCase(emergency_qr_repository, patient_repository, db)
+        fan_out = QueryFanOut(db, SessionLocal, max_concurrency=settings.DB_FAN_OUT_MAX_CONCURRENCY)
+        use_case = GetEmergencyDataUseCase(
+            emergency_qr_repository, patient_repository, db, fan_out=fan_out
+        )
 
         # Execute use case
-        result = use_case.execute(
+        result = await use_case.execute(
             qr_uuid=qr_uuid,
             requesting_user_id=current_user["id"]
         )
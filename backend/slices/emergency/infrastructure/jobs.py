@@ -0,0 +1,25 @@
+"""
+Emergency QR background jobs (run by shared.scheduler)
+"""
+import logging
+
+from shared.database import SessionLocal
+from slices.emergency.infrastructure.persistence.emergency_qr_repository import EmergencyQRRepository
+from slices.emergency.infrastructure.persistence.qr_access_counter import get_qr_access_counter
+
+logger = logging.getLogger(__name__)
+
+
+def flush_qr_access_counts_job() -> int:
+    """Write this worker's buffered QR scan counts in one batch UPDATE"""
+    counter = get_qr_access_counter()
+    if not counter.pending():
+        return 0
+
+    db = SessionLocal()
+    try:
+        updated = counter.flush(EmergencyQRRepository(db))
+        logger.debug("Flushed scan counts for %d emergency QR codes", updated)
+        return updated
+    finally:
+        db.close()
@@ -2,10 +2,11 @@
 Emergency QR Repository Implementation
 Concrete implementation of emergency QR repository following hexagonal architecture
 """
-from typing import Optional, List
+from datetime import datetime
+from typing import Dict, Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, func, update
 
 from slices.emergency.domain.models.emergency_qr_model import EmergencyQR
 from slices.emergency.application.ports.emergency_qr_repository import EmergencyQRRepositoryPort
@@ -68,4 +69,32 @@ class EmergencyQRRepository(EmergencyQRRepositoryPort):
         """Get emergency QR with full patient data loaded"""
         return self.db.query(EmergencyQR).options(
             joinedload(EmergencyQR.patient)
-        ).filter(EmergencyQR.qr_uuid == qr_uuid).first()
\ No newline at end of file
+        ).filter(EmergencyQR.qr_uuid == qr_uuid).first()
+
+    def add_access_counts(self, counts: Dict[UUID, Tuple[int, datetime]]) -> int:
+        """
+        Apply buffered scan counts in one executemany UPDATE
+
+        Rows are updated in id order so concurrent flushes from several
+        workers lock them in the same order.
+        """
+        if not counts:
+            return 0
+
+        table = EmergencyQR.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("qr_id"))
+            .values(
+                access_count=table.c.access_count + bindparam("accesses"),
+                # GREATEST ignores NULL, so the first access sets the timestamp
+                last_accessed_at=func.greatest(table.c.last_accessed_at, bindparam("accessed_at")),
+            )
+        )
+        rows = [
+            {"qr_id": qr_id, "accesses": accesses, "accessed_at": accessed_at}
+            for qr_id, (accesses, accessed_at) in sorted(counts.items(), key=lambda item: str(item[0]))
+        ]
+        self.db.execute(statement, rows)
+        self.db.commit()
+        return len(rows)
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+Write-behind counters for emergency QR scans
+
+Scans are counted in memory per worker and written to emergency_qrs
+(access_count, last_accessed_at) in one batch UPDATE per flush. This keeps the
+emergency read path free of row writes, so hot QR rows are not lock contention
+points. A flush that fails puts its counts back for the next attempt. Counts
+recorded since the last flush are lost if the worker crashes; a normal
+shutdown flushes them.
+"""
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from slices.emergency.application.ports.emergency_qr_repository import EmergencyQRRepositoryPort
+
+logger = logging.getLogger(__name__)
+
+
+class QRAccessCounter:
+    """Thread-safe buffer of scan counts per QR id"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[UUID, Tuple[int, datetime]] = {}
+        self.recorded = 0
+        self.flushed = 0
+
+    def record(self, qr_id: UUID, accessed_at: Optional[datetime] = None) -> None:
+        """Count one scan of a QR code"""
+        accessed_at = accessed_at or datetime.utcnow()
+        with self._lock:
+            count, last_accessed_at = self._pending.get(qr_id, (0, accessed_at))
+            self._pending[qr_id] = (count + 1, max(last_accessed_at, accessed_at))
+            self.recorded += 1
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self, repository: EmergencyQRRepositoryPort) -> int:
+        """
+        Write buffered counts through the repository
+
+        Returns:
+            Number of QR rows updated
+        """
+        with self._lock:
+            counts, self._pending = self._pending, {}
+
+        if not counts:
+            return 0
+
+        try:
+            updated = repository.add_access_counts(counts)
+        except Exception:
+            self._restore(counts)
+            raise
+
+        with self._lock:
+            self.flushed += sum(count for count, _ in counts.values())
+        return updated
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "pending_qrs": len(self._pending),
+                "recorded": self.recorded,
+                "flushed": self.flushed,
+            }
+
+    def _restore(self, counts: Dict[UUID, Tuple[int, datetime]]) -> None:
+        """Merge counts from a failed flush back into the buffer"""
+        with self._lock:
+            for qr_id, (count, accessed_at) in counts.items():
+                pending_count, pending_at = self._pending.get(qr_id, (0, accessed_at))
+                self._pending[qr_id] = (pending_count + count, max(pending_at, accessed_at))
+
+
+# Global instance storage
+_qr_access_counter_instance: Optional[QRAccessCounter] = None
+
+
+def get_qr_access_counter() -> QRAccessCounter:
+    """
+    Get or create the singleton QR access counter for this worker
+
+    Returns:
+        QRAccessCounter: The process-wide counter
+    """
+    global _qr_access_counter_instance
+
+    if _qr_access_counter_instance is None:
+        _qr_access_counter_instance = QRAccessCounter()
+    return _qr_access_counter_instance
+
+
+def reset_qr_access_counter() -> None:
+    """
+    Reset the singleton instance (useful for testing)
+    """
+    global _qr_access_counter_instance
+    _qr_access_counter_instance = None
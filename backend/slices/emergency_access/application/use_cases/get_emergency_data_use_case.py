@@ -2,10 +2,12 @@
 Get Emergency Data Use Case
 Aggregates all patient information for paramedic emergency access
 """
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from fastapi import HTTPException, status
 
+from shared.database.fan_out import QueryFanOut
+from shared.utils.single_flight import SingleFlight
 from slices.emergency_access.application.dto.emergency_data_dto import (
     EmergencyDataResponseDTO,
     EmergencyMedicationDTO,
@@ -13,14 +15,32 @@ from slices.emergency_access.application.dto.emergency_data_dto import (
     EmergencySurgeryDTO,
     EmergencyIllnessDTO,
 )
+from slices.emergency_access.domain.models.emergency_read_models import (
+    EmergencyPatientRow,
+    EmergencyMedicationRow,
+    EmergencyAllergyRow,
+    EmergencySurgeryRow,
+    EmergencyIllnessRow,
+)
 from slices.emergency_access.infrastructure.repositories.emergency_data_repository import EmergencyDataRepository
 
+# Several paramedics scanning the same QR at once share one load
+_emergency_data_flight = SingleFlight("emergency_data")
+
 
 class GetEmergencyDataUseCase:
     """Use case for fetching patient emergency data by QR code"""
 
-    def __init__(self, repository: EmergencyDataRepository):
+    def __init__(
+        self,
+        repository: EmergencyDataRepository,
+        fan_out: Optional[QueryFanOut[EmergencyDataRepository]] = None
+    ):
         self.repository = repository
+        # Without a fan-out, the queries run one by one on the repository's session
+        self.fan_out = fan_out or QueryFanOut(
+            repository.db, repository_factory=lambda db: self.repository
+        )
 
     async def execute(self, qr_code: UUID) -> EmergencyDataResponseDTO:
         """
@@ -35,8 +55,17 @@ class GetEmergencyDataUseCase:
         Raises:
             HTTPException: If patient not found (404)
         """
+        # Concurrent requests for the same QR code await the load already in flight
+        return await _emergency_data_flight.do(
+            qr_code, lambda: self._load_emergency_data(qr_code)
+        )
+
+    async def _load_emergency_data(self, qr_code: UUID) -> EmergencyDataResponseDTO:
+        """Patient lookup, then the four medical queries concurrently"""
         # Get patient by QR code
-        patient = self.repository.get_patient_by_qr_code(qr_code)
+        [patient] = await self.fan_out.gather(
+            lambda repository: repository.get_patient_by_qr_code(qr_code)
+        )
 
         if not patient:
             raise HTTPException(
@@ -44,12 +73,25 @@ class GetEmergencyDataUseCase:
                 detail="Patient not found"
             )
 
-        # Get medical data
-        medications = self.repository.get_patient_medications(patient.id)
-        allergies = self.repository.get_patient_allergies(patient.id)
-        surgeries = self.repository.get_patient_surgeries(patient.id)
-        illnesses = self.repository.get_patient_illnesses(patient.id)
-
+        # Get medical data: independent reads, so wait for the slowest rather than the sum
+        medications, allergies, surgeries, illnesses = await self.fan_out.gather(
+            lambda repository: repository.get_patient_medications(patient.id),
+            lambda repository: repository.get_patient_allergies(patient.id),
+            lambda repository: repository.get_patient_surgeries(patient.id),
+            lambda repository: repository.get_patient_illnesses(patient.id),
+        )
+
+        return self._build_response(patient, medications, allergies, surgeries, illnesses)
+
+    def _build_response(
+        self,
+        patient: EmergencyPatientRow,
+        medications: List[EmergencyMedicationRow],
+        allergies: List[EmergencyAllergyRow],
+        surgeries: List[EmergencySurgeryRow],
+        illnesses: List[EmergencyIllnessRow]
+    ) -> EmergencyDataResponseDTO:
+        """Map the read models to the response DTO"""
         # Build DTOs
         medication_dtos = [
             EmergencyMedicationDTO(
@@ -99,7 +141,7 @@ class GetEmergencyDataUseCase:
         response_data = {
             # Basic Information
             "full_name": patient.full_name,
-            "document_type": patient.document_type.name if patient.document_type else "",
+            "document_type": patient.document_type_name or "",
             "document_number": patient.document_number,
             "birth_date": patient.birth_date,
             "biological_sex": patient.biological_sex,
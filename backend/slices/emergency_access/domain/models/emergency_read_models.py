@@ -0,0 +1,82 @@
+"""
+Read models for emergency access
+
+Column projections of the rows behind the paramedic view. Field names match
+the ORM attributes they are read from (see shared.database.read_models).
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class EmergencyPatientRow:
+    """Patient fields shown in the emergency view"""
+    id: UUID
+    first_name: str
+    last_name: str
+    document_type_name: Optional[str]
+    document_number: str
+    birth_date: date
+    biological_sex: Optional[str]
+    gender: Optional[str]
+    blood_type: Optional[str]
+    eps: Optional[str]
+    occupation: Optional[str]
+    residence_address: Optional[str]
+    residence_country: Optional[str]
+    residence_city: Optional[str]
+    emergency_contact_name: Optional[str]
+    emergency_contact_relationship: Optional[str]
+    emergency_contact_phone: Optional[str]
+    emergency_contact_phone_alt: Optional[str]
+    is_pregnant: Optional[bool]
+    pregnancy_weeks: Optional[int]
+    last_menstruation_date: Optional[date]
+    pregnancies_count: Optional[int]
+    births_count: Optional[int]
+    cesareans_count: Optional[int]
+    abortions_count: Optional[int]
+    contraceptive_method: Optional[str]
+
+    @property
+    def full_name(self) -> str:
+        """Same format as Patient.full_name"""
+        return f"{self.first_name} {self.last_name}"
+
+
+@dataclass(frozen=True, slots=True)
+class EmergencyMedicationRow:
+    medication_name: str
+    dosage: str
+    frequency: str
+    is_active: bool
+    notes: Optional[str]
+    prescribed_by: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class EmergencyAllergyRow:
+    allergen: str
+    severity_level: str
+    reaction_description: Optional[str]
+    notes: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class EmergencySurgeryRow:
+    procedure_name: str
+    surgery_date: date
+    hospital_name: Optional[str]
+    complications: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class EmergencyIllnessRow:
+    illness_name: str
+    diagnosis_date: date
+    status: str
+    is_chronic: bool
+    treatment_description: Optional[str]
+    cie10_code: Optional[str]
@@ -2,12 +2,16 @@
 Emergency Access API Router
 Provides paramedic-only access to patient emergency data via QR code
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from shared.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
+from shared.config.settings import settings
+from shared.database import CriticalReadSessionLocal, get_critical_read_db
+from shared.database.fan_out import QueryFanOut
+from shared.utils.json_response import trusted_response
+from slices.auth.application.use_cases import AuthenticatedPrincipal
+from slices.auth.infrastructure.api.auth_endpoints import get_critical_principal
 from slices.signup.domain.models.user_model import User
 from slices.emergency_access.application.dto.emergency_data_dto import EmergencyDataResponseDTO
 from slices.emergency_access.application.use_cases.get_emergency_data_use_case import GetEmergencyDataUseCase
@@ -18,13 +22,13 @@ router = APIRouter(prefix="/api/emergency", tags=["Emergency Access"])
 
 
 def get_current_paramedic_user(
-    current_user: User = Depends(get_current_user)
+    principal: AuthenticatedPrincipal = Depends(get_critical_principal)
 ) -> User:
     """
-    Dependency to verify user is a paramedic
+    Dependency to verify user is a paramedic (token lookup on the critical pool)
 
     Args:
-        current_user: Current authenticated user
+        principal: Current authenticated principal
 
     Returns:
         User object if user_type is 'paramedic'
@@ -32,6 +36,7 @@ def get_current_paramedic_user(
     Raises:
         HTTPException 403: If user is not a paramedic
     """
+    current_user = principal.user
     if current_user.user_type != "paramedic":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -43,9 +48,9 @@ def get_current_paramedic_user(
 @router.get("/{qr_code}", response_model=EmergencyDataResponseDTO)
 async def get_emergency_data(
     qr_code: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_critical_read_db),
     paramedic_user: User = Depends(get_current_paramedic_user)
-) -> EmergencyDataResponseDTO:
+) -> Response:
     """
     Get patient emergency data by QR code
 
@@ -60,7 +65,7 @@ async def get_emergency_data(
 
     Args:
         qr_code: Patient's unique QR code UUID
-        db: Database session
+        db: Database session (critical pool, replica reads)
         paramedic_user: Current authenticated paramedic user
 
     Returns:
@@ -73,9 +78,16 @@ async def get_emergency_data(
     """
     # Initialize repository and use case
     repository = EmergencyDataRepository(db)
-    use_case = GetEmergencyDataUseCase(repository)
+    fan_out = QueryFanOut(
+        db,
+        CriticalReadSessionLocal,
+        EmergencyDataRepository,
+        max_concurrency=settings.DB_CRITICAL_FAN_OUT_MAX_CONCURRENCY
+    )
+    use_case = GetEmergencyDataUseCase(repository, fan_out)
 
     # Execute use case
     result = await use_case.execute(qr_code)
 
-    return result
+    # The use case builds the DTO itself; serialize it without re-validation
+    return trusted_response(result)
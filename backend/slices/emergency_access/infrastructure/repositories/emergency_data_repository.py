@@ -1,12 +1,25 @@
 """
 Emergency Data Repository for paramedic access
 Aggregates patient data from multiple tables
+
+Reads project only the columns the emergency view shows into slotted read
+models (shared.database.read_models) instead of loading ORM entities.
 """
 from typing import Optional, List
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
-
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from shared.database.read_models import fetch_all, fetch_one, project
+from slices.emergency_access.domain.models.emergency_read_models import (
+    EmergencyPatientRow,
+    EmergencyMedicationRow,
+    EmergencyAllergyRow,
+    EmergencySurgeryRow,
+    EmergencyIllnessRow,
+)
 from slices.signup.domain.models.patient_model import Patient
+from slices.signup.domain.models.document_type_model import DocumentType
 from slices.medications.domain.models.medication_model import PatientMedication
 from slices.allergies.domain.models.allergy_model import PatientAllergy
 from slices.surgeries.domain.models.surgery_model import PatientSurgery
@@ -19,7 +32,7 @@ class EmergencyDataRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_patient_by_qr_code(self, qr_code: UUID) -> Optional[Patient]:
+    def get_patient_by_qr_code(self, qr_code: UUID) -> Optional[EmergencyPatientRow]:
         """
         Get patient by QR code
 
@@ -27,15 +40,16 @@ class EmergencyDataRepository:
             qr_code: Patient's unique QR code UUID
 
         Returns:
-            Patient object or None if not found
+            Patient read model or None if not found
         """
-        return self.db.query(Patient).filter(
-            Patient.qr_code == qr_code
-        ).options(
-            joinedload(Patient.document_type)
-        ).first()
-
-    def get_patient_medications(self, patient_id: UUID) -> List[PatientMedication]:
+        stmt = select(
+            *project(EmergencyPatientRow, Patient, document_type_name=DocumentType.name)
+        ).outerjoin(
+            DocumentType, DocumentType.id == Patient.document_type_id
+        ).where(Patient.qr_code == qr_code)
+        return fetch_one(self.db, EmergencyPatientRow, stmt)
+
+    def get_patient_medications(self, patient_id: UUID) -> List[EmergencyMedicationRow]:
         """
         Get all active medications for a patient
 
@@ -45,12 +59,13 @@ class EmergencyDataRepository:
         Returns:
             List of active medications
         """
-        return self.db.query(PatientMedication).filter(
+        stmt = select(*project(EmergencyMedicationRow, PatientMedication)).where(
             PatientMedication.patient_id == patient_id,
             PatientMedication.is_active == True
-        ).order_by(PatientMedication.created_at.desc()).all()
+        ).order_by(PatientMedication.created_at.desc())
+        return fetch_all(self.db, EmergencyMedicationRow, stmt)
 
-    def get_patient_allergies(self, patient_id: UUID) -> List[PatientAllergy]:
+    def get_patient_allergies(self, patient_id: UUID) -> List[EmergencyAllergyRow]:
         """
         Get all allergies for a patient
 
@@ -60,11 +75,12 @@ class EmergencyDataRepository:
         Returns:
             List of allergies
         """
-        return self.db.query(PatientAllergy).filter(
+        stmt = select(*project(EmergencyAllergyRow, PatientAllergy)).where(
             PatientAllergy.patient_id == patient_id
-        ).order_by(PatientAllergy.severity_level.desc()).all()
+        ).order_by(PatientAllergy.severity_level.desc())
+        return fetch_all(self.db, EmergencyAllergyRow, stmt)
 
-    def get_patient_surgeries(self, patient_id: UUID) -> List[PatientSurgery]:
+    def get_patient_surgeries(self, patient_id: UUID) -> List[EmergencySurgeryRow]:
         """
         Get all surgeries for a patient
 
@@ -74,11 +90,12 @@ class EmergencyDataRepository:
         Returns:
             List of surgeries ordered by date (most recent first)
         """
-        return self.db.query(PatientSurgery).filter(
+        stmt = select(*project(EmergencySurgeryRow, PatientSurgery)).where(
             PatientSurgery.patient_id == patient_id
-        ).order_by(PatientSurgery.surgery_date.desc()).all()
+        ).order_by(PatientSurgery.surgery_date.desc())
+        return fetch_all(self.db, EmergencySurgeryRow, stmt)
 
-    def get_patient_illnesses(self, patient_id: UUID) -> List[PatientIllness]:
+    def get_patient_illnesses(self, patient_id: UUID) -> List[EmergencyIllnessRow]:
         """
         Get all active/chronic illnesses for a patient
 
@@ -88,9 +105,10 @@ class EmergencyDataRepository:
         Returns:
             List of illnesses (chronic conditions first)
         """
-        return self.db.query(PatientIllness).filter(
+        stmt = select(*project(EmergencyIllnessRow, PatientIllness)).where(
             PatientIllness.patient_id == patient_id
         ).order_by(
             PatientIllness.is_chronic.desc(),
             PatientIllness.diagnosis_date.desc()
-        ).all()
+        )
+        return fetch_all(self.db, EmergencyIllnessRow, stmt)
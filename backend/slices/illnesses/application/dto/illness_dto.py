@@ -5,6 +5,8 @@ from datetime import datetime, date
 from typing import Optional
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
+from shared.utils.batch import BatchRequestDTO
+
 
 class CreateIllnessDTO(BaseModel):
     """DTO for creating a new illness"""
@@ -30,6 +32,15 @@ class UpdateIllnessDTO(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes")
 
 
+class IllnessBatchUpdateDTO(UpdateIllnessDTO):
+    """Update item of an illness batch: the record id plus the fields to change"""
+    id: int
+
+
+class IllnessBatchDTO(BatchRequestDTO[CreateIllnessDTO, IllnessBatchUpdateDTO]):
+    """DTO for creating, updating and deleting illnesses in one request"""
+
+
 class PatientIllnessDTO(BaseModel):
     """DTO for illness response with UUID string serialization"""
     id: int
@@ -2,10 +2,12 @@
 Illness repository port interface
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from slices.illnesses.domain.models.illness_model import PatientIllness
+from shared.database.batch_writes import BatchWrite, BatchWriteResult
+from shared.utils.pagination import KeysetPage
 
 
 class IllnessRepositoryPort(ABC):
@@ -16,6 +18,22 @@ class IllnessRepositoryPort(ABC):
         """Get all illnesses for a specific patient"""
         pass
 
+    @abstractmethod
+    async def get_illnesses_page_by_patient_id(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> KeysetPage:
+        """Get one keyset page of illnesses for a specific patient"""
+        pass
+
+    @abstractmethod
+    async def get_version_stamp(self, patient_id: UUID) -> Tuple:
+        """Version stamp of a patient's illnesses: changes on every create, update or delete"""
+        pass
+
     @abstractmethod
     async def get_illness_by_id(self, illness_id: int, patient_id: UUID) -> Optional[PatientIllness]:
         """Get a specific illness by ID with patient ownership verification"""
@@ -34,4 +52,9 @@ class IllnessRepositoryPort(ABC):
     @abstractmethod
     async def delete_illness(self, illness_id: int, patient_id: UUID) -> bool:
         """Delete an illness record with patient ownership verification"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def apply_batch(self, patient_id: UUID, batch: BatchWrite) -> BatchWriteResult[PatientIllness]:
+        """Apply creates, updates and deletes of a patient's illnesses in one transaction"""
+        pass
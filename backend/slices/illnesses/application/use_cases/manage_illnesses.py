@@ -1,7 +1,7 @@
 """
 Use cases for managing patient illnesses
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from slices.illnesses.application.ports.illness_repository import IllnessRepositoryPort
@@ -9,8 +9,11 @@ from slices.illnesses.domain.models.illness_model import PatientIllness
 from slices.illnesses.application.dto.illness_dto import (
     PatientIllnessDTO,
     CreateIllnessDTO,
-    UpdateIllnessDTO
+    UpdateIllnessDTO,
+    IllnessBatchDTO
 )
+from shared.utils.batch import BatchResultDTO, build_batch_result
+from shared.utils.pagination import CursorPageDTO, parse_fields
 
 
 class ManageIllnessesUseCase:
@@ -24,6 +27,27 @@ class ManageIllnessesUseCase:
         illnesses = await self.illness_repository.get_illnesses_by_patient_id(patient_id)
         return [PatientIllnessDTO.model_validate(illness) for illness in illnesses]
 
+    async def get_patient_illnesses_page(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> CursorPageDTO:
+        """Get one page of illnesses for a patient, optionally limited to the requested fields"""
+        selected_fields = parse_fields(fields, PatientIllnessDTO.model_fields)
+        page = await self.illness_repository.get_illnesses_page_by_patient_id(
+            patient_id, limit, cursor, selected_fields
+        )
+        items = page.items if selected_fields else [
+            PatientIllnessDTO.model_validate(illness) for illness in page.items
+        ]
+        return CursorPageDTO(items=items, next_cursor=page.next_cursor, limit=limit)
+
+    async def get_illnesses_version(self, patient_id: UUID) -> Tuple:
+        """Version stamp of a patient's illnesses, for conditional GET"""
+        return await self.illness_repository.get_version_stamp(patient_id)
+
     async def get_illness_by_id(self, illness_id: int, patient_id: UUID) -> Optional[PatientIllnessDTO]:
         """Get a specific illness by ID"""
         illness = await self.illness_repository.get_illness_by_id(illness_id, patient_id)
@@ -50,4 +74,9 @@ class ManageIllnessesUseCase:
 
     async def delete_illness(self, illness_id: int, patient_id: UUID) -> bool:
         """Delete an illness record"""
-        return await self.illness_repository.delete_illness(illness_id, patient_id)
\ No newline at end of file
+        return await self.illness_repository.delete_illness(illness_id, patient_id)
+
+    async def apply_illness_batch(self, batch_data: IllnessBatchDTO, patient_id: UUID) -> BatchResultDTO[PatientIllnessDTO]:
+        """Create, update and delete illnesses in one transaction, with a result per item"""
+        result = await self.illness_repository.apply_batch(patient_id, batch_data.to_batch_write())
+        return build_batch_result(batch_data, result, PatientIllnessDTO)
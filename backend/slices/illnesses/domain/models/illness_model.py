@@ -2,10 +2,11 @@
 Patient Illness domain model
 """
 from datetime import datetime, date
-from sqlalchemy import Column, String, Text, Date, DateTime, BigInteger, ForeignKey, func, Boolean
+from sqlalchemy import Column, String, Text, Date, DateTime, BigInteger, ForeignKey, Index, func, Boolean
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
+from shared.database.change_tracking import change_seq_column, track_deletes
 from shared.database.database import Base
 
 
@@ -26,9 +27,21 @@ class PatientIllness(Base):
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    change_seq = change_seq_column()
+
+    # Composite indexes matching the patient-scoped access paths
+    __table_args__ = (
+        Index("ix_patient_illnesses_patient_id_created_at", patient_id, created_at.desc(), id.desc()),
+        Index("ix_patient_illnesses_patient_id_is_chronic_diagnosis_date", patient_id, is_chronic, diagnosis_date.desc()),
+        # Delta sync: a patient's rows changed after a given sequence value
+        Index("ix_patient_illnesses_patient_id_change_seq", patient_id, change_seq),
+    )
 
     # Relationship
     patient = relationship("Patient", backref="illnesses")
 
     def __repr__(self):
-        return f"<PatientIllness(id={self.id}, illness_name='{self.illness_name}', status='{self.status}')>"
\ No newline at end of file
+        return f"<PatientIllness(id={self.id}, illness_name='{self.illness_name}', status='{self.status}')>"
+
+
+track_deletes(PatientIllness, "illnesses")
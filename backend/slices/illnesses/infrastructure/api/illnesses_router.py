@@ -1,21 +1,25 @@
 """
 Illnesses API endpoints with authentication
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Query
 from sqlalchemy.orm import Session
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
-from slices.signup.domain.models.user_model import User
-from slices.signup.domain.models.patient_model import Patient
+from shared.exceptions.application_exceptions import ValidationException
+from shared.utils.etag import not_modified, version_etag
+from shared.utils.batch import BatchResultDTO
+from shared.utils.pagination import CursorPageDTO, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from slices.auth.infrastructure.api.auth_endpoints import get_current_patient
+from slices.auth.application.use_cases import AuthenticatedPrincipal
 
 from slices.illnesses.application.use_cases.manage_illnesses import ManageIllnessesUseCase
 from slices.illnesses.infrastructure.repositories.illness_repository import IllnessRepository
 from slices.illnesses.application.dto.illness_dto import (
     PatientIllnessDTO,
     CreateIllnessDTO,
-    UpdateIllnessDTO
+    UpdateIllnessDTO,
+    IllnessBatchDTO
 )
 
 router = APIRouter(prefix="/api/illnesses", tags=["Illnesses"])
@@ -27,49 +31,54 @@ def get_illness_use_case(db: Session = Depends(get_db)) -> ManageIllnessesUseCas
     return ManageIllnessesUseCase(illness_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
-    if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient record not found"
-        )
-    return patient
-
-
-@router.get("/", response_model=List[PatientIllnessDTO])
+@router.get("/", response_model=Union[List[PatientIllnessDTO], CursorPageDTO])
 async def get_illnesses(
-    current_user: User = Depends(get_current_user),
-    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size, enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, enables cursor pagination"),
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case)
 ):
-    """Get all illnesses for authenticated patient"""
-    if current_user.user_type != "patient":
+    """
+    Get illnesses for authenticated patient
+
+    Without limit, cursor or fields the full list is returned as before.
+    Otherwise a cursor page is returned with next_cursor for the following page.
+    Answers 304 Not Modified when If-None-Match matches the current ETag.
+    """
+    patient = principal.patient
+
+    # Checked before any DTO is built; the query string selects the representation
+    stamp = await illness_use_case.get_illnesses_version(patient.id)
+    etag = version_etag("illnesses", patient.id, request.url.query, *stamp)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    if limit is None and cursor is None and fields is None:
+        return await illness_use_case.get_patient_illnesses(patient.id)
+
+    try:
+        return await illness_use_case.get_patient_illnesses_page(
+            patient.id, limit or DEFAULT_PAGE_SIZE, cursor, fields
+        )
+    except ValidationException as e:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access illness data"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
 
-    patient = await get_patient_from_user(current_user, db)
-    return await illness_use_case.get_patient_illnesses(patient.id)
-
 
 @router.get("/{illness_id}", response_model=PatientIllnessDTO)
 async def get_illness(
     illness_id: int,
-    current_user: User = Depends(get_current_user),
-    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case)
 ):
     """Get a specific illness by ID"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access illness data"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     illness = await illness_use_case.get_illness_by_id(illness_id, patient.id)
 
     if not illness:
@@ -84,37 +93,39 @@ async def get_illness(
 @router.post("/", response_model=PatientIllnessDTO, status_code=status.HTTP_201_CREATED)
 async def create_illness(
     illness_data: CreateIllnessDTO,
-    current_user: User = Depends(get_current_user),
-    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case)
 ):
     """Create a new illness record"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can create illness records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     return await illness_use_case.create_illness(illness_data, patient.id)
 
 
+@router.post("/batch", response_model=BatchResultDTO[PatientIllnessDTO])
+async def apply_illness_batch(
+    batch_data: IllnessBatchDTO,
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case)
+):
+    """
+    Create, update and delete illnesses in one request and one transaction
+
+    Returns a result per item. Updates and deletes of ids the patient does
+    not have get a 404 item; the rest of the batch is still applied.
+    """
+    patient = principal.patient
+    return await illness_use_case.apply_illness_batch(batch_data, patient.id)
+
+
 @router.put("/{illness_id}", response_model=PatientIllnessDTO)
 async def update_illness(
     illness_id: int,
     illness_data: UpdateIllnessDTO,
-    current_user: User = Depends(get_current_user),
-    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case)
 ):
     """Update an existing illness record"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can update illness records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     updated_illness = await illness_use_case.update_illness(illness_id, illness_data, patient.id)
 
     if not updated_illness:
@@ -129,18 +140,11 @@ async def update_illness(
 @router.delete("/{illness_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_illness(
     illness_id: int,
-    current_user: User = Depends(get_current_user),
-    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    illness_use_case: ManageIllnessesUseCase = Depends(get_illness_use_case)
 ):
     """Delete an illness record"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can delete illness records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     success = await illness_use_case.delete_illness(illness_id, patient.id)
 
     if not success:
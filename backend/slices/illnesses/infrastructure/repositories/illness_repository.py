@@ -1,7 +1,7 @@
 """
 SQLAlchemy implementation of illness repository
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc
@@ -9,6 +9,10 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from slices.illnesses.application.ports.illness_repository import IllnessRepositoryPort
 from slices.illnesses.domain.models.illness_model import PatientIllness
+from shared.events import CREATED, DELETED, UPDATED, IllnessChanged, record_event
+from shared.database.batch_writes import BatchWrite, BatchWriteResult, apply_batch_write
+from shared.database.version_stamps import collection_stamp, read_version_stamp
+from shared.utils.pagination import KeysetPage, paginate_keyset
 
 
 class IllnessRepository(IllnessRepositoryPort):
@@ -26,6 +30,31 @@ class IllnessRepository(IllnessRepositoryPort):
         except SQLAlchemyError as e:
             raise Exception(f"Database error getting illnesses: {str(e)}")
 
+    async def get_illnesses_page_by_patient_id(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> KeysetPage:
+        """Get one keyset page of illnesses for a specific patient"""
+        try:
+            query = self.db.query(PatientIllness).filter(
+                PatientIllness.patient_id == patient_id
+            )
+            return paginate_keyset(query, PatientIllness, limit, cursor, fields)
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting illnesses: {str(e)}")
+
+    async def get_version_stamp(self, patient_id: UUID) -> Tuple:
+        """Count and newest updated_at of a patient's illnesses"""
+        try:
+            return read_version_stamp(
+                self.db, collection_stamp(PatientIllness, PatientIllness.patient_id == patient_id)
+            )
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting illnesses version: {str(e)}")
+
     async def get_illness_by_id(self, illness_id: int, patient_id: UUID) -> Optional[PatientIllness]:
         """Get a specific illness by ID with patient ownership verification"""
         try:
@@ -42,6 +71,10 @@ class IllnessRepository(IllnessRepositoryPort):
         """Create a new illness record"""
         try:
             self.db.add(illness)
+            self.db.flush()
+            record_event(self.db, IllnessChanged(
+                patient_id=illness.patient_id, record_id=illness.id, change=CREATED, label=illness.illness_name
+            ))
             self.db.commit()
             self.db.refresh(illness)
             return illness
@@ -66,6 +99,9 @@ class IllnessRepository(IllnessRepositoryPort):
                 if hasattr(illness, key):
                     setattr(illness, key, value)
 
+            record_event(self.db, IllnessChanged(
+                patient_id=illness.patient_id, record_id=illness.id, change=UPDATED, label=illness.illness_name
+            ))
             self.db.commit()
             self.db.refresh(illness)
             return illness
@@ -86,9 +122,20 @@ class IllnessRepository(IllnessRepositoryPort):
             if not illness:
                 return False
 
+            record_event(self.db, IllnessChanged(
+                patient_id=illness.patient_id, record_id=illness.id, change=DELETED, label=illness.illness_name
+            ))
             self.db.delete(illness)
             self.db.commit()
             return True
         except SQLAlchemyError as e:
             self.db.rollback()
-            raise Exception(f"Database error deleting illness: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Database error deleting illness: {str(e)}")
+
+    async def apply_batch(self, patient_id: UUID, batch: BatchWrite) -> BatchWriteResult[PatientIllness]:
+        """Apply creates, updates and deletes of a patient's illnesses in one transaction"""
+        try:
+            return apply_batch_write(self.db, PatientIllness, patient_id, batch, IllnessChanged, "illness_name")
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error applying illness batch: {str(e)}")
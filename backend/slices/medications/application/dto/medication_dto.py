@@ -7,6 +7,8 @@ from typing import Optional
 from uuid import UUID
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
+from shared.utils.batch import BatchRequestDTO
+
 
 class PatientMedicationDTO(BaseModel):
     """Pydantic model for PatientMedication responses"""
@@ -80,4 +82,13 @@ class UpdateMedicationDTO(BaseModel):
     end_date: Optional[date] = None
     is_active: Optional[bool] = None
     notes: Optional[str] = None
-    prescribed_by: Optional[str] = None
\ No newline at end of file
+    prescribed_by: Optional[str] = None
+
+
+class MedicationBatchUpdateDTO(UpdateMedicationDTO):
+    """Update item of a medication batch: the record id plus the fields to change"""
+    id: int
+
+
+class MedicationBatchDTO(BatchRequestDTO[CreateMedicationDTO, MedicationBatchUpdateDTO]):
+    """DTO for creating, updating and deleting medications in one request"""
@@ -3,10 +3,13 @@ Medication repository port (interface)
 Defines the contract for medication data access
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from slices.medications.domain.models.medication_model import PatientMedication
+from shared.database.batch_writes import BatchWrite, BatchWriteResult
+from shared.utils.pagination import KeysetPage
 
 
 class MedicationRepositoryPort(ABC):
@@ -17,6 +20,27 @@ class MedicationRepositoryPort(ABC):
         """Get all medications for a patient"""
         pass
 
+    @abstractmethod
+    async def get_medications_page(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> KeysetPage:
+        """Get one keyset page of medications for a patient"""
+        pass
+
+    @abstractmethod
+    async def get_version_stamp(self, patient_id: UUID) -> Tuple:
+        """Version stamp of a patient's medications: changes on every create, update or delete"""
+        pass
+
+    @abstractmethod
+    async def deactivate_expired_medications(self, patient_id: UUID, today: date) -> int:
+        """Mark active medications whose end date has passed as inactive"""
+        pass
+
     @abstractmethod
     async def create_medication(self, medication: PatientMedication) -> PatientMedication:
         """Create a new medication record"""
@@ -35,4 +59,9 @@ class MedicationRepositoryPort(ABC):
     @abstractmethod
     async def get_medication_by_id(self, medication_id: int, patient_id: UUID) -> Optional[PatientMedication]:
         """Get a specific medication by ID"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def apply_batch(self, patient_id: UUID, batch: BatchWrite) -> BatchWriteResult[PatientMedication]:
+        """Apply creates, updates and deletes of a patient's medications in one transaction"""
+        pass
@@ -2,7 +2,7 @@
 Medication management use cases
 """
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import date, datetime
 
 from slices.medications.application.ports.medication_repository import MedicationRepositoryPort
@@ -10,9 +10,12 @@ from slices.medications.domain.models.medication_model import PatientMedication
 from slices.medications.application.dto.medication_dto import (
     PatientMedicationDTO,
     CreateMedicationDTO,
-    UpdateMedicationDTO
+    UpdateMedicationDTO,
+    MedicationBatchDTO
 )
 from slices.signup.domain.models.user_model import User
+from shared.utils.batch import BatchResultDTO, build_batch_result
+from shared.utils.pagination import CursorPageDTO, parse_fields
 
 
 class ManageMedicationsUseCase:
@@ -21,15 +24,49 @@ class ManageMedicationsUseCase:
     def __init__(self, medication_repository: MedicationRepositoryPort):
         self.medication_repository = medication_repository
 
-    async def get_medications(self, patient_id: UUID) -> List[PatientMedicationDTO]:
+    async def get_medications(self, patient_id: UUID, sweep_expired: bool = True) -> List[PatientMedicationDTO]:
         """Get all medications for a patient with auto-disable of expired medications"""
-        # First, automatically disable expired medications
-        await self._auto_disable_expired_medications(patient_id)
+        # First, automatically disable expired medications (unless the caller already did)
+        if sweep_expired:
+            await self._auto_disable_expired_medications(patient_id)
 
         # Then return the updated list
         medications = await self.medication_repository.get_medications(patient_id)
         return [PatientMedicationDTO.model_validate(med, from_attributes=True) for med in medications]
 
+    async def get_medications_page(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+        sweep_expired: bool = True
+    ) -> CursorPageDTO:
+        """Get one page of medications, optionally limited to the requested fields"""
+        selected_fields = parse_fields(fields, PatientMedicationDTO.model_fields)
+
+        # Only the first page pays for the expiry sweep
+        if cursor is None and sweep_expired:
+            await self._auto_disable_expired_medications(patient_id)
+
+        page = await self.medication_repository.get_medications_page(
+            patient_id, limit, cursor, selected_fields
+        )
+        items = page.items if selected_fields else [
+            PatientMedicationDTO.model_validate(med, from_attributes=True) for med in page.items
+        ]
+        return CursorPageDTO(items=items, next_cursor=page.next_cursor, limit=limit)
+
+    async def get_medications_version(self, patient_id: UUID, sweep_expired: bool = True) -> Tuple:
+        """
+        Version stamp of a patient's medications, for conditional GET
+
+        Runs the expiry sweep first so the stamp covers today's is_active flags.
+        """
+        if sweep_expired:
+            await self._auto_disable_expired_medications(patient_id)
+        return await self.medication_repository.get_version_stamp(patient_id)
+
     async def create_medication(self, medication_data: CreateMedicationDTO, patient_id: UUID, user: User) -> PatientMedicationDTO:
         """Create a new medication record"""
         medication = PatientMedication(
@@ -56,6 +93,11 @@ class ManageMedicationsUseCase:
         """Delete a medication record"""
         return await self.medication_repository.delete_medication(medication_id, patient_id)
 
+    async def apply_medication_batch(self, batch_data: MedicationBatchDTO, patient_id: UUID) -> BatchResultDTO[PatientMedicationDTO]:
+        """Create, update and delete medications in one transaction, with a result per item"""
+        result = await self.medication_repository.apply_batch(patient_id, batch_data.to_batch_write())
+        return build_batch_result(batch_data, result, PatientMedicationDTO)
+
     async def get_medication_by_id(self, medication_id: int, patient_id: UUID) -> Optional[PatientMedicationDTO]:
         """Get a specific medication by ID"""
         medication = await self.medication_repository.get_medication_by_id(medication_id, patient_id)
@@ -76,22 +118,13 @@ class ManageMedicationsUseCase:
     async def _auto_disable_expired_medications(self, patient_id: UUID) -> None:
         """Automatically disable medications that have passed their end date"""
         try:
-            medications = await self.medication_repository.get_medications(patient_id)
-            today = date.today()
-
-            expired_medications = [
-                med for med in medications
-                if med.is_active and med.end_date and med.end_date < today
-            ]
-
-            if expired_medications:
-                print(f"🔄 Auto-disabling {len(expired_medications)} expired medications for patient {patient_id}")
-
-                for medication in expired_medications:
-                    # Update medication to inactive status
-                    update_data = {"is_active": False}
-                    await self.medication_repository.update_medication(medication.id, update_data)
-                    print(f"✅ Auto-disabled medication: {medication.medication_name} (expired: {medication.end_date})")
+            # Single UPDATE instead of loading and saving every medication
+            disabled = await self.medication_repository.deactivate_expired_medications(
+                patient_id, date.today()
+            )
+
+            if disabled:
+                print(f"🔄 Auto-disabled {disabled} expired medications for patient {patient_id}")
 
         except Exception as e:
             print(f"❌ Error auto-disabling expired medications: {e}")
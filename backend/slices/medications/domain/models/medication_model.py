@@ -2,11 +2,12 @@
 Medication SQLAlchemy model for medications slice
 Performance-optimized with BIGSERIAL primary keys
 """
-from sqlalchemy import Column, String, Date, Boolean, Integer, DateTime, ForeignKey, Text, BigInteger
+from sqlalchemy import Column, String, Date, Boolean, Integer, DateTime, ForeignKey, Text, BigInteger, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
+from shared.database.change_tracking import change_seq_column, track_deletes
 from shared.database.database import Base
 
 
@@ -27,9 +28,21 @@ class PatientMedication(Base):
     prescribed_by = Column(String(200), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    change_seq = change_seq_column()
+
+    # Composite indexes matching the patient-scoped access paths (patient_id leads, so no single-column index)
+    __table_args__ = (
+        Index("ix_patient_medications_patient_id_created_at", patient_id, created_at.desc(), id.desc()),
+        Index("ix_patient_medications_patient_id_is_active_created_at", patient_id, is_active, created_at.desc()),
+        # Delta sync: a patient's rows changed after a given sequence value
+        Index("ix_patient_medications_patient_id_change_seq", patient_id, change_seq),
+    )
 
     # Relationship
     patient = relationship("Patient", backref="medications")
 
     def __repr__(self):
-        return f"<PatientMedication(id={self.id}, medication_name='{self.medication_name}', is_active={self.is_active})>"
\ No newline at end of file
+        return f"<PatientMedication(id={self.id}, medication_name='{self.medication_name}', is_active={self.is_active})>"
+
+
+track_deletes(PatientMedication, "medications")
@@ -3,22 +3,26 @@ Medications API endpoints with authentication
 """
 import json
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Query
 from sqlalchemy.orm import Session
 from pydantic import ValidationError
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
-from slices.signup.domain.models.user_model import User
-from slices.signup.domain.models.patient_model import Patient
+from shared.exceptions.application_exceptions import ValidationException
+from shared.utils.etag import not_modified, version_etag
+from shared.utils.batch import BatchResultDTO
+from shared.utils.pagination import CursorPageDTO, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from slices.auth.infrastructure.api.auth_endpoints import get_current_patient
+from slices.auth.application.use_cases import AuthenticatedPrincipal
 
 from slices.medications.application.use_cases.manage_medications import ManageMedicationsUseCase
 from slices.medications.infrastructure.repositories.medication_repository import MedicationRepository
 from slices.medications.application.dto.medication_dto import (
     PatientMedicationDTO,
     CreateMedicationDTO,
-    UpdateMedicationDTO
+    UpdateMedicationDTO,
+    MedicationBatchDTO
 )
 
 # Configure logger for medication router debugging
@@ -33,74 +37,86 @@ def get_medications_use_case(db: Session = Depends(get_db)) -> ManageMedications
     return ManageMedicationsUseCase(medication_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
-    if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient record not found"
-        )
-    return patient
-
-
-@router.get("/", response_model=List[PatientMedicationDTO])
+@router.get("/", response_model=Union[List[PatientMedicationDTO], CursorPageDTO])
 async def get_medications(
-    current_user: User = Depends(get_current_user),
-    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size, enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, enables cursor pagination"),
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case)
 ):
-    """Get all medications for authenticated patient"""
-    # Ensure user is a patient
-    if current_user.user_type != "patient":
+    """
+    Get medications for authenticated patient
+
+    Without limit, cursor or fields the full list is returned as before.
+    Otherwise a cursor page is returned with next_cursor for the following page.
+    Answers 304 Not Modified when If-None-Match matches the current ETag.
+    """
+    patient = principal.patient
+
+    # Checked before any DTO is built; the query string selects the representation.
+    # The expiry sweep (first page only) runs before the stamp is read.
+    stamp = await medications_use_case.get_medications_version(patient.id, sweep_expired=cursor is None)
+    etag = version_etag("medications", patient.id, request.url.query, *stamp)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    if limit is None and cursor is None and fields is None:
+        return await medications_use_case.get_medications(patient.id, sweep_expired=False)
+
+    try:
+        return await medications_use_case.get_medications_page(
+            patient.id, limit or DEFAULT_PAGE_SIZE, cursor, fields, sweep_expired=False
+        )
+    except ValidationException as e:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access medication data"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
 
-    patient = await get_patient_from_user(current_user, db)
-    return await medications_use_case.get_medications(patient.id)
-
 
 @router.post("/", response_model=PatientMedicationDTO)
 async def create_medication(
     medication_data: CreateMedicationDTO,
-    current_user: User = Depends(get_current_user),
-    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case)
 ):
     """Create new medication record"""
-    # Ensure user is a patient
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can create medication records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     return await medications_use_case.create_medication(
         medication_data,
         patient.id,
-        current_user
+        principal.user
     )
 
 
+@router.post("/batch", response_model=BatchResultDTO[PatientMedicationDTO])
+async def apply_medication_batch(
+    batch_data: MedicationBatchDTO,
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case)
+):
+    """
+    Create, update and delete medications in one request and one transaction
+
+    Returns a result per item. Updates and deletes of ids the patient does
+    not have get a 404 item; the rest of the batch is still applied.
+    """
+    patient = principal.patient
+    return await medications_use_case.apply_medication_batch(batch_data, patient.id)
+
+
 @router.put("/{medication_id}", response_model=PatientMedicationDTO)
 async def update_medication(
     medication_id: int,
     request: Request,
-    current_user: User = Depends(get_current_user),
-    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case)
 ):
     """Update medication record with detailed validation logging"""
-    # Ensure user is a patient
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can update medication records"
-        )
-
     # Get raw request body for logging
     try:
         request_body = await request.body()
@@ -146,14 +162,14 @@ async def update_medication(
             detail="Internal server error during validation"
         )
 
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
 
     try:
         updated = await medications_use_case.update_medication(
             medication_id,
             medication_data,
             patient.id,
-            current_user
+            principal.user
         )
         if not updated:
             raise HTTPException(
@@ -175,23 +191,15 @@ async def update_medication(
 @router.delete("/{medication_id}")
 async def delete_medication(
     medication_id: int,
-    current_user: User = Depends(get_current_user),
-    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case)
 ):
     """Delete medication record"""
-    # Ensure user is a patient
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can delete medication records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     success = await medications_use_case.delete_medication(
         medication_id,
         patient.id,
-        current_user
+        principal.user
     )
     if not success:
         raise HTTPException(
@@ -204,19 +212,11 @@ async def delete_medication(
 @router.get("/{medication_id}", response_model=PatientMedicationDTO)
 async def get_medication_by_id(
     medication_id: int,
-    current_user: User = Depends(get_current_user),
-    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case)
 ):
     """Get specific medication by ID"""
-    # Ensure user is a patient
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access medication data"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     medication = await medications_use_case.get_medication_by_id(medication_id, patient.id)
     if not medication:
         raise HTTPException(
@@ -230,24 +230,16 @@ async def get_medication_by_id(
 async def toggle_medication_status(
     medication_id: int,
     is_active: bool,
-    current_user: User = Depends(get_current_user),
-    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    medications_use_case: ManageMedicationsUseCase = Depends(get_medications_use_case)
 ):
     """Toggle medication active status"""
-    # Ensure user is a patient
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can update medication status"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     updated = await medications_use_case.toggle_medication_status(
         medication_id,
         is_active,
         patient.id,
-        current_user
+        principal.user
     )
     if not updated:
         raise HTTPException(
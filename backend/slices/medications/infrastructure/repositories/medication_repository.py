@@ -2,13 +2,19 @@
 Medication repository implementation
 Handles medication data persistence using SQLAlchemy
 """
-from typing import List, Optional
+from datetime import date
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
+from sqlalchemy.exc import SQLAlchemyError
 
 from slices.medications.application.ports.medication_repository import MedicationRepositoryPort
 from slices.medications.domain.models.medication_model import PatientMedication
+from shared.events import CREATED, DELETED, UPDATED, MedicationChanged, record_event
+from shared.database.batch_writes import BatchWrite, BatchWriteResult, apply_batch_write
+from shared.database.version_stamps import collection_stamp, read_version_stamp
+from shared.utils.pagination import KeysetPage, paginate_keyset
 
 
 class MedicationRepository(MedicationRepositoryPort):
@@ -23,9 +29,47 @@ class MedicationRepository(MedicationRepositoryPort):
             PatientMedication.patient_id == patient_id
         ).order_by(PatientMedication.created_at.desc()).all()
 
+    async def get_medications_page(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> KeysetPage:
+        """Get one keyset page of medications for a patient"""
+        query = self.db.query(PatientMedication).filter(
+            PatientMedication.patient_id == patient_id
+        )
+        return paginate_keyset(query, PatientMedication, limit, cursor, fields)
+
+    async def get_version_stamp(self, patient_id: UUID) -> Tuple:
+        """Count and newest updated_at of a patient's medications"""
+        return read_version_stamp(
+            self.db, collection_stamp(PatientMedication, PatientMedication.patient_id == patient_id)
+        )
+
+    async def deactivate_expired_medications(self, patient_id: UUID, today: date) -> int:
+        """Mark active medications whose end date has passed as inactive"""
+        updated = self.db.query(PatientMedication).filter(
+            and_(
+                PatientMedication.patient_id == patient_id,
+                PatientMedication.is_active.is_(True),
+                PatientMedication.end_date < today
+            )
+        ).update({PatientMedication.is_active: False}, synchronize_session=False)
+
+        if updated:
+            record_event(self.db, MedicationChanged(patient_id=patient_id, change=UPDATED))
+            self.db.commit()
+        return updated
+
     async def create_medication(self, medication: PatientMedication) -> PatientMedication:
         """Create a new medication record"""
         self.db.add(medication)
+        self.db.flush()
+        record_event(self.db, MedicationChanged(
+            patient_id=medication.patient_id, record_id=medication.id, change=CREATED, label=medication.medication_name
+        ))
         self.db.commit()
         self.db.refresh(medication)
         return medication
@@ -44,6 +88,9 @@ class MedicationRepository(MedicationRepositoryPort):
             if hasattr(medication, field):
                 setattr(medication, field, value)
 
+        record_event(self.db, MedicationChanged(
+            patient_id=medication.patient_id, record_id=medication.id, change=UPDATED, label=medication.medication_name
+        ))
         self.db.commit()
         self.db.refresh(medication)
         return medication
@@ -60,6 +107,9 @@ class MedicationRepository(MedicationRepositoryPort):
         if not medication:
             return False
 
+        record_event(self.db, MedicationChanged(
+            patient_id=medication.patient_id, record_id=medication.id, change=DELETED, label=medication.medication_name
+        ))
         self.db.delete(medication)
         self.db.commit()
         return True
@@ -71,4 +121,12 @@ class MedicationRepository(MedicationRepositoryPort):
                 PatientMedication.id == medication_id,
                 PatientMedication.patient_id == patient_id
             )
-        ).first()
\ No newline at end of file
+        ).first()
+
+    async def apply_batch(self, patient_id: UUID, batch: BatchWrite) -> BatchWriteResult[PatientMedication]:
+        """Apply creates, updates and deletes of a patient's medications in one transaction"""
+        try:
+            return apply_batch_write(self.db, PatientMedication, patient_id, batch, MedicationChanged, "medication_name")
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error applying medication batch: {str(e)}")
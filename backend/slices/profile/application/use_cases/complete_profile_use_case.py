@@ -1,13 +1,16 @@
 """
 Profile completion use case for RF002
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 from uuid import UUID
 
-from slices.signup.domain.models.patient_model import Patient
+from slices.signup.domain.models.patient_model import EMERGENCY_FIELDS, Patient
 from slices.signup.domain.models.user_model import User
 from slices.signup.domain.models.document_type_model import DocumentType
+from shared.database.version_stamps import read_version_stamp, row_stamp
+from shared.events import PatientProfileChanged, record_event
 # TODO: Add back profile domain models when they are available
 # from slices.profile.domain.models import Medication, Allergy, Disease, Surgery, GynecologicalHistory
 # from slices.profile.domain.models.allergy_model import AllergySeverity
@@ -29,6 +32,42 @@ from slices.profile.application.dto.basic_patient_dto import (
 )
 
 
+# Patient columns written by update_extended_profile
+EXTENDED_PROFILE_FIELDS = (
+    # Demographic information
+    "biological_sex", "gender", "gender_other",
+    # Birth location
+    "birth_country", "birth_country_other", "birth_department", "birth_city",
+    # Residence information
+    "residence_address", "residence_country", "residence_country_other",
+    "residence_department", "residence_city",
+    # Medical information
+    "eps", "eps_other", "occupation", "additional_insurance",
+    "complementary_plan", "complementary_plan_other", "blood_type",
+    "emergency_contact_name", "emergency_contact_relationship",
+    # Primary emergency phone
+    "emergency_contact_phone", "emergency_contact_country_code",
+    "emergency_contact_dial_code", "emergency_contact_phone_number",
+    # Alternative emergency phone
+    "emergency_contact_phone_alt", "emergency_contact_country_code_alt",
+    "emergency_contact_dial_code_alt", "emergency_contact_phone_number_alt",
+    # Gynecological information (only for female patients)
+    "is_pregnant", "pregnancy_weeks", "last_menstruation_date", "pregnancies_count",
+    "births_count", "cesareans_count", "abortions_count", "contraceptive_method",
+)
+
+
+def _changed_fields(patient: Patient) -> Set[str]:
+    """Attributes of a loaded patient assigned a different value since load"""
+    return {attr.key for attr in inspect(patient).attrs if attr.history.has_changes()}
+
+
+def _bump_group_versions(patient: Patient, changed: Iterable[str]) -> None:
+    """Move emergency_version (in SQL, so concurrent saves both count) if an emergency field changed"""
+    if EMERGENCY_FIELDS.intersection(changed):
+        patient.emergency_version = Patient.emergency_version + 1
+
+
 class CompleteProfileUseCase:
     """Use case for RF002 profile completion functionality"""
 
@@ -67,6 +106,15 @@ class CompleteProfileUseCase:
         }
         return ProfileCompletenessResponse(**completeness_info)
 
+    def get_extended_profile_version(self, user_id: str) -> Tuple:
+        """
+        Version stamp of the extended profile, for conditional GET
+
+        Returns:
+            (patient.updated_at,), with None if the patient does not exist
+        """
+        return read_version_stamp(self.db, row_stamp(Patient, Patient.user_id == user_id))
+
     def get_extended_profile(self, user_id: str) -> Optional[ExtendedPatientProfileDTO]:
         """
         Get extended patient profile data
@@ -134,122 +182,70 @@ class CompleteProfileUseCase:
             contraceptive_method=patient.contraceptive_method,
         )
 
-    def update_extended_profile(self, user_id: str, profile_data: PatientProfileUpdateDTO) -> Dict[str, Any]:
+    def update_extended_profile(
+        self,
+        user_id: str,
+        profile_data: PatientProfileUpdateDTO,
+        partial: bool = False
+    ) -> Dict[str, Any]:
         """
         Update extended patient profile with RF002 data
 
+        Only fields whose value differs from the stored one are written, so
+        the UPDATE carries just those columns. When nothing differs there is
+        no event and no commit, and updated_at stays put.
+
         Args:
             user_id: User UUID string
             profile_data: PatientProfileUpdateDTO with updated data
+            partial: PATCH semantics: apply exactly the fields sent, so an
+                explicit null clears a field. Otherwise null means "keep"
 
         Returns:
-            Dictionary with update result
+            Dictionary with update result and the changed field names
         """
         patient = self.db.query(Patient).filter(Patient.user_id == user_id).first()
         if not patient:
             return {"success": False, "message": "Patient not found"}
 
-        try:
-            # Update demographic information fields
-            if profile_data.biological_sex is not None:
-                patient.biological_sex = profile_data.biological_sex
-            if profile_data.gender is not None:
-                patient.gender = profile_data.gender
-            if profile_data.gender_other is not None:
-                patient.gender_other = profile_data.gender_other
-
-            # Update birth location fields
-            if profile_data.birth_country is not None:
-                patient.birth_country = profile_data.birth_country
-            if profile_data.birth_country_other is not None:
-                patient.birth_country_other = profile_data.birth_country_other
-            if profile_data.birth_department is not None:
-                patient.birth_department = profile_data.birth_department
-            if profile_data.birth_city is not None:
-                patient.birth_city = profile_data.birth_city
-
-            # Update residence information fields
-            if profile_data.residence_address is not None:
-                patient.residence_address = profile_data.residence_address
-            if profile_data.residence_country is not None:
-                patient.residence_country = profile_data.residence_country
-            if profile_data.residence_country_other is not None:
-                patient.residence_country_other = profile_data.residence_country_other
-            if profile_data.residence_department is not None:
-                patient.residence_department = profile_data.residence_department
-            if profile_data.residence_city is not None:
-                patient.residence_city = profile_data.residence_city
-
-            # Update medical information fields
-            if profile_data.eps is not None:
-                patient.eps = profile_data.eps
-            if profile_data.eps_other is not None:
-                patient.eps_other = profile_data.eps_other
-            if profile_data.occupation is not None:
-                patient.occupation = profile_data.occupation
-            if profile_data.additional_insurance is not None:
-                patient.additional_insurance = profile_data.additional_insurance
-            if profile_data.complementary_plan is not None:
-                patient.complementary_plan = profile_data.complementary_plan
-            if profile_data.complementary_plan_other is not None:
-                patient.complementary_plan_other = profile_data.complementary_plan_other
-            if profile_data.blood_type is not None:
-                patient.blood_type = profile_data.blood_type
-            if profile_data.emergency_contact_name is not None:
-                patient.emergency_contact_name = profile_data.emergency_contact_name
-            if profile_data.emergency_contact_relationship is not None:
-                patient.emergency_contact_relationship = profile_data.emergency_contact_relationship
-
-            # Update primary emergency phone fields
-            if profile_data.emergency_contact_phone is not None:
-                patient.emergency_contact_phone = profile_data.emergency_contact_phone
-            if profile_data.emergency_contact_country_code is not None:
-                patient.emergency_contact_country_code = profile_data.emergency_contact_country_code
-            if profile_data.emergency_contact_dial_code is not None:
-                patient.emergency_contact_dial_code = profile_data.emergency_contact_dial_code
-            if profile_data.emergency_contact_phone_number is not None:
-                patient.emergency_contact_phone_number = profile_data.emergency_contact_phone_number
-
-            # Update alternative emergency phone fields
-            if profile_data.emergency_contact_phone_alt is not None:
-                patient.emergency_contact_phone_alt = profile_data.emergency_contact_phone_alt
-            if profile_data.emergency_contact_country_code_alt is not None:
-                patient.emergency_contact_country_code_alt = profile_data.emergency_contact_country_code_alt
-            if profile_data.emergency_contact_dial_code_alt is not None:
-                patient.emergency_contact_dial_code_alt = profile_data.emergency_contact_dial_code_alt
-            if profile_data.emergency_contact_phone_number_alt is not None:
-                patient.emergency_contact_phone_number_alt = profile_data.emergency_contact_phone_number_alt
-
-            # Update gynecological information fields (only for female patients)
-            if profile_data.is_pregnant is not None:
-                patient.is_pregnant = profile_data.is_pregnant
-            if profile_data.pregnancy_weeks is not None:
-                patient.pregnancy_weeks = profile_data.pregnancy_weeks
-            if profile_data.last_menstruation_date is not None:
-                patient.last_menstruation_date = profile_data.last_menstruation_date
-            if profile_data.pregnancies_count is not None:
-                patient.pregnancies_count = profile_data.pregnancies_count
-            if profile_data.births_count is not None:
-                patient.births_count = profile_data.births_count
-            if profile_data.cesareans_count is not None:
-                patient.cesareans_count = profile_data.cesareans_count
-            if profile_data.abortions_count is not None:
-                patient.abortions_count = profile_data.abortions_count
-            if profile_data.contraceptive_method is not None:
-                patient.contraceptive_method = profile_data.contraceptive_method
+        if partial:
+            values = profile_data.model_dump(include=set(EXTENDED_PROFILE_FIELDS), exclude_unset=True)
+        else:
+            values = {
+                field: value
+                for field, value in profile_data.model_dump(include=set(EXTENDED_PROFILE_FIELDS)).items()
+                if value is not None
+            }
 
-            self.db.commit()
+        changes = {field: value for field, value in values.items() if getattr(patient, field) != value}
 
-            # TODO: Check updated completeness once completeness calculation is implemented
-            completeness_info = {
-                "completion_percentage": 60.0,  # Higher since we're actually saving data now
-                "is_complete": False,
-                "mandatory_fields_completed": True  # Core demographic fields are saved
+        # TODO: Check updated completeness once completeness calculation is implemented
+        completeness_info = {
+            "completion_percentage": 60.0,  # Higher since we're actually saving data now
+            "is_complete": False,
+            "mandatory_fields_completed": True  # Core demographic fields are saved
+        }
+
+        if not changes:
+            return {
+                "success": True,
+                "message": "Profile unchanged",
+                "changed_fields": [],
+                "completeness": completeness_info
             }
 
+        try:
+            for field, value in changes.items():
+                setattr(patient, field, value)
+            _bump_group_versions(patient, changes.keys())
+
+            record_event(self.db, PatientProfileChanged(patient_id=patient.id, section="extended"))
+            self.db.commit()
+
             return {
                 "success": True,
                 "message": "Profile updated successfully",
+                "changed_fields": sorted(changes),
                 "completeness": completeness_info
             }
 
@@ -293,6 +289,19 @@ class CompleteProfileUseCase:
         """Delete allergy - TODO: Implement when Allergy model is available"""
         return {"success": False, "message": "Allergy functionality not yet implemented"}
 
+    def get_basic_patient_info_version(self, user_id: str) -> Tuple:
+        """
+        Version stamp of the basic patient info (patient row plus user email), for conditional GET
+
+        Returns:
+            (patient.updated_at, user.updated_at), None for missing rows
+        """
+        return read_version_stamp(
+            self.db,
+            row_stamp(Patient, Patient.user_id == user_id),
+            row_stamp(User, User.id == user_id)
+        )
+
     def get_basic_patient_info(self, user_id: str) -> Optional[BasicPatientInfoDTO]:
         """
         Get basic patient information (from signup)
@@ -395,6 +404,8 @@ class CompleteProfileUseCase:
                     return {"success": False, "message": "Email already exists"}
                 patient.user.email = update_data.email
 
+            _bump_group_versions(patient, _changed_fields(patient))
+            record_event(self.db, PatientProfileChanged(patient_id=patient.id, section="basic"))
             self.db.commit()
 
             return {
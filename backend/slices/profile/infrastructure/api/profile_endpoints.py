@@ -1,11 +1,13 @@
 """
 Profile completion API endpoints for RF002
 """
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 
 from shared.database import get_db
+from shared.utils.etag import not_modified, version_etag
+from shared.utils.json_response import trusted_response
 from slices.auth.infrastructure.api.auth_endpoints import get_current_user
 from slices.signup.domain.models.user_model import User
 from slices.profile.application.use_cases.complete_profile_use_case import CompleteProfileUseCase
@@ -46,13 +48,24 @@ async def get_profile_completeness(
 
 @router.get("/extended", response_model=ExtendedPatientProfileDTO)
 async def get_extended_profile(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Get extended patient profile data (RF002 fields)
+
+    Answers 304 Not Modified when If-None-Match matches the current ETag.
     """
     use_case = CompleteProfileUseCase(db)
+
+    stamp = use_case.get_extended_profile_version(current_user.id)
+    if stamp[0] is not None:
+        cached = not_modified(request, response, version_etag("profile.extended", current_user.id, *stamp))
+        if cached:
+            return cached
+
     profile = use_case.get_extended_profile(current_user.id)
 
     if not profile:
@@ -61,7 +74,7 @@ async def get_extended_profile(
             detail="Patient profile not found"
         )
 
-    return profile
+    return trusted_response(profile, response)
 
 
 @router.put("/complete")
@@ -85,15 +98,51 @@ async def update_extended_profile(
     return result
 
 
+@router.patch("/extended")
+async def patch_extended_profile(
+    profile_data: PatientProfileUpdateDTO,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Partially update the extended patient profile (autosave)
+
+    Only the fields present in the body are applied; null clears a field.
+    A body that matches the stored profile writes nothing and returns
+    changed_fields = [].
+    """
+    use_case = CompleteProfileUseCase(db)
+    result = use_case.update_extended_profile(current_user.id, profile_data, partial=True)
+
+    if not result["success"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=result["message"]
+        )
+
+    return result
+
+
 @router.get("/basic", response_model=BasicPatientInfoDTO)
 async def get_basic_patient_info(
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Get basic patient information (from signup)
+
+    Answers 304 Not Modified when If-None-Match matches the current ETag.
     """
     use_case = CompleteProfileUseCase(db)
+
+    stamp = use_case.get_basic_patient_info_version(current_user.id)
+    if stamp[0] is not None:
+        cached = not_modified(request, response, version_etag("profile.basic", current_user.id, *stamp))
+        if cached:
+            return cached
+
     basic_info = use_case.get_basic_patient_info(current_user.id)
 
     if not basic_info:
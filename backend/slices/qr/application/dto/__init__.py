@@ -6,7 +6,7 @@ from typing import Optional, List
 from uuid import UUID
 from pydantic import BaseModel, field_serializer
 
-from slices.qr.application.dto.qr_response_dto import QRResponseDTO
+from slices.qr.application.dto.qr_response_dto import QRResponseDTO, OfflineQRResponseDTO
 
 
 class QRCodeResponseDTO(BaseModel):
@@ -53,6 +53,7 @@ class QRDataDTO(BaseModel):
 
 __all__ = [
     'QRResponseDTO',
+    'OfflineQRResponseDTO',
     'QRCodeResponseDTO',
     'EmergencyPatientResponseDTO',
     'QRDataDTO'
@@ -17,6 +17,16 @@ class QRResponseDTO(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @classmethod
+    def from_patient(cls, patient, frontend_url: str) -> "QRResponseDTO":
+        """Build the QR response from the patient's qr_code field"""
+        return cls(
+            qr_uuid=str(patient.qr_code),
+            qr_url=f"{frontend_url}/qr/{patient.qr_code}",
+            created_at=patient.created_at,
+            expires_at=None  # No expiration for patient QR codes
+        )
+
     @field_serializer('created_at', when_used='json')
     def serialize_created_at(self, value: datetime, _info) -> str:
         """Serialize datetime to ISO format string"""
@@ -26,3 +36,20 @@ class QRResponseDTO(BaseModel):
     def serialize_expires_at(self, value: Optional[datetime], _info) -> Optional[str]:
         """Serialize optional datetime to ISO format string"""
         return value.isoformat() if value else None
+
+
+class OfflineQRResponseDTO(BaseModel):
+    """Response DTO for the offline QR payload (emergency data signed into the QR itself)"""
+    payload: str
+    payload_chars: int
+    max_chars: int
+    truncated: bool = False
+    kid: str
+    algorithm: str
+    issued_at: datetime
+    qr_image_base64: Optional[str] = None
+
+    @field_serializer('issued_at', when_used='json')
+    def serialize_issued_at(self, value: datetime, _info) -> str:
+        """Serialize datetime to ISO format string"""
+        return value.isoformat()
@@ -4,7 +4,7 @@ Interface for QR code data access operations
 """
 from abc import ABC, abstractmethod
 from uuid import UUID
-from typing import Optional
+from typing import Optional, Tuple
 
 from slices.qr.domain.models import EmergencyPatientInfo
 
@@ -25,4 +25,9 @@ class QRRepositoryPort(ABC):
     @abstractmethod
     async def get_patient_id_by_qr_code(self, qr_uuid: UUID) -> Optional[UUID]:
         """Get patient ID by QR code UUID"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def get_emergency_version_stamp(self, qr_uuid: UUID) -> Tuple:
+        """Version stamp of the data in a patient's offline QR"""
+        pass
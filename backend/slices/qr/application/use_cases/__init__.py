@@ -4,8 +4,10 @@ Application use cases for QR code functionality
 """
 from .generate_qr_code import GenerateQRCodeUseCase
 from .get_emergency_data import GetEmergencyDataUseCase
+from .generate_offline_qr import GenerateOfflineQRUseCase
 
 __all__ = [
     "GenerateQRCodeUseCase",
-    "GetEmergencyDataUseCase"
+    "GetEmergencyDataUseCase",
+    "GenerateOfflineQRUseCase"
 ]
\ No newline at end of file
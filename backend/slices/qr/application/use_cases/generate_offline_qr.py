@@ -0,0 +1,86 @@
+"""
+Generate offline QR use case
+Builds the signed emergency payload embedded directly in the QR code
+"""
+from datetime import datetime, timezone
+from typing import Tuple
+from uuid import UUID
+
+from fastapi.concurrency import run_in_threadpool
+
+from slices.qr.application.ports.qr_repository import QRRepositoryPort
+from slices.qr.application.dto.qr_response_dto import OfflineQRResponseDTO
+from slices.qr.infrastructure.services.offline_payload import (
+    OfflineEmergencyPayload,
+    OfflinePayloadSigner,
+    encode_offline_payload,
+)
+from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
+from shared.exceptions.application_exceptions import NotFoundException
+
+
+class GenerateOfflineQRUseCase:
+    """Use case for generating a QR that carries the emergency data itself"""
+
+    def __init__(
+        self,
+        qr_repository: QRRepositoryPort,
+        signer: OfflinePayloadSigner,
+        qr_generator: QRGeneratorService,
+        max_chars: int
+    ):
+        self.qr_repository = qr_repository
+        self.signer = signer
+        self.qr_generator = qr_generator
+        self.max_chars = max_chars
+
+    async def get_version(self, qr_uuid: UUID) -> Tuple:
+        """Version stamp of the offline QR, for conditional GET (includes the signing key)"""
+        stamp = await self.qr_repository.get_emergency_version_stamp(qr_uuid)
+        return stamp + (self.signer.kid,)
+
+    async def execute(self, qr_uuid: UUID, include_image: bool = True) -> OfflineQRResponseDTO:
+        """
+        Execute the use case to build the offline payload for a patient
+
+        Args:
+            qr_uuid: Patient's QR code UUID
+            include_image: Also render the payload as a PNG QR code
+
+        Returns:
+            OfflineQRResponseDTO with the QR text and, optionally, the image
+
+        Raises:
+            NotFoundException: If the patient has no QR code
+        """
+        emergency_info = await self.qr_repository.get_emergency_patient_info(qr_uuid)
+        if not emergency_info:
+            raise NotFoundException("Patient QR code not found")
+
+        payload = OfflineEmergencyPayload(
+            qr_code=emergency_info.qr_code,
+            issued_at=datetime.now(timezone.utc),
+            full_name=emergency_info.full_name,
+            blood_type=emergency_info.blood_type or "",
+            emergency_contact=emergency_info.emergency_contact or "",
+            critical_allergies=list(emergency_info.critical_allergies),
+            current_medications=list(emergency_info.current_medications),
+            chronic_conditions=list(emergency_info.chronic_conditions),
+        )
+        text, encoded = encode_offline_payload(payload, self.signer, self.max_chars)
+
+        qr_image_base64 = None
+        if include_image:
+            # Rendering the PNG is CPU-bound; keep it off the event loop
+            qr_image_base64 = await run_in_threadpool(self.qr_generator.generate_offline_qr, text)
+
+        return OfflineQRResponseDTO(
+            payload=text,
+            payload_chars=len(text),
+            max_chars=self.max_chars,
+            truncated=encoded.truncated,
+            kid=encoded.kid,
+            algorithm=encoded.algorithm,
+            issued_at=encoded.issued_at,
+            qr_image_base64=qr_image_base64,
+        )
@@ -6,8 +6,6 @@ from typing import Optional
 from uuid import UUID
 from pydantic import BaseModel
 
-from slices.qr.domain.models.qr_model import QR
-
 
 class QRCodeData(BaseModel):
     """Domain model for QR code data"""
@@ -28,4 +26,4 @@ class EmergencyPatientInfo(BaseModel):
     chronic_conditions: list[str] = []
 
 
-__all__ = ['QR', 'QRCodeData', 'EmergencyPatientInfo']
\ No newline at end of file
+__all__ = ['QRCodeData', 'EmergencyPatientInfo']
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+Read models for QR lookups
+
+Column projections used instead of full Patient rows (see
+shared.database.read_models).
+"""
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class QREmergencyPatientRow:
+    """Patient fields shown on the QR emergency summary"""
+    id: UUID
+    first_name: str
+    last_name: str
+    blood_type: Optional[str]
+    emergency_contact_name: Optional[str]
+    emergency_contact_phone: Optional[str]
+
+    @property
+    def full_name(self) -> str:
+        """Same format as Patient.full_name"""
+        return f"{self.first_name} {self.last_name}"
@@ -2,57 +2,106 @@
 QR API endpoints - Simplified version for patient QR display
 Uses existing patients.qr_code field instead of separate table
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
-from shared.database.database import get_db
 from shared.config.settings import settings
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
-from slices.signup.domain.models.user_model import User
-from slices.signup.domain.models.patient_model import Patient
-from slices.qr.application.dto import QRResponseDTO
+from shared.database import get_read_db
+from shared.exceptions.application_exceptions import NotFoundException
+from shared.utils.etag import not_modified, version_etag
+from slices.auth.infrastructure.api.auth_endpoints import get_current_patient
+from slices.auth.application.use_cases import AuthenticatedPrincipal
+from slices.qr.application.dto import QRResponseDTO, OfflineQRResponseDTO
+from slices.qr.application.use_cases import GenerateOfflineQRUseCase
+from slices.qr.infrastructure.repositories.qr_repository import QRRepository
+from slices.qr.infrastructure.services.offline_qr_keys import get_offline_qr_key_ring, get_offline_qr_signer
+from slices.qr.infrastructure.services.qr_generator_service import QRGeneratorService
 
 router = APIRouter(prefix="/api/qr", tags=["qr"])
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
-    if not patient:
+def get_offline_qr_use_case(db: Session = Depends(get_read_db)) -> GenerateOfflineQRUseCase:
+    """Dependency to get the offline QR use case (503 until signing keys are configured)"""
+    signer = get_offline_qr_signer()
+    if signer is None:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient record not found"
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Offline QR codes are not configured"
         )
-    return patient
+    return GenerateOfflineQRUseCase(
+        QRRepository(db), signer, QRGeneratorService(), settings.QR_OFFLINE_MAX_CHARS
+    )
 
 
 @router.get("/", response_model=QRResponseDTO)
 async def get_patient_qr(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient)
 ):
     """
     Get patient's QR code information
     Requires authentication - patient only
     Returns patient's QR code UUID from patients table
     """
-    # Ensure user is a patient
-    if current_user.user_type != "patient":
+    # Every patient already has a qr_code UUID (auto-generated on creation)
+    # Build the QR URL using the patient's qr_code field and frontend URL from settings
+    return QRResponseDTO.from_patient(principal.patient, settings.FRONTEND_URL)
+
+
+@router.get("/offline", response_model=OfflineQRResponseDTO)
+async def get_patient_offline_qr(
+    request: Request,
+    response: Response,
+    image: bool = True,
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    use_case: GenerateOfflineQRUseCase = Depends(get_offline_qr_use_case)
+):
+    """
+    Get the patient's offline emergency QR
+    Requires authentication - patient only
+    The QR carries blood type, critical allergies, active medications and chronic
+    conditions, signed so a paramedic app can verify it without connectivity
+
+    Answers 304 Not Modified when If-None-Match matches the current ETag,
+    which only changes with the emergency data (not other profile edits).
+    """
+    patient = principal.patient
+
+    stamp = await use_case.get_version(patient.qr_code)
+    if stamp[0] is not None:
+        cached = not_modified(request, response, version_etag("qr.offline", patient.id, image, *stamp))
+        if cached:
+            return cached
+
+    try:
+        return await use_case.execute(principal.patient.qr_code, include_image=image)
+
+    except NotFoundException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except ValueError:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access QR codes"
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Emergency data does not fit in an offline QR code"
         )
 
-    # Get patient record
-    patient = await get_patient_from_user(current_user, db)
 
-    # Every patient already has a qr_code UUID (auto-generated on creation)
-    # Build the QR URL using the patient's qr_code field and frontend URL from settings
-    qr_url = f"{settings.FRONTEND_URL}/qr/{patient.qr_code}"
+@router.get("/offline/keys")
+async def get_offline_qr_keys(request: Request) -> Response:
+    """
+    Publish the public keys that verify offline QR payloads (JWKS)
+    Public endpoint - paramedic apps cache it to verify QR codes offline
+    """
+    key_ring = get_offline_qr_key_ring()
+    headers = {"Cache-Control": f"public, max-age={settings.JWKS_CACHE_MAX_AGE_SECONDS}"}
 
-    return QRResponseDTO(
-        qr_uuid=str(patient.qr_code),
-        qr_url=qr_url,
-        created_at=patient.created_at,
-        expires_at=None  # No expiration for patient QR codes
-    )
+    if key_ring is None:
+        return JSONResponse(content={"keys": []}, headers=headers)
+
+    headers["ETag"] = key_ring.jwks_etag
+    if request.headers.get("If-None-Match") == key_ring.jwks_etag:
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(content=key_ring.jwks, headers=headers)
@@ -1,14 +1,17 @@
 """
 QR repository implementation using SQLAlchemy
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 from sqlalchemy.exc import SQLAlchemyError
 
+from shared.database.read_models import fetch_one, project
+from shared.database.version_stamps import collection_stamp, column_stamp, read_version_stamp
 from slices.qr.application.ports.qr_repository import QRRepositoryPort
 from slices.qr.domain.models import EmergencyPatientInfo
+from slices.qr.domain.models.qr_read_models import QREmergencyPatientRow
 from slices.signup.domain.models.patient_model import Patient
 
 
@@ -21,15 +24,20 @@ class QRRepository(QRRepositoryPort):
     async def get_patient_qr_code(self, patient_id: UUID) -> Optional[UUID]:
         """Get patient's QR code UUID"""
         try:
-            patient = self.db.query(Patient).filter(Patient.id == patient_id).first()
-            return patient.qr_code if patient else None
+            return self.db.execute(
+                select(Patient.qr_code).where(Patient.id == patient_id)
+            ).scalar_one_or_none()
         except SQLAlchemyError:
             return None
 
     async def get_emergency_patient_info(self, qr_uuid: UUID) -> Optional[EmergencyPatientInfo]:
         """Get emergency patient information by QR code UUID"""
         try:
-            patient = self.db.query(Patient).filter(Patient.qr_code == qr_uuid).first()
+            patient = fetch_one(
+                self.db,
+                QREmergencyPatientRow,
+                select(*project(QREmergencyPatientRow, Patient)).where(Patient.qr_code == qr_uuid)
+            )
 
             if not patient:
                 return None
@@ -38,13 +46,14 @@ class QRRepository(QRRepositoryPort):
             critical_allergies = []
             try:
                 from slices.allergies.domain.models.allergy_model import PatientAllergy
-                allergies = self.db.query(PatientAllergy).filter(
-                    and_(
-                        PatientAllergy.patient_id == patient.id,
-                        PatientAllergy.severity.in_(['high', 'severe', 'critical'])
+                critical_allergies = list(self.db.execute(
+                    select(PatientAllergy.allergen).where(
+                        and_(
+                            PatientAllergy.patient_id == patient.id,
+                            PatientAllergy.severity_level.in_(['severa', 'critica'])
+                        )
                     )
-                ).all()
-                critical_allergies = [allergy.allergen for allergy in allergies]
+                ).scalars())
             except (ImportError, SQLAlchemyError):
                 pass
 
@@ -52,13 +61,14 @@ class QRRepository(QRRepositoryPort):
             current_medications = []
             try:
                 from slices.medications.domain.models.medication_model import PatientMedication
-                medications = self.db.query(PatientMedication).filter(
-                    and_(
-                        PatientMedication.patient_id == patient.id,
-                        PatientMedication.is_active == True
+                current_medications = list(self.db.execute(
+                    select(PatientMedication.medication_name).where(
+                        and_(
+                            PatientMedication.patient_id == patient.id,
+                            PatientMedication.is_active == True
+                        )
                     )
-                ).all()
-                current_medications = [med.medication_name for med in medications]
+                ).scalars())
             except (ImportError, SQLAlchemyError):
                 pass
 
@@ -66,13 +76,14 @@ class QRRepository(QRRepositoryPort):
             chronic_conditions = []
             try:
                 from slices.illnesses.domain.models.illness_model import PatientIllness
-                illnesses = self.db.query(PatientIllness).filter(
-                    and_(
-                        PatientIllness.patient_id == patient.id,
-                        PatientIllness.is_chronic == True
+                chronic_conditions = list(self.db.execute(
+                    select(PatientIllness.illness_name).where(
+                        and_(
+                            PatientIllness.patient_id == patient.id,
+                            PatientIllness.is_chronic == True
+                        )
                     )
-                ).all()
-                chronic_conditions = [illness.illness_name for illness in illnesses]
+                ).scalars())
             except (ImportError, SQLAlchemyError):
                 pass
 
@@ -99,7 +110,30 @@ class QRRepository(QRRepositoryPort):
     async def get_patient_id_by_qr_code(self, qr_uuid: UUID) -> Optional[UUID]:
         """Get patient ID by QR code UUID"""
         try:
-            patient = self.db.query(Patient).filter(Patient.qr_code == qr_uuid).first()
-            return patient.id if patient else None
+            return self.db.execute(
+                select(Patient.id).where(Patient.qr_code == qr_uuid)
+            ).scalar_one_or_none()
         except SQLAlchemyError:
-            return None
\ No newline at end of file
+            return None
+
+    async def get_emergency_version_stamp(self, qr_uuid: UUID) -> Tuple:
+        """
+        emergency_version of the patient plus the allergy, medication and
+        illness collections, in one query (edits to other profile fields
+        leave it unchanged)
+        """
+        from slices.allergies.domain.models.allergy_model import PatientAllergy
+        from slices.illnesses.domain.models.illness_model import PatientIllness
+        from slices.medications.domain.models.medication_model import PatientMedication
+
+        patient_id = select(Patient.id).where(Patient.qr_code == qr_uuid).scalar_subquery()
+        try:
+            return read_version_stamp(
+                self.db,
+                column_stamp(Patient.emergency_version, Patient.qr_code == qr_uuid),
+                collection_stamp(PatientAllergy, PatientAllergy.patient_id == patient_id),
+                collection_stamp(PatientMedication, PatientMedication.patient_id == patient_id),
+                collection_stamp(PatientIllness, PatientIllness.patient_id == patient_id),
+            )
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting emergency version: {str(e)}")
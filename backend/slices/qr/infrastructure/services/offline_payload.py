@@ -0,0 +1,300 @@
+"""
+Offline emergency QR payload: compact, signed, readable without connectivity
+
+The QR text is "VG1:" followed by the Base45 form (RFC 9285) of:
+
+    offset  size  field
+    0       1     format version (1)
+    1       1     flags (bit 0: lists were truncated to fit the QR)
+    2       1     signature algorithm id (see ALGORITHM_IDS)
+    3       1     kid length n
+    4       n     kid (ASCII), selects the verification key from the QR JWKS
+    4+n     16    patient QR code UUID, for an online lookup when possible
+    20+n    4     issued at, unix seconds (uint32, big-endian)
+    24+n    2     body length m (uint16, big-endian)
+    26+n    m     body, raw DEFLATE of UTF-8 text
+    26+n+m  ...   signature over every byte before it (ES256: 64 bytes r||s)
+
+The body has six fields separated by RS (0x1E): full name, blood type,
+emergency contact, critical allergies, active medications and chronic
+conditions. List items are separated by US (0x1F).
+
+Base45 keeps the text in the QR alphanumeric set, which packs about as
+densely as binary mode. The text also survives scanners that only return
+strings. The encoding needs only the standard library; verifying a
+signature also needs python-jose, as the API uses it. A client decoder
+can follow the table above.
+"""
+import struct
+import time
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+PAYLOAD_PREFIX = "VG1:"
+FORMAT_VERSION = 1
+FLAG_TRUNCATED = 0x01
+
+ALGORITHM_IDS = {"ES256": 1, "ES384": 2, "ES512": 3, "RS256": 4}
+ALGORITHMS_BY_ID = {algorithm_id: name for name, algorithm_id in ALGORITHM_IDS.items()}
+
+FIELD_SEPARATOR = "\x1e"
+ITEM_SEPARATOR = "\x1f"
+
+# Longest text kept per field or list item; longer values are cut
+MAX_FIELD_CHARS = 60
+
+# Alphanumeric capacity of a QR code at version 20, error correction M
+DEFAULT_MAX_CHARS = 970
+
+BASE45_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:"
+_BASE45_VALUES = {char: value for value, char in enumerate(BASE45_ALPHABET)}
+
+
+class InvalidOfflinePayloadError(ValueError):
+    """The QR text is not a well-formed or correctly signed offline payload"""
+
+
+@dataclass
+class OfflineEmergencyPayload:
+    """Emergency data carried inside the QR code"""
+    qr_code: UUID
+    issued_at: datetime
+    full_name: str = ""
+    blood_type: str = ""
+    emergency_contact: str = ""
+    critical_allergies: List[str] = field(default_factory=list)
+    current_medications: List[str] = field(default_factory=list)
+    chronic_conditions: List[str] = field(default_factory=list)
+    truncated: bool = False
+    kid: str = ""
+    algorithm: str = ""
+
+
+class OfflinePayloadSigner:
+    """Signs payloads with a PEM private key (python-jose JWK)"""
+
+    def __init__(self, algorithm: str, private_key_pem: str, kid: str):
+        if algorithm not in ALGORITHM_IDS:
+            raise ValueError(f"Unsupported offline QR signing algorithm: {algorithm}")
+        if len(kid.encode("ascii")) > 255:
+            raise ValueError("Offline QR key id must be at most 255 ASCII characters")
+
+        from jose import jwk
+
+        self.algorithm = algorithm
+        self.kid = kid
+        self._key = jwk.construct(private_key_pem, algorithm)
+
+    def sign(self, data: bytes) -> bytes:
+        return self._key.sign(data)
+
+    def public_jwk(self) -> Dict[str, Any]:
+        """Public half of the key, in the form published by the QR JWKS"""
+        return self._key.public_key().to_dict()
+
+
+def base45_encode(data: bytes) -> str:
+    chars = []
+    for index in range(0, len(data) - 1, 2):
+        value = data[index] * 256 + data[index + 1]
+        value, c = divmod(value, 45)
+        e, d = divmod(value, 45)
+        chars.extend((BASE45_ALPHABET[c], BASE45_ALPHABET[d], BASE45_ALPHABET[e]))
+    if len(data) % 2:
+        d, c = divmod(data[-1], 45)
+        chars.extend((BASE45_ALPHABET[c], BASE45_ALPHABET[d]))
+    return "".join(chars)
+
+
+def base45_decode(text: str) -> bytes:
+    try:
+        values = [_BASE45_VALUES[char] for char in text]
+    except KeyError:
+        raise InvalidOfflinePayloadError("Payload contains characters outside Base45")
+
+    output = bytearray()
+    for index in range(0, len(values), 3):
+        chunk = values[index:index + 3]
+        if len(chunk) == 3:
+            value = chunk[0] + chunk[1] * 45 + chunk[2] * 45 * 45
+            if value > 0xFFFF:
+                raise InvalidOfflinePayloadError("Invalid Base45 triplet")
+            output.extend(divmod(value, 256))
+        elif len(chunk) == 2:
+            value = chunk[0] + chunk[1] * 45
+            if value > 0xFF:
+                raise InvalidOfflinePayloadError("Invalid Base45 pair")
+            output.append(value)
+        else:
+            raise InvalidOfflinePayloadError("Invalid Base45 length")
+    return bytes(output)
+
+
+def encode_offline_payload(
+    payload: OfflineEmergencyPayload,
+    signer: OfflinePayloadSigner,
+    max_chars: int = DEFAULT_MAX_CHARS
+) -> Tuple[str, OfflineEmergencyPayload]:
+    """
+    Sign and encode a payload into QR text, trimming lists until it fits
+
+    Items are dropped from the end of the medications list first, then
+    chronic conditions, then allergies. The truncated flag tells the reader
+    to check the online record.
+
+    Returns:
+        (QR text, the payload as actually encoded)
+
+    Raises:
+        ValueError: If even the payload without lists exceeds max_chars
+    """
+    encoded = _clean(payload, signer)
+    text = _encode(encoded, signer)
+
+    # Least critical first: allergies are the last thing to drop
+    for list_name in ("current_medications", "chronic_conditions", "critical_allergies"):
+        items = getattr(encoded, list_name)
+        while len(text) > max_chars and items:
+            items.pop()
+            encoded.truncated = True
+            text = _encode(encoded, signer)
+
+    if len(text) > max_chars:
+        raise ValueError(f"Offline QR payload needs {len(text)} characters, limit is {max_chars}")
+    return text, encoded
+
+
+def decode_offline_payload(
+    text: str,
+    verification_keys: Optional[Mapping[str, Dict[str, Any]]] = None,
+    verify: bool = True
+) -> OfflineEmergencyPayload:
+    """
+    Decode QR text and verify its signature
+
+    Args:
+        text: Scanned QR text ("VG1:...")
+        verification_keys: kid -> public JWK, e.g. from GET /api/qr/offline/keys
+        verify: Set to False to read a payload without checking the signature
+
+    Raises:
+        InvalidOfflinePayloadError: Malformed payload, unknown kid or bad signature
+    """
+    if not text.startswith(PAYLOAD_PREFIX):
+        raise InvalidOfflinePayloadError("Not a VitalGo offline emergency payload")
+    raw = base45_decode(text[len(PAYLOAD_PREFIX):])
+
+    try:
+        version, flags, algorithm_id, kid_length = struct.unpack_from(">BBBB", raw, 0)
+        if version != FORMAT_VERSION:
+            raise InvalidOfflinePayloadError(f"Unsupported payload version {version}")
+        offset = 4
+        kid = raw[offset:offset + kid_length].decode("ascii")
+        offset += kid_length
+        qr_code = UUID(bytes=raw[offset:offset + 16])
+        offset += 16
+        issued_at, body_length = struct.unpack_from(">IH", raw, offset)
+        offset += 6
+        body = zlib.decompress(raw[offset:offset + body_length], wbits=-15).decode("utf-8")
+        offset += body_length
+    except (struct.error, ValueError, zlib.error, UnicodeDecodeError) as e:
+        if isinstance(e, InvalidOfflinePayloadError):
+            raise
+        raise InvalidOfflinePayloadError(f"Malformed payload: {type(e).__name__}")
+
+    algorithm = ALGORITHMS_BY_ID.get(algorithm_id)
+    if algorithm is None:
+        raise InvalidOfflinePayloadError(f"Unknown signature algorithm id {algorithm_id}")
+
+    if verify:
+        _verify(raw[:offset], raw[offset:], algorithm, kid, verification_keys or {})
+
+    fields = body.split(FIELD_SEPARATOR)
+    if len(fields) != 6:
+        raise InvalidOfflinePayloadError("Malformed payload body")
+
+    return OfflineEmergencyPayload(
+        qr_code=qr_code,
+        issued_at=datetime.fromtimestamp(issued_at, tz=timezone.utc),
+        full_name=fields[0],
+        blood_type=fields[1],
+        emergency_contact=fields[2],
+        critical_allergies=_split_items(fields[3]),
+        current_medications=_split_items(fields[4]),
+        chronic_conditions=_split_items(fields[5]),
+        truncated=bool(flags & FLAG_TRUNCATED),
+        kid=kid,
+        algorithm=algorithm,
+    )
+
+
+def _verify(signed: bytes, signature: bytes, algorithm: str, kid: str,
+            verification_keys: Mapping[str, Dict[str, Any]]) -> None:
+    public_jwk = verification_keys.get(kid)
+    if public_jwk is None:
+        raise InvalidOfflinePayloadError(f"No verification key for kid '{kid}'")
+
+    from jose import jwk
+
+    if not signature or not jwk.construct(public_jwk, algorithm).verify(signed, signature):
+        raise InvalidOfflinePayloadError("Signature verification failed")
+
+
+def _clean(payload: OfflineEmergencyPayload, signer: OfflinePayloadSigner) -> OfflineEmergencyPayload:
+    """Copy with separators stripped, long values cut and signer metadata set"""
+    return OfflineEmergencyPayload(
+        qr_code=payload.qr_code,
+        issued_at=payload.issued_at,
+        full_name=_clean_text(payload.full_name),
+        blood_type=_clean_text(payload.blood_type),
+        emergency_contact=_clean_text(payload.emergency_contact),
+        critical_allergies=_clean_items(payload.critical_allergies),
+        current_medications=_clean_items(payload.current_medications),
+        chronic_conditions=_clean_items(payload.chronic_conditions),
+        truncated=payload.truncated,
+        kid=signer.kid,
+        algorithm=signer.algorithm,
+    )
+
+
+def _clean_text(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    text = value.replace(FIELD_SEPARATOR, " ").replace(ITEM_SEPARATOR, " ").strip()
+    return text[:MAX_FIELD_CHARS]
+
+
+def _clean_items(values: Sequence[str]) -> List[str]:
+    return [item for item in (_clean_text(value) for value in values) if item]
+
+
+def _split_items(value: str) -> List[str]:
+    return value.split(ITEM_SEPARATOR) if value else []
+
+
+def _encode(payload: OfflineEmergencyPayload, signer: OfflinePayloadSigner) -> str:
+    body_text = FIELD_SEPARATOR.join((
+        payload.full_name,
+        payload.blood_type,
+        payload.emergency_contact,
+        ITEM_SEPARATOR.join(payload.critical_allergies),
+        ITEM_SEPARATOR.join(payload.current_medications),
+        ITEM_SEPARATOR.join(payload.chronic_conditions),
+    ))
+    compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+    body = compressor.compress(body_text.encode("utf-8")) + compressor.flush()
+
+    kid = signer.kid.encode("ascii")
+    issued_at = int(payload.issued_at.timestamp()) if payload.issued_at else int(time.time())
+    header = struct.pack(
+        ">BBBB",
+        FORMAT_VERSION,
+        FLAG_TRUNCATED if payload.truncated else 0,
+        ALGORITHM_IDS[signer.algorithm],
+        len(kid),
+    )
+    signed = header + kid + payload.qr_code.bytes + struct.pack(">IH", issued_at, len(body)) + body
+    return PAYLOAD_PREFIX + base45_encode(signed + signer.sign(signed))
@@ -0,0 +1,57 @@
+"""
+Signing keys for offline emergency QR payloads
+
+Printed QR codes outlive access tokens, so they have their own key ring
+(QR_OFFLINE_KEYS_DIR) rather than the JWT one. Retire a key by keeping only
+its <kid>.pub.pem: QR codes signed with it stay verifiable.
+"""
+from typing import Optional
+
+from shared.config.settings import settings
+from slices.auth.infrastructure.security.jwt_key_ring import JWTKeyRing
+from slices.qr.infrastructure.services.offline_payload import OfflinePayloadSigner
+
+# Global instance storage
+_key_ring_instance: Optional[JWTKeyRing] = None
+_signer_instance: Optional[OfflinePayloadSigner] = None
+
+
+def get_offline_qr_key_ring() -> Optional[JWTKeyRing]:
+    """
+    Get or create the singleton offline QR key ring
+
+    Returns:
+        JWTKeyRing, or None when QR_OFFLINE_KEYS_DIR is not configured
+    """
+    global _key_ring_instance
+
+    if _key_ring_instance is None and settings.QR_OFFLINE_KEYS_DIR:
+        _key_ring_instance = JWTKeyRing(
+            settings.QR_OFFLINE_ALGORITHM,
+            settings.QR_OFFLINE_KEYS_DIR,
+            settings.QR_OFFLINE_ACTIVE_KID
+        )
+
+    return _key_ring_instance
+
+
+def get_offline_qr_signer() -> Optional[OfflinePayloadSigner]:
+    """Signer for the active key, or None when offline QR is not configured"""
+    global _signer_instance
+
+    key_ring = get_offline_qr_key_ring()
+    if _signer_instance is None and key_ring is not None:
+        _signer_instance = OfflinePayloadSigner(
+            key_ring.algorithm, key_ring.signing_key, key_ring.active_kid
+        )
+
+    return _signer_instance
+
+
+def reset_offline_qr_keys() -> None:
+    """
+    Reset the singleton instances (useful for testing)
+    """
+    global _key_ring_instance, _signer_instance
+    _key_ring_instance = None
+    _signer_instance = None
@@ -1,20 +1,30 @@
 """
 QR Code Generation Service
 Service for generating QR codes with VitalGo logo embedding
+
+qrcode and Pillow are imported on first use so that importing this module
+(and every API worker boot) does not pay for them.
 """
-import qrcode
-from PIL import Image, ImageDraw
+from __future__ import annotations
+
 from io import BytesIO
 import base64
 from uuid import UUID
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import os
 from shared.config.settings import settings
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 class QRGeneratorService:
     """Service for generating QR codes with logo embedding"""
 
+    # Decoded logo shared by all instances; loaded once per process (see preload_logo)
+    _logo_cache: Optional[Image.Image] = None
+    _logo_loaded = False
+
     def __init__(self):
         self.logo_path = "../frontend/public/assets/images/logos/logos-blue-light-background.png"
         self.logo_size_ratio = 0.2  # Logo will be 20% of QR code size
@@ -32,6 +42,8 @@ class QRGeneratorService:
         # Create emergency URL
         emergency_url = f"{settings.FRONTEND_URL}/qr/{str(qr_uuid)}"
 
+        import qrcode
+
         # Generate QR code
         qr = qrcode.QRCode(
             version=1,
@@ -53,8 +65,47 @@ class QRGeneratorService:
         # Convert to base64
         return self._image_to_base64(qr_img)
 
+    def generate_offline_qr(self, payload: str) -> str:
+        """
+        Render an offline payload as a plain QR code (no logo)
+
+        Medium error correction and no logo overlay leave the capacity for
+        the payload; the "VG1:" Base45 text is encoded in alphanumeric mode.
+
+        Returns:
+            Base64 encoded PNG image of the QR code
+        """
+        import qrcode
+
+        qr = qrcode.QRCode(
+            version=None,
+            error_correction=qrcode.constants.ERROR_CORRECT_M,
+            box_size=6,
+            border=4,
+        )
+        qr.add_data(payload)
+        qr.make(fit=True)
+
+        qr_img = qr.make_image(fill_color="black", back_color="white").convert('RGB')
+        return self._image_to_base64(qr_img)
+
+    @classmethod
+    def preload_logo(cls) -> bool:
+        """Decode the logo ahead of the first QR request; returns True if a logo was found"""
+        return cls()._load_logo() is not None
+
     def _load_logo(self) -> Optional[Image.Image]:
-        """Load VitalGo logo image"""
+        """Load VitalGo logo image (decoded once, then served from memory)"""
+        cls = type(self)
+        if not cls._logo_loaded:
+            cls._logo_cache = self._read_logo()
+            cls._logo_loaded = True
+        return cls._logo_cache
+
+    def _read_logo(self) -> Optional[Image.Image]:
+        """Read and decode the logo file"""
+        from PIL import Image
+
         try:
             # Try to load from multiple possible paths
             possible_paths = [
@@ -65,7 +116,8 @@ class QRGeneratorService:
 
             for path in possible_paths:
                 if os.path.exists(path):
-                    return Image.open(path).convert('RGBA')
+                    with Image.open(path) as logo:
+                        return logo.convert('RGBA')
 
             # If no logo found, return None (QR will be generated without logo)
             return None
@@ -76,6 +128,8 @@ class QRGeneratorService:
 
     def _add_logo_to_qr(self, qr_img: Image.Image, logo_img: Image.Image) -> Image.Image:
         """Add logo to the center of QR code with white background"""
+        from PIL import Image, ImageDraw
+
         qr_width, qr_height = qr_img.size
 
         # Calculate logo size (20% of QR code)
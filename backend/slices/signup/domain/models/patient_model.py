@@ -8,6 +8,23 @@ from sqlalchemy.orm import relationship
 import uuid
 
 from shared.database import Base
+from shared.database.change_tracking import change_seq_column
+
+# Every patient column read by emergency views: the paramedic view
+# (emergency_access), the owner's emergency data, the QR summary and the
+# offline QR. Changing one bumps Patient.emergency_version; the rest only
+# move updated_at. A view that starts reading another column must add it here.
+EMERGENCY_FIELDS = frozenset({
+    "first_name", "last_name", "birth_date", "document_type_id", "document_number",
+    "biological_sex", "gender", "birth_country",
+    "residence_address", "residence_country", "residence_city", "residence_department",
+    "occupation", "eps", "additional_insurance", "complementary_plan", "blood_type",
+    "emergency_contact_name", "emergency_contact_relationship",
+    "emergency_contact_phone", "emergency_contact_phone_alt",
+    "is_pregnant", "pregnancy_weeks", "last_menstruation_date",
+    "pregnancies_count", "births_count", "cesareans_count", "abortions_count",
+    "contraceptive_method",
+})
 
 
 class Patient(Base):
@@ -41,6 +58,10 @@ class Patient(Base):
     accept_policy_date = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Delta sync: bumped on every profile update
+    change_seq = change_seq_column()
+    # Version of the EMERGENCY_FIELDS group, for caches of emergency views
+    emergency_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     # RF002 Personal Information Fields - added by migration eb4f0500c848
     biological_sex = Column(String(20), nullable=True)
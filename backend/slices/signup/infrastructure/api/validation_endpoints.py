@@ -1,16 +1,19 @@
 """
 Validation API endpoints for onBlur validation
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List
 
+from shared.config.settings import settings
 from shared.database import get_db
+from shared.utils.json_response import dumps
+from shared.utils.precompressed import precompressed_json_response
 from slices.signup.application.use_cases.validate_document import ValidateDocumentUseCase
 from slices.signup.application.use_cases.validate_email import ValidateEmailUseCase
 from slices.signup.infrastructure.persistence.user_repository import SQLAlchemyUserRepository
 from slices.signup.infrastructure.persistence.patient_repository import SQLAlchemyPatientRepository
-from slices.signup.domain.models.document_type_model import DocumentType
+from slices.signup.infrastructure.persistence.document_type_repository import SQLAlchemyDocumentTypeRepository
 
 router = APIRouter(prefix="/api/signup", tags=["Validation"])
 
@@ -60,21 +63,18 @@ async def validate_email(
     return result
 
 
-@router.get("/document-types")
-async def get_document_types(db: Session = Depends(get_db)) -> List[Dict[str, Any]]:
+@router.get("/document-types", response_model=List[Dict[str, Any]])
+async def get_document_types(request: Request, db: Session = Depends(get_db)):
     """
     Get all active document types
 
-    Returns list of Colombian document types for dropdown population
+    Returns list of Colombian document types for dropdown population,
+    served from precompressed in-memory copies
     """
-    document_types = db.query(DocumentType).filter(DocumentType.is_active == True).all()
-
-    return [
-        {
-            "id": dt.id,
-            "code": dt.code,
-            "name": dt.name,
-            "description": dt.description
-        }
-        for dt in document_types
-    ]
\ No newline at end of file
+    document_types = SQLAlchemyDocumentTypeRepository(db).get_all_active()
+    return precompressed_json_response(
+        request,
+        "document_types:active",
+        dumps(document_types),
+        f"public, max-age={settings.CATALOG_CACHE_MAX_AGE_SECONDS}"
+    )
\ No newline at end of file
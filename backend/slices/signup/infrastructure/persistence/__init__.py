@@ -3,5 +3,6 @@ Persistence implementations for signup domain
 """
 from .user_repository import SQLAlchemyUserRepository
 from .patient_repository import SQLAlchemyPatientRepository
+from .document_type_repository import SQLAlchemyDocumentTypeRepository
 
-__all__ = ["SQLAlchemyUserRepository", "SQLAlchemyPatientRepository"]
\ No newline at end of file
+__all__ = ["SQLAlchemyUserRepository", "SQLAlchemyPatientRepository", "SQLAlchemyDocumentTypeRepository"]
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""
+Document type catalog repository
+"""
+from typing import Any, Dict, List
+from sqlalchemy.orm import Session
+
+from shared.cache import cached
+from slices.signup.domain.models.document_type_model import DocumentType
+
+
+class SQLAlchemyDocumentTypeRepository:
+    """Read access to the seeded document type catalog"""
+
+    # Seeded catalog with no write path in the API; only a reseed changes it
+    CACHE_TTL_SECONDS = 3600
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    @cached("document_types:active", ttl=CACHE_TTL_SECONDS)
+    def get_all_active(self) -> List[Dict[str, Any]]:
+        """Get all active document types as dropdown entries"""
+        document_types = self.db_session.query(DocumentType).filter(DocumentType.is_active == True).all()
+
+        return [
+            {
+                "id": dt.id,
+                "code": dt.code,
+                "name": dt.name,
+                "description": dt.description
+            }
+            for dt in document_types
+        ]
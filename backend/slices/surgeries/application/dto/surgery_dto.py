@@ -5,6 +5,8 @@ from datetime import datetime, date
 from typing import Optional
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
+from shared.utils.batch import BatchRequestDTO
+
 
 class CreateSurgeryDTO(BaseModel):
     """DTO for creating a new surgery"""
@@ -30,6 +32,15 @@ class UpdateSurgeryDTO(BaseModel):
     complications: Optional[str] = Field(None, description="Any complications that occurred")
 
 
+class SurgeryBatchUpdateDTO(UpdateSurgeryDTO):
+    """Update item of a surgery batch: the record id plus the fields to change"""
+    id: int
+
+
+class SurgeryBatchDTO(BatchRequestDTO[CreateSurgeryDTO, SurgeryBatchUpdateDTO]):
+    """DTO for creating, updating and deleting surgeries in one request"""
+
+
 class PatientSurgeryDTO(BaseModel):
     """DTO for surgery response with UUID string serialization"""
     id: int
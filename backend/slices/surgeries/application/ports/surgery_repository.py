@@ -2,10 +2,12 @@
 Surgery repository port interface
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from slices.surgeries.domain.models.surgery_model import PatientSurgery
+from shared.database.batch_writes import BatchWrite, BatchWriteResult
+from shared.utils.pagination import KeysetPage
 
 
 class SurgeryRepositoryPort(ABC):
@@ -16,6 +18,22 @@ class SurgeryRepositoryPort(ABC):
         """Get all surgeries for a specific patient"""
         pass
 
+    @abstractmethod
+    async def get_surgeries_page_by_patient_id(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> KeysetPage:
+        """Get one keyset page of surgeries for a specific patient"""
+        pass
+
+    @abstractmethod
+    async def get_version_stamp(self, patient_id: UUID) -> Tuple:
+        """Version stamp of a patient's surgeries: changes on every create, update or delete"""
+        pass
+
     @abstractmethod
     async def get_surgery_by_id(self, surgery_id: int, patient_id: UUID) -> Optional[PatientSurgery]:
         """Get a specific surgery by ID with patient ownership verification"""
@@ -34,4 +52,9 @@ class SurgeryRepositoryPort(ABC):
     @abstractmethod
     async def delete_surgery(self, surgery_id: int, patient_id: UUID) -> bool:
         """Delete a surgery record with patient ownership verification"""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def apply_batch(self, patient_id: UUID, batch: BatchWrite) -> BatchWriteResult[PatientSurgery]:
+        """Apply creates, updates and deletes of a patient's surgeries in one transaction"""
+        pass
@@ -1,7 +1,7 @@
 """
 Use cases for managing patient surgeries
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from slices.surgeries.application.ports.surgery_repository import SurgeryRepositoryPort
@@ -9,8 +9,11 @@ from slices.surgeries.domain.models.surgery_model import PatientSurgery
 from slices.surgeries.application.dto.surgery_dto import (
     PatientSurgeryDTO,
     CreateSurgeryDTO,
-    UpdateSurgeryDTO
+    UpdateSurgeryDTO,
+    SurgeryBatchDTO
 )
+from shared.utils.batch import BatchResultDTO, build_batch_result
+from shared.utils.pagination import CursorPageDTO, parse_fields
 
 
 class ManageSurgeriesUseCase:
@@ -24,6 +27,27 @@ class ManageSurgeriesUseCase:
         surgeries = await self.surgery_repository.get_surgeries_by_patient_id(patient_id)
         return [PatientSurgeryDTO.model_validate(surgery) for surgery in surgeries]
 
+    async def get_patient_surgeries_page(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> CursorPageDTO:
+        """Get one page of surgeries for a patient, optionally limited to the requested fields"""
+        selected_fields = parse_fields(fields, PatientSurgeryDTO.model_fields)
+        page = await self.surgery_repository.get_surgeries_page_by_patient_id(
+            patient_id, limit, cursor, selected_fields
+        )
+        items = page.items if selected_fields else [
+            PatientSurgeryDTO.model_validate(surgery) for surgery in page.items
+        ]
+        return CursorPageDTO(items=items, next_cursor=page.next_cursor, limit=limit)
+
+    async def get_surgeries_version(self, patient_id: UUID) -> Tuple:
+        """Version stamp of a patient's surgeries, for conditional GET"""
+        return await self.surgery_repository.get_version_stamp(patient_id)
+
     async def get_surgery_by_id(self, surgery_id: int, patient_id: UUID) -> Optional[PatientSurgeryDTO]:
         """Get a specific surgery by ID"""
         surgery = await self.surgery_repository.get_surgery_by_id(surgery_id, patient_id)
@@ -50,4 +74,9 @@ class ManageSurgeriesUseCase:
 
     async def delete_surgery(self, surgery_id: int, patient_id: UUID) -> bool:
         """Delete a surgery record"""
-        return await self.surgery_repository.delete_surgery(surgery_id, patient_id)
\ No newline at end of file
+        return await self.surgery_repository.delete_surgery(surgery_id, patient_id)
+
+    async def apply_surgery_batch(self, batch_data: SurgeryBatchDTO, patient_id: UUID) -> BatchResultDTO[PatientSurgeryDTO]:
+        """Create, update and delete surgeries in one transaction, with a result per item"""
+        result = await self.surgery_repository.apply_batch(patient_id, batch_data.to_batch_write())
+        return build_batch_result(batch_data, result, PatientSurgeryDTO)
@@ -2,10 +2,11 @@
 Patient Surgery domain model
 """
 from datetime import datetime, date
-from sqlalchemy import Column, String, Text, Date, DateTime, BigInteger, Integer, ForeignKey, func
+from sqlalchemy import Column, String, Text, Date, DateTime, BigInteger, Integer, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
+from shared.database.change_tracking import change_seq_column, track_deletes
 from shared.database.database import Base
 
 
@@ -26,9 +27,21 @@ class PatientSurgery(Base):
     complications = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    change_seq = change_seq_column()
+
+    # Composite indexes matching the patient-scoped access paths
+    __table_args__ = (
+        Index("ix_patient_surgeries_patient_id_created_at", patient_id, created_at.desc(), id.desc()),
+        Index("ix_patient_surgeries_patient_id_surgery_date", patient_id, surgery_date.desc()),
+        # Delta sync: a patient's rows changed after a given sequence value
+        Index("ix_patient_surgeries_patient_id_change_seq", patient_id, change_seq),
+    )
 
     # Relationship
     patient = relationship("Patient", backref="surgeries")
 
     def __repr__(self):
-        return f"<PatientSurgery(id={self.id}, procedure='{self.procedure_name}', date={self.surgery_date})>"
\ No newline at end of file
+        return f"<PatientSurgery(id={self.id}, procedure='{self.procedure_name}', date={self.surgery_date})>"
+
+
+track_deletes(PatientSurgery, "surgeries")
@@ -1,21 +1,25 @@
 """
 Surgeries API endpoints with authentication
 """
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Query
 from sqlalchemy.orm import Session
 
 from shared.database.database import get_db
-from slices.auth.infrastructure.api.auth_endpoints import get_current_user
-from slices.signup.domain.models.user_model import User
-from slices.signup.domain.models.patient_model import Patient
+from shared.exceptions.application_exceptions import ValidationException
+from shared.utils.etag import not_modified, version_etag
+from shared.utils.batch import BatchResultDTO
+from shared.utils.pagination import CursorPageDTO, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from slices.auth.infrastructure.api.auth_endpoints import get_current_patient
+from slices.auth.application.use_cases import AuthenticatedPrincipal
 
 from slices.surgeries.application.use_cases.manage_surgeries import ManageSurgeriesUseCase
 from slices.surgeries.infrastructure.repositories.surgery_repository import SurgeryRepository
 from slices.surgeries.application.dto.surgery_dto import (
     PatientSurgeryDTO,
     CreateSurgeryDTO,
-    UpdateSurgeryDTO
+    UpdateSurgeryDTO,
+    SurgeryBatchDTO
 )
 
 router = APIRouter(prefix="/api/surgeries", tags=["Surgeries"])
@@ -27,49 +31,54 @@ def get_surgery_use_case(db: Session = Depends(get_db)) -> ManageSurgeriesUseCas
     return ManageSurgeriesUseCase(surgery_repository)
 
 
-async def get_patient_from_user(user: User, db: Session) -> Patient:
-    """Get patient record from authenticated user"""
-    patient = db.query(Patient).filter(Patient.user_id == user.id).first()
-    if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient record not found"
-        )
-    return patient
-
-
-@router.get("/", response_model=List[PatientSurgeryDTO])
+@router.get("/", response_model=Union[List[PatientSurgeryDTO], CursorPageDTO])
 async def get_surgeries(
-    current_user: User = Depends(get_current_user),
-    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size, enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, enables cursor pagination"),
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case)
 ):
-    """Get all surgeries for authenticated patient"""
-    if current_user.user_type != "patient":
+    """
+    Get surgeries for authenticated patient
+
+    Without limit, cursor or fields the full list is returned as before.
+    Otherwise a cursor page is returned with next_cursor for the following page.
+    Answers 304 Not Modified when If-None-Match matches the current ETag.
+    """
+    patient = principal.patient
+
+    # Checked before any DTO is built; the query string selects the representation
+    stamp = await surgery_use_case.get_surgeries_version(patient.id)
+    etag = version_etag("surgeries", patient.id, request.url.query, *stamp)
+    cached = not_modified(request, response, etag)
+    if cached:
+        return cached
+
+    if limit is None and cursor is None and fields is None:
+        return await surgery_use_case.get_patient_surgeries(patient.id)
+
+    try:
+        return await surgery_use_case.get_patient_surgeries_page(
+            patient.id, limit or DEFAULT_PAGE_SIZE, cursor, fields
+        )
+    except ValidationException as e:
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access surgery data"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
 
-    patient = await get_patient_from_user(current_user, db)
-    return await surgery_use_case.get_patient_surgeries(patient.id)
-
 
 @router.get("/{surgery_id}", response_model=PatientSurgeryDTO)
 async def get_surgery(
     surgery_id: int,
-    current_user: User = Depends(get_current_user),
-    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case)
 ):
     """Get a specific surgery by ID"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can access surgery data"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     surgery = await surgery_use_case.get_surgery_by_id(surgery_id, patient.id)
 
     if not surgery:
@@ -84,37 +93,39 @@ async def get_surgery(
 @router.post("/", response_model=PatientSurgeryDTO, status_code=status.HTTP_201_CREATED)
 async def create_surgery(
     surgery_data: CreateSurgeryDTO,
-    current_user: User = Depends(get_current_user),
-    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case)
 ):
     """Create a new surgery record"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can create surgery records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     return await surgery_use_case.create_surgery(surgery_data, patient.id)
 
 
+@router.post("/batch", response_model=BatchResultDTO[PatientSurgeryDTO])
+async def apply_surgery_batch(
+    batch_data: SurgeryBatchDTO,
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case)
+):
+    """
+    Create, update and delete surgeries in one request and one transaction
+
+    Returns a result per item. Updates and deletes of ids the patient does
+    not have get a 404 item; the rest of the batch is still applied.
+    """
+    patient = principal.patient
+    return await surgery_use_case.apply_surgery_batch(batch_data, patient.id)
+
+
 @router.put("/{surgery_id}", response_model=PatientSurgeryDTO)
 async def update_surgery(
     surgery_id: int,
     surgery_data: UpdateSurgeryDTO,
-    current_user: User = Depends(get_current_user),
-    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case)
 ):
     """Update an existing surgery record"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can update surgery records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     updated_surgery = await surgery_use_case.update_surgery(surgery_id, surgery_data, patient.id)
 
     if not updated_surgery:
@@ -129,18 +140,11 @@ async def update_surgery(
 @router.delete("/{surgery_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_surgery(
     surgery_id: int,
-    current_user: User = Depends(get_current_user),
-    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case),
-    db: Session = Depends(get_db)
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    surgery_use_case: ManageSurgeriesUseCase = Depends(get_surgery_use_case)
 ):
     """Delete a surgery record"""
-    if current_user.user_type != "patient":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only patients can delete surgery records"
-        )
-
-    patient = await get_patient_from_user(current_user, db)
+    patient = principal.patient
     success = await surgery_use_case.delete_surgery(surgery_id, patient.id)
 
     if not success:
@@ -1,7 +1,7 @@
 """
 SQLAlchemy implementation of surgery repository
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, desc
@@ -9,6 +9,10 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from slices.surgeries.application.ports.surgery_repository import SurgeryRepositoryPort
 from slices.surgeries.domain.models.surgery_model import PatientSurgery
+from shared.events import CREATED, DELETED, UPDATED, SurgeryChanged, record_event
+from shared.database.batch_writes import BatchWrite, BatchWriteResult, apply_batch_write
+from shared.database.version_stamps import collection_stamp, read_version_stamp
+from shared.utils.pagination import KeysetPage, paginate_keyset
 
 
 class SurgeryRepository(SurgeryRepositoryPort):
@@ -26,6 +30,31 @@ class SurgeryRepository(SurgeryRepositoryPort):
         except SQLAlchemyError as e:
             raise Exception(f"Database error getting surgeries: {str(e)}")
 
+    async def get_surgeries_page_by_patient_id(
+        self,
+        patient_id: UUID,
+        limit: int,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None
+    ) -> KeysetPage:
+        """Get one keyset page of surgeries for a specific patient"""
+        try:
+            query = self.db.query(PatientSurgery).filter(
+                PatientSurgery.patient_id == patient_id
+            )
+            return paginate_keyset(query, PatientSurgery, limit, cursor, fields)
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting surgeries: {str(e)}")
+
+    async def get_version_stamp(self, patient_id: UUID) -> Tuple:
+        """Count and newest updated_at of a patient's surgeries"""
+        try:
+            return read_version_stamp(
+                self.db, collection_stamp(PatientSurgery, PatientSurgery.patient_id == patient_id)
+            )
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting surgeries version: {str(e)}")
+
     async def get_surgery_by_id(self, surgery_id: int, patient_id: UUID) -> Optional[PatientSurgery]:
         """Get a specific surgery by ID with patient ownership verification"""
         try:
@@ -42,6 +71,10 @@ class SurgeryRepository(SurgeryRepositoryPort):
         """Create a new surgery record"""
         try:
             self.db.add(surgery)
+            self.db.flush()
+            record_event(self.db, SurgeryChanged(
+                patient_id=surgery.patient_id, record_id=surgery.id, change=CREATED, label=surgery.procedure_name
+            ))
             self.db.commit()
             self.db.refresh(surgery)
             return surgery
@@ -66,6 +99,9 @@ class SurgeryRepository(SurgeryRepositoryPort):
                 if hasattr(surgery, key):
                     setattr(surgery, key, value)
 
+            record_event(self.db, SurgeryChanged(
+                patient_id=surgery.patient_id, record_id=surgery.id, change=UPDATED, label=surgery.procedure_name
+            ))
             self.db.commit()
             self.db.refresh(surgery)
             return surgery
@@ -86,9 +122,20 @@ class SurgeryRepository(SurgeryRepositoryPort):
             if not surgery:
                 return False
 
+            record_event(self.db, SurgeryChanged(
+                patient_id=surgery.patient_id, record_id=surgery.id, change=DELETED, label=surgery.procedure_name
+            ))
             self.db.delete(surgery)
             self.db.commit()
             return True
         except SQLAlchemyError as e:
             self.db.rollback()
-            raise Exception(f"Database error deleting surgery: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Database error deleting surgery: {str(e)}")
+
+    async def apply_batch(self, patient_id: UUID, batch: BatchWrite) -> BatchWriteResult[PatientSurgery]:
+        """Apply creates, updates and deletes of a patient's surgeries in one transaction"""
+        try:
+            return apply_batch_write(self.db, PatientSurgery, patient_id, batch, SurgeryChanged, "procedure_name")
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise Exception(f"Database error applying surgery batch: {str(e)}")
@@ -0,0 +1,4 @@
+"""
+Sync Slice
+Delta sync for mobile clients: what changed in a patient's records since a token
+"""
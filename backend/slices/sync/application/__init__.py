@@ -0,0 +1,3 @@
+"""
+Application layer for sync
+"""
@@ -0,0 +1,3 @@
+"""
+DTOs for sync
+"""
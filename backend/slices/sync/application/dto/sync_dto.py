@@ -0,0 +1,37 @@
+"""
+Sync DTOs for API responses
+"""
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+from slices.allergies.application.dto.allergy_dto import PatientAllergyDTO
+from slices.illnesses.application.dto.illness_dto import PatientIllnessDTO
+from slices.medications.application.dto.medication_dto import PatientMedicationDTO
+from slices.profile.application.dto.profile_completion_dto import ExtendedPatientProfileDTO
+from slices.surgeries.application.dto.surgery_dto import PatientSurgeryDTO
+
+T = TypeVar("T")
+
+
+class ResourceChangesDTO(BaseModel, Generic[T]):
+    """Records created or updated since the token, and ids of records deleted"""
+    upserted: List[T] = []
+    deleted: List[int] = []
+
+
+class SyncResponseDTO(BaseModel):
+    """
+    Changes since the `since` token
+
+    When full is true the lists hold every record and the client replaces
+    its copy; otherwise it applies upserted and deleted on top of it. profile
+    is null when the extended profile did not change.
+    """
+    token: str
+    full: bool
+    medications: ResourceChangesDTO[PatientMedicationDTO]
+    allergies: ResourceChangesDTO[PatientAllergyDTO]
+    surgeries: ResourceChangesDTO[PatientSurgeryDTO]
+    illnesses: ResourceChangesDTO[PatientIllnessDTO]
+    profile: Optional[ExtendedPatientProfileDTO] = None
@@ -0,0 +1,3 @@
+"""
+Ports for sync application layer
+"""
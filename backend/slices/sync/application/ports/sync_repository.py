@@ -0,0 +1,45 @@
+"""
+Sync repository port interface
+"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+
+class SyncRepositoryPort(ABC):
+    """Port interface for reading a patient's changes since a sync token"""
+
+    @abstractmethod
+    async def get_database_time(self) -> datetime:
+        """Current database time (start of the read transaction)"""
+        pass
+
+    @abstractmethod
+    async def get_changed_records(
+        self,
+        resource_type: str,
+        patient_id: UUID,
+        since_seq: Optional[int] = None,
+        updated_after: Optional[datetime] = None
+    ) -> List:
+        """
+        Rows of a resource type with change_seq above since_seq or updated at
+        or after updated_after; every row of the patient when since_seq is None
+        """
+        pass
+
+    @abstractmethod
+    async def get_deleted_records(
+        self,
+        patient_id: UUID,
+        since_seq: int,
+        deleted_after: datetime
+    ) -> List[Tuple[str, int, Optional[int]]]:
+        """Tombstones as (resource_type, resource_id, change_seq), selected like get_changed_records"""
+        pass
+
+    @abstractmethod
+    async def get_profile_change(self, patient_id: UUID) -> Tuple[Optional[int], Optional[datetime]]:
+        """(change_seq, updated_at) of the patient row"""
+        pass
@@ -0,0 +1,8 @@
+"""
+Use cases for sync application layer
+"""
+from .get_sync_changes import GetSyncChangesUseCase
+
+__all__ = [
+    "GetSyncChangesUseCase",
+]
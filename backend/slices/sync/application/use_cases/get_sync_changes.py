@@ -0,0 +1,127 @@
+"""
+Get sync changes use case
+Returns what changed in a patient's medical records and extended profile
+since a sync token, so clients refresh in proportion to changes
+"""
+from datetime import timedelta
+from typing import Optional
+
+from slices.allergies.application.dto.allergy_dto import PatientAllergyDTO
+from slices.illnesses.application.dto.illness_dto import PatientIllnessDTO
+from slices.medications.application.dto.medication_dto import PatientMedicationDTO
+from slices.profile.application.use_cases.complete_profile_use_case import CompleteProfileUseCase
+from slices.signup.domain.models.patient_model import Patient
+from slices.signup.domain.models.user_model import User
+from slices.surgeries.application.dto.surgery_dto import PatientSurgeryDTO
+from slices.sync.application.dto.sync_dto import ResourceChangesDTO, SyncResponseDTO
+from slices.sync.application.ports.sync_repository import SyncRepositoryPort
+from slices.sync.domain.entities.sync_changes import SYNC_RESOURCES, ResourceChanges, SyncChanges, SyncToken
+
+# Response DTO per resource type
+RESOURCE_DTOS = {
+    "medications": PatientMedicationDTO,
+    "allergies": PatientAllergyDTO,
+    "surgeries": PatientSurgeryDTO,
+    "illnesses": PatientIllnessDTO,
+}
+
+
+class GetSyncChangesUseCase:
+    """Use case for the delta sync feed of one patient"""
+
+    def __init__(
+        self,
+        sync_repository: SyncRepositoryPort,
+        profile_use_case: CompleteProfileUseCase,
+        commit_grace_seconds: int,
+        tombstone_retention_days: int
+    ):
+        """
+        Args:
+            sync_repository: Reads change sequences and tombstones
+            profile_use_case: Builds the extended profile when it changed
+            commit_grace_seconds: Rows updated this long before the previous
+                sync are sent again. Sequence values are taken before commit,
+                so a write that committed after that sync can carry a value
+                below its token
+            tombstone_retention_days: Tokens older than this get a full
+                snapshot, since the tombstones they need may be purged
+        """
+        self.sync_repository = sync_repository
+        self.profile_use_case = profile_use_case
+        self.commit_grace = timedelta(seconds=commit_grace_seconds)
+        self.tombstone_retention = timedelta(days=tombstone_retention_days)
+
+    async def execute(self, user: User, patient: Patient, since: Optional[str] = None) -> SyncResponseDTO:
+        """
+        Changes since a token returned by a previous sync
+
+        Args:
+            user: Authenticated user
+            patient: The user's patient record
+            since: Token from the previous response; None for a full snapshot
+
+        Returns:
+            SyncResponseDTO with the next token
+
+        Raises:
+            ValidationException: If the token is malformed
+        """
+        changes = await self.get_changes(user, patient, SyncToken.decode(since) if since else None)
+
+        return SyncResponseDTO(
+            token=changes.token.encode(),
+            full=changes.full,
+            profile=changes.profile,
+            **{
+                resource_type: ResourceChangesDTO(
+                    upserted=[
+                        RESOURCE_DTOS[resource_type].model_validate(record, from_attributes=True)
+                        for record in resource_changes.upserted
+                    ],
+                    deleted=resource_changes.deleted,
+                )
+                for resource_type, resource_changes in changes.resources.items()
+            },
+        )
+
+    async def get_changes(self, user: User, patient: Patient, since: Optional[SyncToken]) -> SyncChanges:
+        """Collect changed records, tombstones and the profile since a token"""
+        synced_at = await self.sync_repository.get_database_time()
+        if since is not None and since.synced_at < synced_at - self.tombstone_retention:
+            since = None
+
+        since_seq = since.change_seq if since is not None else None
+        changed_after = since.synced_at - self.commit_grace if since is not None else None
+        high_water = since_seq or 0
+
+        resources = {}
+        for resource_type in SYNC_RESOURCES:
+            records = await self.sync_repository.get_changed_records(
+                resource_type, patient.id, since_seq, changed_after
+            )
+            resources[resource_type] = ResourceChanges(upserted=records)
+            high_water = max([high_water] + [record.change_seq or 0 for record in records])
+
+        if since is not None:
+            deleted = await self.sync_repository.get_deleted_records(patient.id, since_seq, changed_after)
+            for resource_type, resource_id, change_seq in deleted:
+                resources[resource_type].deleted.append(resource_id)
+                high_water = max(high_water, change_seq or 0)
+
+        profile = None
+        profile_seq, profile_updated_at = await self.sync_repository.get_profile_change(patient.id)
+        if (
+            since is None
+            or (profile_seq or 0) > since_seq
+            or (profile_updated_at is not None and profile_updated_at >= changed_after)
+        ):
+            profile = self.profile_use_case.get_extended_profile(user.id)
+        high_water = max(high_water, profile_seq or 0)
+
+        return SyncChanges(
+            token=SyncToken(change_seq=high_water, synced_at=synced_at),
+            full=since is None,
+            resources=resources,
+            profile=profile,
+        )
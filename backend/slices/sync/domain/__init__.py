@@ -0,0 +1,3 @@
+"""
+Domain layer for sync
+"""
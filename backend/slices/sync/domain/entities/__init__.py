@@ -0,0 +1,3 @@
+"""
+Domain entities for sync
+"""
@@ -0,0 +1,64 @@
+"""
+Sync domain entities
+"""
+import base64
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from shared.exceptions.application_exceptions import ValidationException
+
+# Resource types in response order; also the resource_type of their tombstones
+SYNC_RESOURCES = ("medications", "allergies", "surgeries", "illnesses")
+
+
+@dataclass(frozen=True)
+class SyncToken:
+    """
+    Position of a client in the change stream
+
+    change_seq is the highest change sequence value the client has received;
+    synced_at is the database time its sync read started.
+    """
+    change_seq: int
+    synced_at: datetime
+
+    def encode(self) -> str:
+        """Opaque token handed to the client"""
+        raw = f"{self.change_seq}|{self.synced_at.isoformat()}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncToken":
+        """
+        Decode a token returned by a previous sync
+
+        Raises:
+            ValidationException: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            change_seq, synced_at = base64.urlsafe_b64decode(padded).decode("utf-8").split("|", 1)
+            decoded = cls(change_seq=int(change_seq), synced_at=datetime.fromisoformat(synced_at))
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValidationException(f"Invalid sync token: {token}") from e
+
+        if decoded.synced_at.tzinfo is None:
+            raise ValidationException(f"Invalid sync token: {token}")
+        return decoded
+
+
+@dataclass
+class ResourceChanges:
+    """Rows of one resource type created or updated, and ids deleted"""
+    upserted: List[Any] = field(default_factory=list)
+    deleted: List[int] = field(default_factory=list)
+
+
+@dataclass
+class SyncChanges:
+    """Everything that changed for a patient since a token"""
+    token: SyncToken
+    full: bool
+    resources: Dict[str, ResourceChanges]
+    profile: Optional[Any] = None
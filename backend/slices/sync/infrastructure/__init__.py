@@ -0,0 +1,3 @@
+"""
+Infrastructure layer for sync
+"""
@@ -0,0 +1,3 @@
+"""
+API routes for sync infrastructure layer
+"""
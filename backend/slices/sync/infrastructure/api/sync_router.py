@@ -0,0 +1,56 @@
+"""
+Delta sync API endpoint
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from shared.config.settings import settings
+from shared.database.database import get_db
+from shared.exceptions.application_exceptions import ValidationException
+from shared.utils.json_response import trusted_response
+from slices.auth.infrastructure.api.auth_endpoints import get_current_patient
+from slices.auth.application.use_cases import AuthenticatedPrincipal
+from slices.profile.application.use_cases.complete_profile_use_case import CompleteProfileUseCase
+
+from slices.sync.application.dto.sync_dto import SyncResponseDTO
+from slices.sync.application.use_cases import GetSyncChangesUseCase
+from slices.sync.infrastructure.repositories.sync_repository import SyncRepository
+
+router = APIRouter(prefix="/api/sync", tags=["Sync"])
+
+
+def get_sync_use_case(db: Session = Depends(get_db)) -> GetSyncChangesUseCase:
+    """Dependency to get sync use case (primary database: a lagging replica could skip changes)"""
+    return GetSyncChangesUseCase(
+        SyncRepository(db),
+        CompleteProfileUseCase(db),
+        commit_grace_seconds=settings.SYNC_COMMIT_GRACE_SECONDS,
+        tombstone_retention_days=settings.SYNC_TOMBSTONE_RETENTION_DAYS,
+    )
+
+
+@router.get("", response_model=SyncResponseDTO)
+async def get_sync_changes(
+    response: Response,
+    since: Optional[str] = Query(None, description="token from the previous sync; omit for a full snapshot"),
+    principal: AuthenticatedPrincipal = Depends(get_current_patient),
+    sync_use_case: GetSyncChangesUseCase = Depends(get_sync_use_case)
+):
+    """
+    Get medications, allergies, surgeries, illnesses and extended profile
+    changes since the previous sync
+
+    Without since, or with a token older than the tombstone retention, every
+    record is returned with full=true. Store the returned token and send it
+    as since next time.
+    """
+    try:
+        changes = await sync_use_case.execute(principal.user, principal.patient, since)
+    except ValidationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return trusted_response(changes, response)
@@ -0,0 +1,14 @@
+"""
+Delta sync background jobs (run by shared.scheduler)
+"""
+from shared.database import SessionLocal
+from shared.database.change_tracking import purge_tombstones
+
+
+def purge_tombstones_job(older_than_days: int = 90) -> int:
+    """Delete sync tombstones past the retention window"""
+    db = SessionLocal()
+    try:
+        return purge_tombstones(db, older_than_days)
+    finally:
+        db.close()
@@ -0,0 +1,3 @@
+"""
+Repositories for sync infrastructure layer
+"""
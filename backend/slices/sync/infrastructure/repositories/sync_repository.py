@@ -0,0 +1,90 @@
+"""
+Sync repository implementation
+Reads change_seq and tombstones of the tracked medical tables
+"""
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from shared.database.change_tracking import SyncTombstone
+from slices.allergies.domain.models.allergy_model import PatientAllergy
+from slices.illnesses.domain.models.illness_model import PatientIllness
+from slices.medications.domain.models.medication_model import PatientMedication
+from slices.signup.domain.models.patient_model import Patient
+from slices.surgeries.domain.models.surgery_model import PatientSurgery
+from slices.sync.application.ports.sync_repository import SyncRepositoryPort
+
+# Model per resource type (the resource_type their deletes are tracked under)
+SYNC_MODELS = {
+    "medications": PatientMedication,
+    "allergies": PatientAllergy,
+    "surgeries": PatientSurgery,
+    "illnesses": PatientIllness,
+}
+
+
+class SyncRepository(SyncRepositoryPort):
+    """SQLAlchemy implementation of sync repository"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def get_database_time(self) -> datetime:
+        """Current database time (start of the read transaction)"""
+        try:
+            return self.db.execute(select(func.now())).scalar_one()
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting database time: {str(e)}")
+
+    async def get_changed_records(
+        self,
+        resource_type: str,
+        patient_id: UUID,
+        since_seq: Optional[int] = None,
+        updated_after: Optional[datetime] = None
+    ) -> List:
+        """Changed rows of one resource type, in change order (patient_id, change_seq index)"""
+        model = SYNC_MODELS[resource_type]
+        try:
+            query = self.db.query(model).filter(model.patient_id == patient_id)
+            if since_seq is not None:
+                query = query.filter(or_(model.change_seq > since_seq, model.updated_at >= updated_after))
+            return query.order_by(model.change_seq).all()
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting changed {resource_type}: {str(e)}")
+
+    async def get_deleted_records(
+        self,
+        patient_id: UUID,
+        since_seq: int,
+        deleted_after: datetime
+    ) -> List[Tuple[str, int, Optional[int]]]:
+        """Tombstones of a patient since a sync token"""
+        try:
+            return [
+                tuple(row) for row in self.db.execute(
+                    select(SyncTombstone.resource_type, SyncTombstone.resource_id, SyncTombstone.change_seq)
+                    .where(
+                        SyncTombstone.patient_id == patient_id,
+                        or_(SyncTombstone.change_seq > since_seq, SyncTombstone.deleted_at >= deleted_after),
+                    )
+                    .order_by(SyncTombstone.change_seq)
+                )
+            ]
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting deleted records: {str(e)}")
+
+    async def get_profile_change(self, patient_id: UUID) -> Tuple[Optional[int], Optional[datetime]]:
+        """(change_seq, updated_at) of the patient row"""
+        try:
+            row = self.db.execute(
+                select(Patient.change_seq, Patient.updated_at).where(Patient.id == patient_id)
+            ).first()
+            return tuple(row) if row is not None else (None, None)
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting profile change: {str(e)}")